@@ -0,0 +1,76 @@
+"""Compares reading the same Robot Framework result from output.xml and output.json.
+
+Usage::
+
+    python benchmarks/fetch_result_formats.py path/to/output.xml
+
+The JSON result is created from the XML result with rebot, so both contain the same run.
+"""
+
+import argparse
+import gc
+import io
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from robot import rebot
+from robot.api import ExecutionResult
+from robot.result import ResultVisitor
+
+from testbench2robotframework.robot_result_reader import (
+    read_robot_result,
+    visit_json_result_by_suite,
+)
+
+
+def measure(name: str, function, repeat: int) -> None:
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"| {name} | {min(durations):.3f} s | {peak_memory / 1024 / 1024:.1f} MB |")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output_xml", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tempdir:
+        output_json = Path(tempdir, "output.json")
+        rebot(
+            str(arguments.output_xml),
+            output=str(output_json),
+            log="NONE",
+            report="NONE",
+            stdout=io.StringIO(),
+        )
+        print(
+            f"XML: {arguments.output_xml.stat().st_size / 1024 / 1024:.1f} MB, "
+            f"JSON: {output_json.stat().st_size / 1024 / 1024:.1f} MB\n"
+        )
+        print("| Reader | Time | Peak memory |")
+        print("|--------|------|-------------|")
+        measure("XML", lambda: read_robot_result(arguments.output_xml), arguments.repeat)
+        measure(
+            "JSON (Robot Framework)", lambda: ExecutionResult(str(output_json)), arguments.repeat
+        )
+        measure("JSON", lambda: read_robot_result(output_json), arguments.repeat)
+        measure(
+            "JSON (stream)",
+            lambda: visit_json_result_by_suite(output_json, ResultVisitor()),
+            arguments.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Measures the time needed to import the CLI and the modules of each command.
+
+Usage::
+
+    python benchmarks/import_time.py --budget 0.15
+
+Every import runs in a new Python process with ``-X importtime`` that imports the package
+from this repository. The cumulative import time of the top level modules is the median of
+``repeat`` runs; the runs of all imports are interleaved, so changes in the load of the
+machine affect every import alike. The command exits with 1 if importing the CLI takes
+longer than ``budget`` seconds.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORTS = {
+    "CLI (--help, --version)": "import testbench2robotframework.cli",
+    "generate-tests": "import testbench2robotframework.cli, testbench2robotframework.testbench2rf, "
+    "testbench2robotframework.testsuite_write",
+    "fetch-results": "import testbench2robotframework.cli, "
+    "testbench2robotframework.robotframework2testbench",
+    "run": "import testbench2robotframework.cli, testbench2robotframework.run",
+}
+
+
+def measure_import(code: str) -> float:
+    python_path = [str(ROOT), os.environ.get("PYTHONPATH", "")]
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, python_path))},
+    )
+    microseconds = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit() and not module.startswith("  "):
+            microseconds += int(cumulative)
+    return microseconds / 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.15)
+    arguments = parser.parse_args()
+    measurements = {name: [] for name in IMPORTS}
+    for _ in range(arguments.repeat):
+        for name, code in IMPORTS.items():
+            measurements[name].append(measure_import(code))
+    durations = {name: statistics.median(times) for name, times in measurements.items()}
+    print("| Import | Time |")
+    print("|--------|------|")
+    for name, duration in durations.items():
+        print(f"| {name} | {duration:.3f} s |")
+    cli_duration = durations["CLI (--help, --version)"]
+    if cli_duration > arguments.budget:
+        sys.exit(
+            f"Importing the CLI takes {cli_duration:.3f} s, the budget is {arguments.budget} s."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Runs the generate and fetch-results benchmarks and compares them with stored baselines.
+
+Usage::
+
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --profile large --update-baselines
+
+A synthetic TestBench report of the selected profile and a synthetic Robot Framework result
+of its generated test suites are written to a temporary directory, so no network access,
+real report or test execution is needed. Every stage is measured ``repeat`` times
+and the fastest run is compared with the baseline in ``baselines.json``. The command
+exits with 1 if a stage is slower than its baseline by more than ``threshold``.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from robot.version import get_version
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_output import OutputShape, write_output
+from synthetic_report import ReportShape, write_report
+
+from testbench2robotframework.config import Configuration
+from testbench2robotframework.json_reader import TestBenchJsonReader
+from testbench2robotframework.log import setup_logger
+from testbench2robotframework.robot_result_reader import read_robot_results
+from testbench2robotframework.robotframework2testbench import robot2testbench
+from testbench2robotframework.testbench2rf import create_test_suites
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework,
+)
+from testbench2robotframework.testsuite_write import write_test_suites
+from testbench2robotframework.utils import PathResolver
+
+BASELINES_FILE = Path(__file__).parent / "baselines.json"
+DEFAULT_THRESHOLD = 0.25
+PROFILES = {
+    "small": (
+        ReportShape(themes=2, depth=2, sets=10, test_cases=25, compound_depth=1, phases=2),
+        OutputShape(fail_ratio=0.1, messages=2, attachment_ratio=0.05),
+    ),
+    "large": (
+        ReportShape(themes=4, depth=3, sets=25, test_cases=50, compound_depth=1, phases=2),
+        OutputShape(fail_ratio=0.1, messages=2, attachment_ratio=0.05),
+    ),
+}
+QUIET_LOGGING = {
+    "console-logging": {"logLevel": "WARNING"},
+    "file-logging": {"logLevel": "WARNING"},
+}
+
+
+class Benchmark:
+    def __init__(self, work_dir: Path, report_shape: ReportShape, output_shape: OutputShape):
+        self.work_dir = work_dir
+        self.report = work_dir / "report"
+        self.generated = work_dir / "Generated"
+        self.output_xml = work_dir / "output" / "output.xml"
+        self.output_shape = output_shape
+        write_report(self.report, report_shape)
+        self.config = {**QUIET_LOGGING, "output-directory": str(self.generated)}
+        self.configuration = Configuration.from_dict(self.config)
+        setup_logger(self.configuration)
+
+    def stages(self) -> dict[str, Callable[[], object]]:
+        return {
+            "generate: read report": self.read_report,
+            "generate: resolve paths": self.resolve_paths,
+            "generate: build suites": self.build_suites,
+            "generate: write suites": self.write_suites,
+            "generate: end to end": lambda: testbench2robotframework(str(self.report), self.config),
+            "fetch: read results": lambda: read_robot_results([self.output_xml]),
+            "fetch: end to end": lambda: self.fetch({}),
+            "fetch: protocol only": lambda: self.fetch({"protocol-only": True}),
+        }
+
+    def prepare(self) -> None:
+        """Generates the test suites and a synthetic result of them for fetch."""
+        testbench2robotframework(str(self.report), self.config)
+        write_output(self.report, self.generated, self.output_xml, self.output_shape)
+
+    def read_report(self):
+        reader = TestBenchJsonReader(self.report)
+        return reader.test_theme_tree, reader.get_test_case_set_catalog()
+
+    def resolve_paths(self, report=None):
+        test_theme_tree, catalog = report or self._report
+        return PathResolver(test_theme_tree, tuple(catalog), self.configuration.log_suite_numbering)
+
+    def build_suites(self):
+        _, catalog = self._report
+        return create_test_suites(catalog, self._path_resolver, self.configuration)
+
+    def write_suites(self):
+        write_test_suites(self._test_suites, self.configuration)
+
+    def fetch(self, config: dict):
+        robot2testbench(
+            str(self.report),
+            str(self.output_xml),
+            str(self.work_dir / "result"),
+            {**QUIET_LOGGING, **config},
+        )
+
+    def prepare_stages(self) -> None:
+        self._report = self.read_report()
+        self._path_resolver = self.resolve_paths(self._report)
+        self._test_suites = self.build_suites()
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def load_baselines() -> dict:
+    if not BASELINES_FILE.exists():
+        return {}
+    return json.loads(BASELINES_FILE.read_text(encoding="utf-8"))
+
+
+def save_baselines(baselines: dict) -> None:
+    BASELINES_FILE.write_text(f"{json.dumps(baselines, indent=2)}\n", encoding="utf-8")
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> bool:
+    print("| Stage | Time | Baseline | Change |")
+    print("|-------|------|----------|--------|")
+    regressions = []
+    for stage, duration in results.items():
+        expected = baseline.get(stage)
+        if expected is None:
+            print(f"| {stage} | {duration:.3f} s | - | - |")
+            continue
+        change = duration / expected - 1
+        marker = ""
+        if change > threshold:
+            regressions.append(stage)
+            marker = " REGRESSION"
+        print(f"| {stage} | {duration:.3f} s | {expected:.3f} s | {change:+.0%}{marker} |")
+    if regressions:
+        print(
+            f"\n{len(regressions)} stages are more than {threshold:.0%} "
+            "slower than the baseline."
+        )
+    return not regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--profile", choices=PROFILES, default="small")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--stage", action="append", help="Runs only the stages containing this text."
+    )
+    parser.add_argument("--update-baselines", action="store_true")
+    arguments = parser.parse_args()
+    report_shape, output_shape = PROFILES[arguments.profile]
+    print(
+        f"Profile '{arguments.profile}': {report_shape.test_case_count} test cases, "
+        f"Python {platform.python_version()}, Robot Framework {get_version()}"
+    )
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cwd = Path.cwd()
+        os.chdir(temp_dir)
+        try:
+            benchmark = Benchmark(Path(temp_dir), report_shape, output_shape)
+            benchmark.prepare()
+            benchmark.prepare_stages()
+            for stage, function in benchmark.stages().items():
+                if arguments.stage and not any(text in stage for text in arguments.stage):
+                    continue
+                results[stage] = measure(function, arguments.repeat)
+        finally:
+            os.chdir(cwd)
+    baselines = load_baselines()
+    if arguments.update_baselines:
+        baselines[arguments.profile] = {
+            stage: round(duration, 4) for stage, duration in results.items()
+        }
+        save_baselines(baselines)
+        print(f"Updated the baselines of profile '{arguments.profile}'.")
+    if not compare(results, baselines.get(arguments.profile, {}), arguments.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Compares the Robot Framework startup time for generated .robot files and a JSON suite.
+
+Usage::
+
+    python benchmarks/suite_formats.py path/to/testbench_report
+
+Both formats are generated from the same report. The startup time is the time
+Robot Framework needs to build the executable suite before the first test runs.
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from robot.running import TestSuiteBuilder
+
+from testbench2robotframework.testbench2robotframework import testbench2robotframework
+
+
+def measure(name: str, source: Path, repeat: int) -> None:
+    durations = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        suite = TestSuiteBuilder().build(source)
+        durations.append(time.perf_counter() - start)
+    print(f"| {name} | {suite.test_count} | {min(durations):.3f} s |")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("testbench_report", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    testbench_report = arguments.testbench_report.resolve()
+    with tempfile.TemporaryDirectory() as tempdir:
+        os.chdir(tempdir)
+        for output_format in ("ROBOT", "JSON"):
+            testbench2robotframework(
+                testbench_report,
+                {
+                    "output-directory": str(Path(tempdir, "Generated")),
+                    "output-format": output_format,
+                    "clean": False,
+                    "console-logging": {"logLevel": "WARNING"},
+                    "file-logging": {"logLevel": "WARNING"},
+                },
+            )
+        print("| Format | Tests | Startup time |")
+        print("|--------|-------|--------------|")
+        measure(".robot files", Path(tempdir, "Generated"), arguments.repeat)
+        measure("JSON suite (.rbt)", Path(tempdir, "Generated.rbt"), arguments.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Writes a synthetic Robot Framework result for the test suites generated from a report.
+
+Usage::
+
+    python benchmarks/synthetic_output.py path/to/report path/to/Generated output.xml
+
+The result is built from the generated test suites without executing them, so it has the
+same suite metadata, test names, test phases, keywords and ``GROUP`` blocks that
+fetch-results expects. ``fail-ratio`` of the tests fail in their last keyword, every keyword
+logs ``messages`` messages of ``message-length`` characters and ``attachment-ratio`` of the
+tests reference a file with an ``itb-reference:`` marker in their test message.
+The result is written as JSON if the output file ends with ``.json``.
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from robot.result import Result, TestCase, TestSuite
+from robot.running import Keyword as RunningKeyword
+from robot.running import TestSuiteBuilder
+from robot.version import get_full_version
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_report import is_selected
+
+from testbench2robotframework.config import Configuration
+from testbench2robotframework.json_reader import TestBenchJsonReader
+from testbench2robotframework.result_writer import get_test_chain
+
+try:
+    from robot.running import Group as RunningGroup
+except ImportError:
+    RunningGroup = None
+
+ATTACHMENT_DIRECTORY = "attachments"
+KEYWORD_DURATION = timedelta(milliseconds=5)
+START_TIME = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+@dataclass
+class OutputShape:
+    fail_ratio: float = 0.0
+    messages: int = 1
+    message_length: int = 80
+    attachment_ratio: float = 0.0
+
+
+class SyntheticResultBuilder:
+    def __init__(self, shape: OutputShape, output_directory: Path):
+        self.shape = shape
+        self.output_directory = output_directory
+        # Robot Framework writes local times without a UTC offset.
+        self.time = START_TIME.replace(tzinfo=None)
+        self.test_index = 0
+
+    def build(self, running_suite) -> TestSuite:
+        suite = TestSuite(
+            name=running_suite.name,
+            doc=running_suite.doc,
+            metadata=running_suite.metadata,
+            source=running_suite.source,
+            start_time=self.time,
+        )
+        for child in running_suite.suites:
+            suite.suites.append(self.build(child))
+        for running_test in running_suite.tests:
+            suite.tests.append(self.build_test(running_test))
+        suite.end_time = self.time
+        return suite
+
+    def build_test(self, running_test) -> TestCase:
+        failed = is_selected(self.test_index, self.shape.fail_ratio)
+        attached = is_selected(self.test_index, self.shape.attachment_ratio)
+        self.test_index += 1
+        test = TestCase(
+            name=running_test.name,
+            tags=running_test.tags,
+            status="FAIL" if failed else "PASS",
+            start_time=self.time,
+        )
+        if running_test.has_setup:
+            self.build_keyword(running_test.setup, test.setup, False)
+        failure = self.build_body(running_test.body, test.body, failed)
+        if running_test.has_teardown:
+            self.build_keyword(running_test.teardown, test.teardown, False)
+        messages = [failure] if failure else []
+        if attached:
+            messages.append(f"itb-reference: {self.write_attachment(test.name)}")
+        test.message = "\n".join(messages)
+        test.end_time = self.time
+        return test
+
+    def build_body(self, running_body, result_body, failed: bool) -> str:
+        """Adds the keywords and groups of a running body and returns the failure message."""
+        items = [
+            item
+            for item in running_body
+            if isinstance(item, RunningKeyword)
+            or (RunningGroup and isinstance(item, RunningGroup))
+        ]
+        failure = ""
+        for index, item in enumerate(items):
+            fail_item = failed and index == len(items) - 1
+            if isinstance(item, RunningKeyword):
+                failure = self.build_keyword(item, result_body.create_keyword(), fail_item)
+                continue
+            group = result_body.create_group(
+                name=item.name, status="FAIL" if fail_item else "PASS", start_time=self.time
+            )
+            failure = self.build_body(item.body, group.body, fail_item)
+            group.message = failure
+            group.end_time = self.time
+        return failure
+
+    def build_keyword(self, running_keyword, keyword, failed: bool) -> str:
+        owner, _, name = running_keyword.name.rpartition(".")
+        keyword.config(
+            name=name,
+            owner=owner or None,
+            args=running_keyword.args,
+            status="FAIL" if failed else "PASS",
+            start_time=self.time,
+        )
+        for index in range(1, self.shape.messages + 1):
+            text = f"{name} message {index}: "
+            keyword.body.create_message(
+                text.ljust(self.shape.message_length, "x"), "INFO", self.time
+            )
+        if failed:
+            keyword.message = f"Synthetic failure of '{name}'."
+            keyword.body.create_message(keyword.message, "FAIL", self.time)
+        self.time += KEYWORD_DURATION
+        keyword.end_time = self.time
+        return keyword.message
+
+    def write_attachment(self, test_name: str) -> str:
+        attachment_directory = self.output_directory / ATTACHMENT_DIRECTORY
+        attachment_directory.mkdir(parents=True, exist_ok=True)
+        file_name = f"{test_name.replace(' ', '_').replace(':', '').replace('/', '_')}.txt"
+        (attachment_directory / file_name).write_text(f"Attachment of {test_name}\n")
+        return f"{ATTACHMENT_DIRECTORY}/{file_name}"
+
+
+def write_output(
+    report: Path, generated_suites: Path, output: Path, shape: OutputShape
+) -> TestSuite:
+    """Writes a result of the suites generated from ``report`` to ``output``."""
+    running_suite = TestSuiteBuilder().build(generated_suites)
+    builder = SyntheticResultBuilder(shape, output.parent)
+    suite = builder.build(running_suite)
+    check_test_uids(report, suite)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    result = Result(
+        source=output,
+        suite=suite,
+        generator=f"Robot {get_full_version()}",
+        generation_time=builder.time,
+    )
+    result.save(output)
+    return suite
+
+
+def check_test_uids(report: Path, suite: TestSuite) -> None:
+    json_reader = TestBenchJsonReader(report)
+    phase_pattern = Configuration.from_dict({}).phasePattern
+    for test in suite.all_tests:
+        test_chain = get_test_chain(test.name, phase_pattern)
+        test_uid = test_chain.name if test_chain else test.name
+        if json_reader.read_test_case_execution_key(test_uid) is None:
+            raise ValueError(f"Test '{test.name}' has no test case in the report '{report}'.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("report", type=Path)
+    parser.add_argument("generated_suites", type=Path)
+    parser.add_argument("output", type=Path)
+    defaults = OutputShape()
+    parser.add_argument("--fail-ratio", type=float, default=defaults.fail_ratio)
+    parser.add_argument("--messages", type=int, default=defaults.messages)
+    parser.add_argument("--message-length", type=int, default=defaults.message_length)
+    parser.add_argument("--attachment-ratio", type=float, default=defaults.attachment_ratio)
+    arguments = parser.parse_args()
+    shape = OutputShape(
+        fail_ratio=arguments.fail_ratio,
+        messages=arguments.messages,
+        message_length=arguments.message_length,
+        attachment_ratio=arguments.attachment_ratio,
+    )
+    suite = write_output(arguments.report, arguments.generated_suites, arguments.output, shape)
+    print(f"Wrote {suite.test_count} tests to '{arguments.output}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+"""Writes a synthetic TestBench JSON report for benchmarks.
+
+Usage::
+
+    python benchmarks/synthetic_report.py path/to/report --themes 4 --sets 10 --test-cases 25
+
+The report contains ``themes`` test themes, each nested ``depth`` levels deep, with
+``sets`` test case sets in the innermost theme and ``test-cases`` test cases per set.
+Every test case calls ``steps`` BuiltIn keywords with ``parameters`` arguments each,
+optionally wrapped in ``compound-depth`` nested compound keywords and split into
+``phases`` test phases. The generated test suites can be executed by Robot Framework
+as long as ``phases`` is 1.
+"""
+
+import argparse
+import itertools
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+LIBRARY_PATH = "RF.BuiltIn"
+SPLIT_KEYWORD = "StopWithRestart"
+
+
+@dataclass
+class ReportShape:
+    themes: int = 2
+    depth: int = 1
+    sets: int = 5
+    test_cases: int = 10
+    steps: int = 5
+    parameters: int = 2
+    compound_depth: int = 0
+    phases: int = 1
+    fail_ratio: float = 0.0
+
+    @property
+    def test_case_count(self) -> int:
+        return self.themes * self.sets * self.test_cases
+
+
+@dataclass
+class NodeBase:
+    key: str
+    numbering: str
+    parent_key: str
+    name: str
+    uid: str
+
+
+@dataclass
+class KeywordCallShape:
+    sequence_id: str
+    numbering: str
+    keyword_key: Optional[str]
+    parameters: list[tuple[str, str]] = field(default_factory=list)
+    parent_id: Optional[str] = None
+    compound_name: Optional[str] = None
+
+
+KEYWORDS = {
+    "log-many": "Log Many",
+    "should-be-true": "Should Be True",
+    "split": SPLIT_KEYWORD,
+}
+
+
+def write_report(directory: Path, shape: ReportShape) -> None:
+    """Writes the JSON files of a report with the given shape to ``directory``."""
+    if shape.phases > max(shape.steps, 1):
+        raise ValueError("A test case needs at least one step per phase.")
+    directory.mkdir(parents=True, exist_ok=True)
+    keys = (str(key) for key in itertools.count(1))
+    root = create_node("RootNode", NodeBase("0", "", "", "Root", "ROOT"))
+    nodes = []
+    test_case_index = 0
+    for theme in range(1, shape.themes + 1):
+        parent_key, numbering = root["base"]["key"], str(theme)
+        for level in range(shape.depth):
+            if level:
+                numbering = f"{numbering}.1"
+            theme_node = create_node(
+                "TestThemeNode",
+                NodeBase(
+                    next(keys), numbering, parent_key, f"Theme {numbering}", f"TT-{numbering}"
+                ),
+                create_node_execution(next(keys)),
+            )
+            nodes.append(theme_node)
+            parent_key = theme_node["base"]["key"]
+        for test_case_set in range(1, shape.sets + 1):
+            tcs_numbering = f"{numbering}.{test_case_set}"
+            tcs_uid = f"TCS-{tcs_numbering}"
+            tcs_node = create_node(
+                "TestCaseSetNode",
+                NodeBase(next(keys), tcs_numbering, parent_key, f"Set {tcs_numbering}", tcs_uid),
+                create_node_execution(next(keys)),
+            )
+            nodes.append(tcs_node)
+            test_cases = []
+            for test_case in range(1, shape.test_cases + 1):
+                tc_uid = f"{tcs_uid}-TC-{test_case}"
+                execution_key = next(keys)
+                failed = is_selected(test_case_index, shape.fail_ratio)
+                test_case_index += 1
+                test_cases.append(create_test_case_summary(tc_uid, test_case, execution_key))
+                write_json(
+                    directory / f"{tc_uid}.json",
+                    create_test_case(tc_uid, execution_key, shape, failed),
+                )
+            write_json(
+                directory / f"{tcs_uid}.json",
+                create_test_case_set(tcs_node, test_cases),
+            )
+    write_json(directory / "cycle_structure.json", {"root": root, "nodes": nodes})
+    write_json(directory / "project.json", {})
+    write_json(directory / "references.json", [])
+
+
+def is_selected(index: int, ratio: float) -> bool:
+    """Returns whether the item at ``index`` is one of the evenly spread ``ratio`` of items."""
+    return int((index + 1) * ratio) > int(index * ratio)
+
+
+def write_json(path: Path, data) -> None:
+    with path.open("w", encoding="utf-8") as json_file:
+        json.dump(data, json_file, indent=2)
+
+
+def create_node(element_type: str, base: NodeBase, execution=None) -> dict:
+    node = {
+        "elementType": element_type,
+        "base": {
+            "key": base.key,
+            "numbering": base.numbering,
+            "path": "",
+            "parentKey": base.parent_key,
+            "name": base.name,
+            "uniqueID": base.uid,
+            "matchesFilter": True,
+        },
+    }
+    if element_type != "TestCaseSetNode":
+        node["filters"] = []
+    if execution is not None:
+        node["exec"] = execution
+    return node
+
+
+def create_node_execution(key: str) -> dict:
+    return {"status": "Planned", "execStatus": "NotBlocked", "verdict": "Undefined", "key": key}
+
+
+def create_user() -> dict:
+    return {"key": "1", "name": "tester"}
+
+
+def create_test_case_set(tcs_node: dict, test_cases: list[dict]) -> dict:
+    base = tcs_node["base"]
+    return {
+        "key": base["key"],
+        "numbering": base["numbering"],
+        "path": "",
+        "uniqueID": base["uniqueID"],
+        "name": base["name"],
+        "spec": {
+            "key": base["key"],
+            "description": "",
+            "reviewComment": "",
+            "status": "Released",
+            "priority": "High",
+            "preConditions": [],
+            "postConditions": [],
+            "udfs": [],
+            "tags": [],
+            "references": [],
+            "requirements": [],
+        },
+        "testCases": test_cases,
+        "testSequence": [],
+        "parameters": [],
+        "keywords": [],
+        "exec": {"key": tcs_node["exec"]["key"], "comments": "", "udfs": [], "tags": []},
+    }
+
+
+def create_test_case_summary(tc_uid: str, index: int, execution_key: str) -> dict:
+    return {
+        "uniqueID": tc_uid,
+        "index": index,
+        "spec": {"key": execution_key, "comments": "", "requirements": []},
+        "exec": {
+            "key": execution_key,
+            "status": "Planned",
+            "execStatus": "NotBlocked",
+            "verdict": "Undefined",
+            "defects": [],
+            "comments": "",
+        },
+    }
+
+
+def create_test_case(tc_uid: str, execution_key: str, shape: ReportShape, failed: bool) -> dict:
+    return {
+        "uniqueID": tc_uid,
+        "spec": {"key": execution_key, "comments": "", "udfs": [], "tags": [], "requirements": []},
+        "testSequence": list(create_test_sequence(tc_uid, shape, failed)),
+        "parameters": [],
+        "keywords": [
+            create_keyword_details(key, name) for key, name in KEYWORDS.items()
+        ],
+        "exec": {
+            "key": execution_key,
+            "status": "Planned",
+            "execStatus": "NotBlocked",
+            "verdict": "Undefined",
+            "plannedDuration": 10,
+            "actualDuration": 0,
+            "currentUser": create_user(),
+            "comments": "",
+            "defects": [],
+            "udfs": [],
+            "tags": [],
+            "references": [],
+        },
+    }
+
+
+def create_test_sequence(tc_uid: str, shape: ReportShape, failed: bool) -> Iterator[dict]:
+    sequence_ids = (str(sequence_id) for sequence_id in itertools.count(1))
+    top_level_numbers = (str(number) for number in itertools.count(1))
+    phase_starts = [phase * shape.steps // shape.phases for phase in range(shape.phases)]
+    step = 0
+    for phase, phase_start in enumerate(phase_starts):
+        phase_end = phase_starts[phase + 1] if phase + 1 < shape.phases else shape.steps
+        if phase:
+            yield create_keyword_call(
+                KeywordCallShape(next(sequence_ids), next(top_level_numbers), "split")
+            )
+        parent_id, parent_numbering = None, None
+        for _ in range(shape.compound_depth):
+            compound_id = next(sequence_ids)
+            numbering = (
+                f"{parent_numbering}.1" if parent_numbering else next(top_level_numbers)
+            )
+            yield create_keyword_call(
+                KeywordCallShape(
+                    compound_id,
+                    numbering,
+                    None,
+                    parent_id=parent_id,
+                    compound_name=f"Compound {numbering}",
+                )
+            )
+            parent_id, parent_numbering = compound_id, numbering
+        for index in range(phase_end - phase_start):
+            step += 1
+            numbering = (
+                f"{parent_numbering}.{index + 1}" if parent_numbering else next(top_level_numbers)
+            )
+            if step == shape.steps:
+                keyword_key = "should-be-true"
+                parameters = [("condition", "False" if failed else "True")]
+            else:
+                keyword_key = "log-many"
+                parameters = [
+                    (f"message{parameter}", f"{tc_uid} step {step} value {parameter}")
+                    for parameter in range(1, shape.parameters + 1)
+                ]
+            yield create_keyword_call(
+                KeywordCallShape(next(sequence_ids), numbering, keyword_key, parameters, parent_id)
+            )
+
+
+def create_keyword_call(call: KeywordCallShape) -> dict:
+    sequence_id = call.sequence_id
+    return {
+        "sequenceID": sequence_id,
+        "numbering": call.numbering,
+        "parentID": call.parent_id,
+        "spec": {
+            "key": sequence_id,
+            "name": call.compound_name or KEYWORDS[call.keyword_key],
+            "sequencePhase": "TestStep",
+            "callType": "Flow",
+            "comments": "",
+            "callParameters": [
+                {
+                    "definitionType": "AtomicInstance",
+                    "key": f"{sequence_id}-{index}",
+                    "name": name,
+                    "evaluationType": "CallByValue",
+                    "value": value,
+                }
+                for index, (name, value) in enumerate(call.parameters)
+            ],
+            "keywordType": "Compound" if call.compound_name else "Atomic",
+            "keywordKey": call.keyword_key or f"compound-{sequence_id}",
+        },
+        "exec": {
+            "verdict": "Undefined",
+            "duration": 0,
+            "currentUser": create_user(),
+            "comments": "",
+            "references": [],
+            "defects": [],
+        },
+    }
+
+
+def create_keyword_details(key: str, name: str) -> dict:
+    return {
+        "key": key,
+        "name": name,
+        "uniqueID": f"KW-{key}",
+        "status": "Released",
+        "defaultCallType": "Flow",
+        "description": "",
+        "path": LIBRARY_PATH,
+        "parameters": [],
+        "preConditions": [],
+        "postConditions": [],
+        "references": [],
+    }
+
+
+def add_shape_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = ReportShape()
+    parser.add_argument("--themes", type=int, default=defaults.themes)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument("--sets", type=int, default=defaults.sets)
+    parser.add_argument("--test-cases", type=int, default=defaults.test_cases)
+    parser.add_argument("--steps", type=int, default=defaults.steps)
+    parser.add_argument("--parameters", type=int, default=defaults.parameters)
+    parser.add_argument("--compound-depth", type=int, default=defaults.compound_depth)
+    parser.add_argument("--phases", type=int, default=defaults.phases)
+    parser.add_argument("--fail-ratio", type=float, default=defaults.fail_ratio)
+
+
+def get_shape(arguments: argparse.Namespace) -> ReportShape:
+    return ReportShape(
+        themes=arguments.themes,
+        depth=arguments.depth,
+        sets=arguments.sets,
+        test_cases=arguments.test_cases,
+        steps=arguments.steps,
+        parameters=arguments.parameters,
+        compound_depth=arguments.compound_depth,
+        phases=arguments.phases,
+        fail_ratio=arguments.fail_ratio,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("report", type=Path)
+    add_shape_arguments(parser)
+    arguments = parser.parse_args()
+    shape = get_shape(arguments)
+    write_report(arguments.report, shape)
+    print(f"Wrote {shape.test_case_count} test cases to '{arguments.report}'.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Measures the timestamp formatting of fetch-results for a result with a million keywords.
+
+Usage::
+
+    python benchmarks/timestamp_formatting.py --keywords 1000000
+
+For every keyword, fetch-results writes the UTC end time to the TestBench report and
+the local start time, end time and message times to its execution comment. The legacy
+implementation resolved the local UTC offset and used strptime/strftime for each of them.
+"""
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from testbench2robotframework.timestamps import (
+    UtcTimestampFormatter,
+    format_local_time,
+    format_local_timestamp,
+)
+
+
+def legacy_isotime(timestamp, time_format="%Y-%m-%d %H:%M:%S.%f"):
+    try:
+        return timestamp.astimezone().strftime(time_format)[:-3]
+    except AttributeError:
+        return (
+            datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
+            .astimezone()
+            .strftime(time_format)[:-3]
+        )
+
+
+def legacy_utc_time(end_time):
+    end_time = end_time.replace(
+        tzinfo=timezone(datetime.now(timezone.utc).astimezone().utcoffset())
+    )
+    return f"{end_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z"
+
+
+def format_legacy(start_time: datetime, end_time: datetime) -> tuple:
+    return (
+        legacy_utc_time(end_time),
+        legacy_isotime(start_time.strftime("%Y%m%d %H:%M:%S.%f")[:-3]),
+        legacy_isotime(end_time.strftime("%Y%m%d %H:%M:%S.%f")[:-3]),
+        legacy_isotime(end_time, time_format="%H:%M:%S.%f"),
+    )
+
+
+def create_formatter():
+    utc_formatter = UtcTimestampFormatter()
+
+    def format_fast(start_time: datetime, end_time: datetime) -> tuple:
+        return (
+            utc_formatter.format(end_time),
+            format_local_timestamp(start_time),
+            format_local_timestamp(end_time),
+            format_local_time(end_time),
+        )
+
+    return format_fast
+
+
+def measure(name: str, format_keyword, keyword_times: list) -> list:
+    start = time.perf_counter()
+    formatted = [format_keyword(start_time, end_time) for start_time, end_time in keyword_times]
+    print(f"| {name} | {time.perf_counter() - start:.2f} s |")
+    return formatted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keywords", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+    # Robot Framework timestamps are local times without a time zone.
+    first_start = datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc).replace(tzinfo=None)
+    keyword_times = [
+        (
+            first_start + timedelta(milliseconds=index * 7),
+            first_start + timedelta(milliseconds=index * 7 + 5),
+        )
+        for index in range(arguments.keywords)
+    ]
+    print(f"{arguments.keywords} keywords")
+    print("| Implementation | Time |")
+    print("|----------------|------|")
+    legacy = measure("strptime/strftime", format_legacy, keyword_times)
+    fast = measure("TimestampFormatter", create_formatter(), keyword_times)
+    if legacy != fast:
+        raise SystemExit("The formatted timestamps differ.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from .config import DEFAULT_SERVER_CACHE_SIZE
+from .jobs import GENERATE_JOB, init_worker, run_job
+from .log import logger
+
+
+@dataclass
+class BatchJob:
+    report: Path
+    config: Optional[Path] = None
+    output: Optional[Path] = None
+    options: dict = field(default_factory=dict)
+
+    @property
+    def config_key(self) -> tuple[str, str]:
+        return str(self.config or ""), json.dumps(self.options, sort_keys=True, default=str)
+
+    def to_job(self) -> dict:
+        options = dict(self.options)
+        if self.output:
+            options["output-directory"] = self.output.as_posix()
+        job = {"report": str(self.report), "options": options}
+        if self.config:
+            job["config"] = str(self.config)
+        return job
+
+
+@dataclass
+class BatchResult:
+    job: BatchJob
+    duration: float
+    error: Optional[str] = None
+    report_cached: bool = False
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "report": str(self.job.report),
+            "config": str(self.job.config) if self.job.config else None,
+            "output": str(self.job.output) if self.job.output else None,
+            "status": "FAIL" if self.failed else "PASS",
+            "duration": self.duration,
+            "reportCached": self.report_cached,
+            "error": self.error,
+        }
+
+
+def read_manifest(manifest: Path) -> list[BatchJob]:
+    """Reads the jobs of a JSON manifest.
+
+    The manifest is a list of jobs or an object with a ``jobs`` list. Every job has a
+    ``report`` and optionally a ``config`` file, an ``output`` directory and ``options``
+    overriding the configuration. Relative paths are relative to the manifest.
+    """
+    try:
+        data = json.loads(Path(manifest).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        sys.exit(f"Could not read batch manifest '{manifest}': {error}")
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list):
+        sys.exit(f"Batch manifest '{manifest}' must contain a list of jobs.")
+    base_directory = Path(manifest).parent
+
+    def resolve(path: Optional[str]) -> Optional[Path]:
+        return base_directory / path if path else None
+
+    batch_jobs = []
+    for index, job in enumerate(jobs, start=1):
+        if not isinstance(job, dict) or not job.get("report"):
+            sys.exit(f"Job {index} of batch manifest '{manifest}' has no 'report'.")
+        batch_jobs.append(
+            BatchJob(
+                report=resolve(job["report"]),
+                config=resolve(job.get("config")),
+                output=resolve(job.get("output")),
+                options=job.get("options", {}),
+            )
+        )
+    return batch_jobs
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    workers: Optional[int] = None,
+    cache_size: int = DEFAULT_SERVER_CACHE_SIZE,
+) -> list[BatchResult]:
+    """Generates the test suites of all jobs and returns their results in the order of the jobs.
+
+    Jobs run in a pool of ``workers`` processes that keep the modules, configurations,
+    reports and keyword imports of their former jobs. Jobs with the same configuration
+    are submitted one after another, so they mostly run in workers that already know it.
+    A failing job is reported in its result and does not stop the other jobs.
+    """
+    workers = min(workers or os.cpu_count() or 1, len(jobs) or 1)
+    ordered_jobs = sorted(enumerate(jobs), key=lambda indexed_job: indexed_job[1].config_key)
+    results: list[Optional[BatchResult]] = [None] * len(jobs)
+    if workers == 1:
+        init_worker(cache_size)
+        for index, job in ordered_jobs:
+            results[index] = run_batch_job(job)
+        return results
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(cache_size,)
+    ) as executor:
+        futures = {index: executor.submit(run_batch_job, job) for index, job in ordered_jobs}
+        for index, future in futures.items():
+            results[index] = future.result()
+    return results
+
+
+def run_batch_job(job: BatchJob) -> BatchResult:
+    start = time.perf_counter()
+    try:
+        result = run_job(GENERATE_JOB, job.to_job())
+    except (Exception, SystemExit) as error:
+        logger.error(f"Generating the test suites of '{job.report}' failed: {error}")
+        return BatchResult(job, round(time.perf_counter() - start, 3), get_error_message(error))
+    return BatchResult(job, result["duration"], report_cached=result["reportCached"])
+
+
+def get_error_message(error: BaseException) -> str:
+    return str(error) or type(error).__name__
+
+
+def format_summary(results: list[BatchResult], duration: float) -> str:
+    lines = ["| # | Report | Output | Status | Time | Error |", "|---|---|---|---|---|---|"]
+    for number, result in enumerate(results, start=1):
+        status = "FAIL" if result.failed else "PASS"
+        lines.append(
+            f"| {number} | {result.job.report} | {result.job.output or ''} | {status} "
+            f"| {result.duration:.3f} s | {result.error or ''} |"
+        )
+    failed = sum(result.failed for result in results)
+    lines.append(
+        f"{len(results)} jobs, {len(results) - failed} passed, {failed} failed "
+        f"in {duration:.3f} s (sum of job times {sum(r.duration for r in results):.3f} s)."
+    )
+    return "\n".join(lines)
+
+
+def batch_generate(
+    manifest: Path,
+    workers: Optional[int] = None,
+    cache_size: int = DEFAULT_SERVER_CACHE_SIZE,
+    summary_file: Optional[Path] = None,
+) -> tuple[list[BatchResult], str]:
+    """Generates the test suites of all jobs of a manifest.
+
+    :return: The results of the jobs and their summary as a Markdown table.
+    """
+    start = time.perf_counter()
+    results = run_batch(read_manifest(manifest), workers, cache_size)
+    duration = time.perf_counter() - start
+    if summary_file:
+        Path(summary_file).write_text(
+            json.dumps(
+                {"duration": round(duration, 3), "jobs": [result.to_dict() for result in results]},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+    return results, format_summary(results, duration)
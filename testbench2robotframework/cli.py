@@ -1,11 +1,10 @@
+import sys
 from pathlib import Path
 from typing import Any
 
 import click
-import robot
 
 from testbench2robotframework import __version__
-from testbench2robotframework.robotframework2testbench import robot2testbench
 
 from .config import (
     DEFAULT_GENERATION_DIRECTORY,
@@ -14,23 +13,30 @@ from .config import (
     DEFAULT_RESOURCE_DIRECTORY_REGEX,
     DEFAULT_RESOURCE_REGEX,
     DEFAULT_RESOURCE_ROOTS,
-    find_private_robot_toml,
-    find_pyproject_toml,
-    find_robot_toml,
-    get_testbench2robotframework_toml_dict,
+    DEFAULT_SERVER_CACHE_SIZE,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    SERVER_TOKEN_VARIABLE,
+    get_tb2robot_file_configuration,
 )
-from .json_reader import read_json
-from .testbench2robotframework import testbench2robotframework
 
 TESTBENCH2ROBOTFRAMEWORK_DESCRIPTION = """TestBench2RobotFramework converts a TestBench JSON-report
     to Robot Framework test suites and enhances the TestBench Report
      with the execution results provided by Robot Framework."""
 GENERATE_HELP = """Command to convert a TestBench JSON-report to Robot Framework test suites."""
-FETCH_HELP = """Command to fetch execution results from a Robot Framework result XML and
-to write the results to a TestBench JSON-report."""
+FETCH_HELP = """Command to fetch execution results from one or more Robot Framework result XML
+or JSON files and to write the results to a TestBench JSON-report."""
+RUN_HELP = """Command to run the test suites of a TestBench JSON-report without
+writing test suite files and to write the results to the TestBench JSON-report."""
+SERVE_HELP = """Command to keep TestBench2RobotFramework running and to accept generate
+and fetch jobs over HTTP."""
+HISTORY_HELP = """Command to show the durations and verdicts of a test case or keyword
+in the runs of an execution history written by fetch-results."""
+BATCH_HELP = """Command to convert the TestBench JSON-reports of a manifest to Robot Framework
+test suites in a pool of worker processes."""
 CONFIG_OPTION_HELP = """Path to a configuration file for TestBench2RobotFramework.
     """
-ROBOT_RESULT_HELP = """Path to an XML file containing the robot results."""
+ROBOT_RESULT_HELP = """Path to an XML or JSON file containing the robot results."""
 ROBOT_OUTPUT_HELP = """Path to the directory or ZIP File the TestBench JSON-report
     with result should be saved to."""
 
@@ -48,16 +54,26 @@ def parse_subdivision_mapping(
     return subdivision_mapping
 
 
+def print_version(ctx: click.Context, param: click.Option, value: bool) -> None:
+    if not value or ctx.resilient_parsing:
+        return
+    from robot.version import get_full_version
+
+    click.echo(f"TestBench2RobotFramework {__version__} with Robot Framework {get_full_version()}")
+    ctx.exit()
+
+
+# Commands import their modules when they are invoked, so '--help', '--version' and each
+# command only load the parts of TestBench2RobotFramework and Robot Framework they use.
 @click.group(help=TESTBENCH2ROBOTFRAMEWORK_DESCRIPTION)
-@click.version_option(
-    __version__,
+@click.option(
     "-v",
     "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=print_version,
     help="Writes the TestBench2RobotFramework, Robot Framework and Python version to console.",
-    message=(
-        f"TestBench2RobotFramework {__version__} with "
-        f"Robot Framework {robot.version.get_full_version()}"
-    ),
 )
 @click.help_option("-h", "--help")
 def testbench2robotframework_cli():
@@ -84,6 +100,13 @@ def testbench2robotframework_cli():
     type=click.Path(path_type=Path),
     help="Directory or ZIP archive containing the generated test suites.",
 )
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["ROBOT", "JSON"], case_sensitive=False),
+    help="""Format of the generated test suites. JSON writes all test suites
+    to one Robot Framework JSON suite file (.rbt).""",
+)
 @click.option(
     "--compound-keyword-logging",
     type=click.Choice(["GROUP", "COMMENT", "NONE"], case_sensitive=False),
@@ -156,6 +179,44 @@ def testbench2robotframework_cli():
     help="""Resource import statement to use when a keyword from the
     specified TestBench subdivision is encountered.""",
 )
+@click.option(
+    "--watch",
+    is_flag=True,
+    help="""Keeps running after the generation and regenerates the test suites
+    affected by changed JSON files of the <TestBench Report> directory.""",
+)
+@click.option(
+    "--watch-interval",
+    type=click.FloatRange(min=0.1),
+    default=1.0,
+    show_default=True,
+    help="Seconds between two checks of the report directory for changes.",
+)
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    help="""Distributes the test case sets to this number of shards with similar
+    expected durations, taken from the actual or planned durations in the report.""",
+)
+@click.option(
+    "--shard-format",
+    type=click.Choice(["DIRECTORIES", "PABOT"], case_sensitive=False),
+    help="""DIRECTORIES writes every shard to an own 'Shard_<n>' directory of the
+    output directory. PABOT writes a pabot ordering file with one group per shard.""",
+)
+@click.option(
+    "--pabot-ordering",
+    type=click.Choice(["SUITE", "TEST"], case_sensitive=False),
+    help="""Writes a pabot ordering file starting with the longest suites, or with the
+    longest tests for pabot's --testlevelsplit. Phases of a test case stay in one group.""",
+)
+@click.option(
+    "--durations-from",
+    multiple=True,
+    type=click.Path(path_type=Path),
+    help="""Output XML or JSON of a previous run whose test durations are used
+    for shards and pabot ordering files instead of the durations in the report.""",
+)
 @click.argument("testbench-report", type=click.Path(path_type=Path))
 def generate_tests(  # noqa: PLR0913
     clean: bool,
@@ -168,12 +229,19 @@ def generate_tests(  # noqa: PLR0913
     log_suite_numbering: bool,
     metadata: dict[str, str],
     output_directory: Path,
+    output_format: str,
     resource_directory: Path,
     resource_regex: tuple[str],
     resource_root: tuple[str],
     testbench_report: Path,
     library_mapping: dict[str, str],
     resource_mapping: dict[str, str],
+    watch: bool,
+    watch_interval: float,
+    shards: int,
+    shard_format: str,
+    pabot_ordering: str,
+    durations_from: tuple[Path, ...],
 ):
     """
     Generates Robot Framework Testsuites from a <TestBench Report>.
@@ -192,6 +260,7 @@ def generate_tests(  # noqa: PLR0913
         if output_directory
         else configuration.get("output-directory", DEFAULT_GENERATION_DIRECTORY)
     )
+    configuration["output-format"] = output_format or configuration.get("output-format", "ROBOT")
     configuration["library-mapping"] = library_mapping or configuration.get("library-mapping", {})
     if log_suite_numbering:
         configuration["log-suite-numbering"] = True
@@ -224,34 +293,265 @@ def generate_tests(  # noqa: PLR0913
     configuration["resource-root"] = list(resource_root) or configuration.get(
         "resource-root", DEFAULT_RESOURCE_ROOTS
     )
+    if shards:
+        configuration["shards"] = shards
+    if shard_format:
+        configuration["shard-format"] = shard_format
+    if pabot_ordering:
+        configuration["pabot-ordering"] = pabot_ordering
+    if durations_from:
+        configuration["durations-from"] = [path.as_posix() for path in durations_from]
+    if watch:
+        from .watch import watch_report
+
+        watch_report(testbench_report, configuration, watch_interval)
+        return
+    from .testbench2robotframework import testbench2robotframework
+
     testbench2robotframework(testbench_report, configuration)
 
 
 @testbench2robotframework_cli.command(short_help=FETCH_HELP)
 @click.option("-c", "--config", type=click.Path(path_type=Path), help=CONFIG_OPTION_HELP)
 @click.option("-d", "--output-directory", type=click.Path(path_type=Path), help=ROBOT_OUTPUT_HELP)
-@click.argument("robot-result", type=click.Path(path_type=Path))
+@click.option(
+    "--compact-json",
+    is_flag=True,
+    help="Writes the JSON files of the TestBench report without indentation.",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="""Builds the model of a JSON result one suite at a time
+    and releases the keywords of written tests to reduce the memory usage.
+    The JSON file itself is still loaded completely.""",
+)
+@click.option(
+    "--protocol-only",
+    is_flag=True,
+    help="""Writes only the protocol.json with the test case and test case set results
+    without updating the JSON files of the test cases and test case sets.""",
+)
+@click.option(
+    "--checkpoint",
+    is_flag=True,
+    help="""Records the written tests and test case sets in a checkpoint
+    next to the output, so an interrupted fetch can be resumed.""",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="""Continues an interrupted fetch of the same results from its checkpoint
+    instead of starting from the beginning. Implies --checkpoint.""",
+)
+@click.option(
+    "--history",
+    type=click.Path(path_type=Path),
+    help="""SQLite database the test and keyword durations and verdicts
+    of the fetched results are added to.""",
+)
+@click.option(
+    "--keyword-statistics",
+    type=click.Path(path_type=Path),
+    help="""CSV or JSON file the count, total, median, 95th percentile and maximum duration
+    and the failure rate of every keyword of the fetched results are written to.""",
+)
+@click.argument("robot-result", nargs=-1, required=True, type=click.Path(path_type=Path))
+@click.argument("testbench-report", type=click.Path(path_type=Path))
+def fetch_results(  # noqa: PLR0913
+    config: Path,
+    compact_json: bool,
+    stream: bool,
+    protocol_only: bool,
+    checkpoint: bool,
+    resume: bool,
+    history: Path,
+    keyword_statistics: Path,
+    robot_result: tuple[Path, ...],
+    output_directory: Path,
+    testbench_report: Path,
+):
+    """
+    Fetch Robot Framework execution results from <output XML or JSON>
+    and save to a <TestBench Report>.
+    Several output XMLs or glob patterns of a sharded execution are combined into one result.
+    """
+    from .robotframework2testbench import robot2testbench
+
+    configuration = get_tb2robot_file_configuration(config)
+    if compact_json:
+        configuration["compact-json"] = True
+    if stream:
+        configuration["stream-results"] = True
+    if protocol_only:
+        configuration["protocol-only"] = True
+    if checkpoint:
+        configuration["checkpoint"] = True
+    if resume:
+        configuration["resume"] = True
+    if history:
+        configuration["history-database"] = history.as_posix()
+    if keyword_statistics:
+        configuration["keyword-statistics"] = keyword_statistics.as_posix()
+    robot2testbench(testbench_report, list(robot_result), output_directory, configuration)
+
+
+@testbench2robotframework_cli.command(
+    short_help=RUN_HELP, context_settings={"ignore_unknown_options": True}
+)
+@click.option("-c", "--config", type=click.Path(path_type=Path), help=CONFIG_OPTION_HELP)
+@click.option("-d", "--output-directory", type=click.Path(path_type=Path), help=ROBOT_OUTPUT_HELP)
+@click.option(
+    "--no-fetch",
+    is_flag=True,
+    help="Runs the test suites without writing the results to the TestBench report.",
+)
 @click.argument("testbench-report", type=click.Path(path_type=Path))
-def fetch_results(config: Path, robot_result: Path, output_directory: Path, testbench_report: Path):
+@click.argument("robot-options", nargs=-1, type=click.UNPROCESSED)
+def run(
+    config: Path,
+    output_directory: Path,
+    no_fetch: bool,
+    testbench_report: Path,
+    robot_options: tuple[str, ...],
+):
     """
-    Fetch Robot Framework execution results from <output XML> and save to a <TestBench Report>.
+    Runs the test suites of a <TestBench Report> in memory and writes the results to it.
+    Options after the report, e.g. '--include smoke --outputdir results',
+    are passed to Robot Framework.
     """
+    from robot.run import USAGE as ROBOT_USAGE
+    from robot.utils.argumentparser import ArgumentParser
+
+    from .run import run_tests
+
     configuration = get_tb2robot_file_configuration(config)
-    robot2testbench(testbench_report, robot_result, output_directory, configuration)
+    options, _ = ArgumentParser(ROBOT_USAGE, arg_limits=0).parse_args(list(robot_options))
+    result = run_tests(
+        testbench_report,
+        configuration,
+        output_directory,
+        not no_fetch,
+        **{name: value for name, value in options.items() if value not in (None, [])},
+    )
+    sys.exit(result.return_code if result else 0)
 
 
-def get_tb2robot_file_configuration(config: Path) -> dict:
-    if not config:
-        pyproject_toml = find_pyproject_toml()
-        robot_toml = find_robot_toml()
-        private_robot_toml = find_private_robot_toml()
-        pyproject_config = get_testbench2robotframework_toml_dict(pyproject_toml)
-        robot_config = get_testbench2robotframework_toml_dict(robot_toml)
-        private_robot_config = get_testbench2robotframework_toml_dict(private_robot_toml)
-        return {**pyproject_config, **robot_config, **private_robot_config}
-    config_path = config
-    if not config_path:
-        return {}
-    if config_path.suffix == ".json":
-        return read_json(config, False)
-    return get_testbench2robotframework_toml_dict(config_path)
+@testbench2robotframework_cli.command(short_help=SERVE_HELP)
+@click.option("-c", "--config", type=click.Path(path_type=Path), help=CONFIG_OPTION_HELP)
+@click.option("--host", default=DEFAULT_SERVER_HOST, show_default=True, help="Host to listen on.")
+@click.option(
+    "--port", type=int, default=DEFAULT_SERVER_PORT, show_default=True, help="Port to listen on."
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes running the jobs. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SERVER_CACHE_SIZE,
+    show_default=True,
+    help="Number of reports and configurations every worker keeps in memory.",
+)
+@click.option(
+    "--token",
+    envvar=SERVER_TOKEN_VARIABLE,
+    help=f"""Token requests must send as 'Authorization: Bearer <token>'.
+    Defaults to the environment variable {SERVER_TOKEN_VARIABLE}.""",
+)
+@click.option(
+    "--output-root",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="""Directory jobs may write their output to.
+    Defaults to the working directory of the server.""",
+)
+def serve(  # noqa: PLR0913
+    config: Path,
+    host: str,
+    port: int,
+    workers: int,
+    cache_size: int,
+    token: str,
+    output_root: Path,
+):
+    """
+    Accepts generate and fetch jobs as JSON posted to http://<host>:<port>/generate and /fetch.
+    Workers keep decoded reports and configurations, so repeated jobs of the same files are faster.
+    """
+    from .server import ServerSettings
+    from .server import serve as serve_jobs
+
+    serve_jobs(
+        host,
+        port,
+        ServerSettings(
+            workers=workers,
+            cache_size=cache_size,
+            default_config=str(config) if config else None,
+            token=token,
+            output_root=output_root,
+        ),
+    )
+
+
+@testbench2robotframework_cli.command(short_help=BATCH_HELP)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Number of worker processes running the jobs. Defaults to the number of CPUs.",
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=1),
+    default=DEFAULT_SERVER_CACHE_SIZE,
+    show_default=True,
+    help="Number of reports and configurations every worker keeps in memory.",
+)
+@click.option(
+    "--summary",
+    type=click.Path(path_type=Path),
+    help="Path to a JSON file the durations and errors of all jobs are written to.",
+)
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+def batch(manifest: Path, workers: int, cache_size: int, summary: Path):
+    """
+    Generates Robot Framework test suites for every job of a JSON <MANIFEST>.
+    A job has a 'report' and optionally a 'config' file, an 'output' directory and 'options'.
+    """
+    from .batch import batch_generate
+
+    results, summary_table = batch_generate(manifest, workers, cache_size, summary)
+    click.echo(summary_table)
+    sys.exit(int(any(result.failed for result in results)))
+
+
+@testbench2robotframework_cli.command(short_help=HISTORY_HELP)
+@click.option("--test", "test_uid", help="Unique ID of the test case.")
+@click.option("--keyword", "keyword_path", help="Path of the keyword, e.g. 'RF.BuiltIn.Log'.")
+@click.option(
+    "--limit", type=click.IntRange(min=1), default=20, show_default=True, help="Number of runs."
+)
+@click.argument("database", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+def history(database: Path, test_uid: str, keyword_path: str, limit: int):
+    """
+    Shows the latest runs of a test case or keyword in the execution history <DATABASE>.
+    """
+    from .history import get_keyword_history, get_test_history
+
+    if bool(test_uid) == bool(keyword_path):
+        raise click.UsageError("Use either '--test' or '--keyword'.")
+    rows = (
+        get_test_history(database, test_uid, limit)
+        if test_uid
+        else get_keyword_history(database, keyword_path, limit)
+    )
+    if not rows:
+        click.echo("No runs found.")
+        return
+    click.echo(f"| {' | '.join(rows[0])} |")
+    click.echo(f"|{'---|' * len(rows[0])}")
+    for row in rows:
+        values = ("" if value is None else str(value) for value in row.values())
+        click.echo(f"| {' | '.join(values)} |")
@@ -6,7 +6,7 @@ import json
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final
+from typing import Final, Optional
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -19,6 +19,12 @@ DEFAULT_RESOURCE_REGEX = r"(?:.*\.)?(?P<resourceName>[^.]+?)\s*\[Robot-Resource\
 DEFAULT_RESOURCE_ROOTS: Final[list[str]] = ["RF-Resource"]
 DEFAULT_GENERATION_DIRECTORY = "{root}/Generated"
 DEFAULT_RESOURCE_DIRECTORY_REGEX = r".*\[Robot-Resources\].*"
+DEFAULT_MAX_KEYWORD_MESSAGES = 1000
+DEFAULT_MAX_KEYWORD_MESSAGE_BYTES = 100_000
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_SERVER_CACHE_SIZE = 8
+SERVER_TOKEN_VARIABLE = "TB2ROBOT_SERVER_TOKEN"
 
 class StrEnum(str, Enum):
     def __new__(cls, *args):
@@ -72,6 +78,27 @@ def get_testbench2robotframework_toml_dict(toml_path: Path):
     return toml_dict.get("tool", {}).get("testbench2robotframework", {})
 
 
+def get_tb2robot_file_configuration(config: Optional[Path]) -> dict:
+    if not config:
+        pyproject_toml = find_pyproject_toml()
+        robot_toml = find_robot_toml()
+        private_robot_toml = find_private_robot_toml()
+        pyproject_config = get_testbench2robotframework_toml_dict(pyproject_toml)
+        robot_config = get_testbench2robotframework_toml_dict(robot_toml)
+        private_robot_config = get_testbench2robotframework_toml_dict(private_robot_toml)
+        return {**pyproject_config, **robot_config, **private_robot_config}
+    config_path = Path(config)
+    if config_path.suffix == ".json":
+        try:
+            with config_path.open(encoding="utf-8") as json_file:
+                return json.load(json_file)
+        except FileNotFoundError:
+            sys.exit(f"File '{config_path}' does not exist.")
+        except json.JSONDecodeError:
+            sys.exit(f"File '{config_path}' cannot be decoded.")
+    return get_testbench2robotframework_toml_dict(config_path)
+
+
 @dataclass
 class SubdivisionsMapping:
     libraries: dict
@@ -165,12 +192,53 @@ class LoggingConfig:
         )
 
 
+class MessageLevel(StrEnum):
+    TRACE = "TRACE"
+    DEBUG = "DEBUG"
+    INFO = "INFO"
+    WARN = "WARN"
+    ERROR = "ERROR"
+    FAIL = "FAIL"
+    SKIP = "SKIP"
+    NONE = "NONE"
+
+
+@dataclass
+class KeywordMessageConfig:
+    maxMessages: int
+    maxBytes: int
+    minLevel: MessageLevel
+
+    @classmethod
+    def from_dict(cls, dictionary):
+        return cls(
+            maxMessages=int(dictionary.get("max-messages", DEFAULT_MAX_KEYWORD_MESSAGES)),
+            maxBytes=int(dictionary.get("max-bytes", DEFAULT_MAX_KEYWORD_MESSAGE_BYTES)),
+            minLevel=MessageLevel(dictionary.get("min-level", "TRACE").upper()),
+        )
+
+
 class CompoundKeywordLogging(StrEnum):
     GROUP = "GROUP"
     COMMENT = "COMMENT"
     NONE = "NONE"
 
 
+class OutputFormat(StrEnum):
+    ROBOT = "ROBOT"
+    JSON = "JSON"
+
+
+class ShardFormat(StrEnum):
+    DIRECTORIES = "DIRECTORIES"
+    PABOT = "PABOT"
+
+
+class PabotOrdering(StrEnum):
+    SUITE = "SUITE"
+    TEST = "TEST"
+
+
 class ReferenceBehaviour(StrEnum):
     ATTACHMENT = "ATTACHMENT"
     REFERENCE = "REFERENCE"
@@ -187,22 +255,35 @@ class AttachmentConflictBehaviour(StrEnum):
 @dataclass
 class Configuration:
     attachmentConflictBehaviour: AttachmentConflictBehaviour
+    checkpoint: bool
     clean: bool
+    compact_json: bool
     compound_keyword_logging: CompoundKeywordLogging
+    durations_from: list[str]
     forced_import: ForcedImport
     fully_qualified: bool
+    history_database: Optional[str]
+    keyword_messages: KeywordMessageConfig
+    keyword_statistics: Optional[str]
     library_regex: list[str]
     library_root: list[str]
     log_suite_numbering: bool
     loggingConfiguration: LoggingConfig
     metadata: dict[str, str]
     output_directory: str
+    output_format: OutputFormat
+    pabot_ordering: Optional[PabotOrdering]
     phasePattern: str
+    protocol_only: bool
     referenceBehaviour: ReferenceBehaviour
     resource_directory: str
     resource_directory_regex: str
     resource_regex: list[str]
     resource_root: list[str]
+    resume: bool
+    shard_format: ShardFormat
+    shards: int
+    stream_results: bool
     subdivisionsMapping: SubdivisionsMapping
     testCaseSplitPathRegEx: str
 
@@ -210,6 +291,7 @@ class Configuration:
     def from_dict(cls, dictionary) -> Configuration:
         return cls(
             clean=dictionary.get("clean", True),
+            compact_json=dictionary.get("compact-json", False),
             library_regex=dictionary.get(
                 "library-regex", [DEFAULT_LIBRARY_REGEX]
             ),
@@ -220,9 +302,27 @@ class Configuration:
             ),
             library_root=dictionary.get("library-root", DEFAULT_LIBRARY_ROOTS),
             resource_root=dictionary.get("resource-root", DEFAULT_RESOURCE_ROOTS),
+            protocol_only=dictionary.get("protocol-only", False),
+            checkpoint=dictionary.get("checkpoint", False),
+            resume=dictionary.get("resume", False),
+            shards=dictionary.get("shards", 1),
+            durations_from=dictionary.get("durations-from", []),
+            pabot_ordering=(
+                PabotOrdering(dictionary["pabot-ordering"].upper())
+                if dictionary.get("pabot-ordering")
+                else None
+            ),
+            shard_format=ShardFormat(dictionary.get("shard-format", "DIRECTORIES").upper()),
+            stream_results=dictionary.get("stream-results", False),
             fully_qualified=dictionary.get("fully-qualified", False),
+            history_database=dictionary.get("history-database"),
+            keyword_statistics=dictionary.get("keyword-statistics"),
+            keyword_messages=KeywordMessageConfig.from_dict(
+                dictionary.get("keyword-messages", {})
+            ),
             forced_import=ForcedImport.from_dict(dictionary.get("forced-import", {})),
             output_directory=dictionary.get("output-directory", DEFAULT_GENERATION_DIRECTORY),
+            output_format=OutputFormat(dictionary.get("output-format", "ROBOT").upper()),
             log_suite_numbering=dictionary.get("log-suite-numbering", False),
             loggingConfiguration=LoggingConfig.from_dict(
                 {
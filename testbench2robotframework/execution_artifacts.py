@@ -1,5 +1,5 @@
-import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 from urllib.parse import unquote
@@ -7,26 +7,48 @@ from urllib.parse import unquote
 from .config import AttachmentConflictBehaviour, ReferenceBehaviour
 from .log import logger
 from .model import ReferenceAssignment, ReferenceKind
+from .report_output import ExistingAttachments
+from .utils import copy_file, get_file_hash
 
 FILE_URI_SCHEME = "file://"
 MEGABYTE = 1000 * 1000
+MAX_ATTACHMENT_WORKERS = 8
+STARTING_KEY_NEW_REFERENCES = -3
 
 
 class ExecutionArtifactStorage:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         reference_behaviour: ReferenceBehaviour,
         attachment_conflict_behaviour: AttachmentConflictBehaviour,
         tb_references: list[ReferenceAssignment],
         output_xml: str,
         attachment_folder: str,
+        *,
+        existing_attachments: Optional[ExistingAttachments] = None,
     ):
         self.reference_behaviour = reference_behaviour
         self.attachmentConflictBehaviour = attachment_conflict_behaviour
         self.tb_references: list[ReferenceAssignment] = tb_references
         self.output_xml = output_xml
         self.attachment_folder = attachment_folder
-        self._key: Optional[int] = None
+        self.existing_attachments = existing_attachments or ExistingAttachments()
+        self._min_key = STARTING_KEY_NEW_REFERENCES
+        self._references_by_value: dict[tuple[str, str], ReferenceAssignment] = {}
+        for reference in tb_references:
+            self._index_reference(reference)
+        self._attachments_by_path: dict[str, str] = {}
+        # Attachments of a resumed fetch are already in the attachment folder.
+        attachment_folder_path = Path(attachment_folder)
+        self._reserved_attachments: set[str] = (
+            {path.name for path in attachment_folder_path.iterdir()}
+            if attachment_folder_path.is_dir()
+            else set()
+        )
+        self._pending_copies: dict[str, Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stored_attachments: dict[str, str] = {}
+        self._stored_attachment_hashes: dict[str, str] = {}
 
     def add_artifact(self, artifact: str) -> Optional[str]:
         """
@@ -47,26 +69,26 @@ class ExecutionArtifactStorage:
             return existing_artifact.key
         return self._add_new_reference(artifact_value, self.reference_behaviour)
 
+    def restore_reference(self, reference: ReferenceAssignment) -> None:
+        """Adds a reference created by an earlier, resumed fetch."""
+        self.tb_references.append(reference)
+        self._index_reference(reference)
+
     @property
     def new_key(self) -> int:
-        if self._key is not None:
-            self._key -= 1
-            return self._key
-        if not self.tb_references:
-            self._key = -4
-            return self._key
-        min_key = min([int(ref.key) for ref in self.tb_references])
-        starting_key_new_references = -3
-        self._key = (
-            min_key if min_key < starting_key_new_references else starting_key_new_references
+        self._min_key -= 1
+        return self._min_key
+
+    def _index_reference(self, reference: ReferenceAssignment) -> None:
+        self._references_by_value.setdefault(
+            (reference.value, reference.referenceType.value.lower()), reference
         )
-        self._key -= 1
-        return self._key
+        self._min_key = min(self._min_key, int(reference.key))
 
     def _create_unique_attachment_path(self, attachement_path: Path) -> Path:
         counter = 1
         attachment_stem = attachement_path.stem
-        while attachement_path.exists():
+        while self._attachment_exists(attachement_path):
             attachement_path = Path(
                 f"{attachement_path.parent}",
                 f"{attachment_stem}_{counter}{attachement_path.suffix}",
@@ -74,17 +96,94 @@ class ExecutionArtifactStorage:
             counter += 1
         return attachement_path
 
+    def _attachment_exists(self, attachment_path: Path) -> bool:
+        return (
+            attachment_path.name in self._reserved_attachments
+            or attachment_path.name in self.existing_attachments
+        )
+
+    def _submit_attachment_copy(
+        self, artifact_path: Path, attachment_path: Path, content_hash: str
+    ) -> None:
+        """Stores an attachment as the one with its content and copies it in the pool,
+        so the result visit is not blocked by copying.
+        """
+        filename = attachment_path.name
+        self._reserved_attachments.add(filename)
+        replaced_hash = self._stored_attachment_hashes.pop(filename, None)
+        if replaced_hash is not None:
+            self._stored_attachments.pop(replaced_hash, None)
+        self._stored_attachments[content_hash] = filename
+        self._stored_attachment_hashes[filename] = content_hash
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_ATTACHMENT_WORKERS, thread_name_prefix="attachment"
+            )
+        self._pending_copies[filename] = self._executor.submit(
+            self._copy_attachment_file,
+            artifact_path,
+            attachment_path,
+            self._pending_copies.get(filename),
+        )
+
+    def _copy_attachment_file(
+        self, artifact_path: Path, attachment_path: Path, previous_copy: Optional[Future]
+    ) -> str:
+        """Copies an attachment after ``previous_copy`` to the same attachment path."""
+        if previous_copy is not None:
+            self._wait_for_attachment_copy(attachment_path.name, previous_copy)
+        attachment_path.parent.mkdir(parents=True, exist_ok=True)
+        copy_file(artifact_path, attachment_path)
+        return attachment_path.name
+
+    @staticmethod
+    def _wait_for_attachment_copy(filename: str, attachment_copy: Future) -> Optional[str]:
+        try:
+            return attachment_copy.result()
+        except OSError as error:
+            logger.error(f"Attachment '{filename}' could not be stored: {error}")
+            return None
+
+    def _is_attachment_stored(self, reference: ReferenceAssignment, wait: bool) -> bool:
+        """Returns whether the attachment of ``reference`` is copied.
+
+        :param wait: Blocks until the attachment is copied.
+        """
+        attachment_copy = self._pending_copies.get(reference.value)
+        if attachment_copy is None or reference.referenceType != ReferenceKind.Attachment:
+            return True
+        if not wait and not attachment_copy.done():
+            return False
+        self._wait_for_attachment_copy(reference.value, attachment_copy)
+        return True
+
+    def store_references(self, references: list[ReferenceAssignment], wait: bool) -> bool:
+        """Returns whether the attachments of ``references`` are stored.
+
+        :param wait: Blocks until the attachments are stored.
+        """
+        return all(self._is_attachment_stored(reference, wait) for reference in references)
+
+    def wait_for_attachments(self) -> None:
+        """Blocks until all attachments added by add_artifact are stored."""
+        for filename, attachment_copy in self._pending_copies.items():
+            self._wait_for_attachment_copy(filename, attachment_copy)
+        self._pending_copies.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def _dispatch_attachment_copy(
-        self, filename: str, artifact_value: str, attachment_folder_path: Path
+        self, filename: str, artifact_path: Path, content_hash: str
     ) -> str:
         conflict_methods = {
             AttachmentConflictBehaviour.USE_NEW: (
                 self._use_new_attachment,
-                [filename, artifact_value, attachment_folder_path],
+                [filename, artifact_path, content_hash],
             ),
             AttachmentConflictBehaviour.RENAME_NEW: (
                 self._rename_new_attachment,
-                [filename, artifact_value, attachment_folder_path],
+                [filename, artifact_path, content_hash],
             ),
             AttachmentConflictBehaviour.USE_EXISTING: (self._use_existing_attachment, [filename]),
             AttachmentConflictBehaviour.ERROR: (self._log_attachment_error, [filename]),
@@ -94,22 +193,20 @@ class ExecutionArtifactStorage:
         )
         return method(*args)
 
-    def _use_new_attachment(
-        self, filename: str, artifact_value: str, attachment_folder_path: Path
-    ) -> str:
-        shutil.copyfile(artifact_value, attachment_folder_path / filename, follow_symlinks=True)
+    def _use_new_attachment(self, filename: str, artifact_path: Path, content_hash: str) -> str:
+        self._submit_attachment_copy(
+            artifact_path, Path(self.attachment_folder) / filename, content_hash
+        )
         return filename
 
-    def _rename_new_attachment(
-        self, filename: str, artifact_value: str, attachment_folder_path: Path
-    ) -> str:
-        unique_path = self._create_unique_attachment_path(attachment_folder_path / filename)
+    def _rename_new_attachment(self, filename: str, artifact_path: Path, content_hash: str) -> str:
+        unique_path = self._create_unique_attachment_path(Path(self.attachment_folder) / filename)
         unique_file = Path(unique_path).name
         logger.info(
             f"Attachment '{filename}' does already exist. "
             f"Creating new unique attachment '{unique_file}'."
         )
-        shutil.copyfile(artifact_value, unique_path, follow_symlinks=True)
+        self._submit_attachment_copy(artifact_path, unique_path, content_hash)
         return unique_file
 
     def _use_existing_attachment(self, filename: str) -> str:
@@ -127,13 +224,33 @@ class ExecutionArtifactStorage:
         sys.exit()
 
     def _copy_attachment(self, artifact_value: str) -> str:
-        filename = Path(artifact_value).name
-        attachment_folder_path = Path(self.attachment_folder)
-        if not attachment_folder_path.exists():
-            attachment_folder_path.mkdir(parents=True, exist_ok=True)
-        if not (attachment_folder_path / filename).exists():
-            return self._use_new_attachment(filename, artifact_value, attachment_folder_path)
-        return self._dispatch_attachment_copy(filename, artifact_value, attachment_folder_path)
+        artifact_path = str(Path(artifact_value).absolute())
+        stored_attachment = self._attachments_by_path.get(artifact_path)
+        if stored_attachment is None:
+            stored_attachment = self._store_attachment(artifact_value)
+            self._attachments_by_path[artifact_path] = stored_attachment
+        return stored_attachment
+
+    def _store_attachment(self, artifact_value: str) -> str:
+        """Returns the attachment with the content of ``artifact_value``, storing it if the
+        report has none yet. The content is hashed before the reference is created, so all
+        attachments with the same content get the same reference.
+        """
+        artifact_path = Path(artifact_value)
+        content_hash = get_file_hash(artifact_path)
+        existing_attachment = self.existing_attachments.find(
+            artifact_path.stat().st_size, content_hash
+        ) or self._stored_attachments.get(content_hash)
+        if existing_attachment is not None:
+            logger.debug(
+                f"Attachment '{artifact_value}' has the same content as "
+                f"'{existing_attachment}' and is stored only once."
+            )
+            return existing_attachment
+        filename = artifact_path.name
+        if not self._attachment_exists(Path(self.attachment_folder) / filename):
+            return self._use_new_attachment(filename, artifact_path, content_hash)
+        return self._dispatch_attachment_copy(filename, artifact_path, content_hash)
 
     def _process_artifact(self, artifact: str) -> Optional[str]:
         artifact_info = ExecutionArtifactInfo(artifact, self.output_xml)
@@ -186,24 +303,19 @@ class ExecutionArtifactStorage:
 
     def _add_new_reference(self, artifact_value: str, reference_behaviour: ReferenceBehaviour):
         new_key = str(self.new_key)
-        self.tb_references.append(
-            ReferenceAssignment(
-                key=new_key,
-                value=artifact_value,
-                referenceType=ReferenceKind(reference_behaviour.capitalize()),
-            )
+        reference = ReferenceAssignment(
+            key=new_key,
+            value=artifact_value,
+            referenceType=ReferenceKind(reference_behaviour.capitalize()),
         )
+        self.tb_references.append(reference)
+        self._index_reference(reference)
         return new_key
 
-    def _get_existing_artifact(self, artifact_value: str, reference_behaviour: ReferenceBehaviour):
-        return next(
-            filter(
-                lambda ref: ref.value == artifact_value
-                and ref.referenceType.value.lower() == reference_behaviour.lower(),
-                self.tb_references,
-            ),
-            None,
-        )
+    def _get_existing_artifact(
+        self, artifact_value: str, reference_behaviour: ReferenceBehaviour
+    ) -> Optional[ReferenceAssignment]:
+        return self._references_by_value.get((artifact_value, reference_behaviour.lower()))
 
 
 class ExecutionArtifactInfo:
@@ -0,0 +1,129 @@
+import io
+import json
+from pathlib import Path
+from typing import IO, Optional
+
+from .log import logger
+from .model import (
+    ReferenceAssignment,
+    TestCaseExecutionForImport,
+    TestCaseSetExecutionForImport,
+)
+from .model_utils import from_dict, to_json
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+JOURNAL_FILE = "journal.jsonl"
+
+
+class FetchJournal:
+    """Append-only journal of the tests and test case sets written to the result report.
+
+    A record is appended and flushed after the JSON file of a test or test case set has
+    been written to the staging directory, so the journal of a killed fetch lists exactly
+    the finished work. Together with the staged files it is the checkpoint a fetch of the
+    same inputs resumes from. A torn last record is ignored and cut off before new records
+    are appended.
+    """
+
+    def __init__(self, journal_file: Path, inputs: dict):
+        self.journal_file = journal_file
+        self.inputs = inputs
+        self.tests: dict[str, TestCaseExecutionForImport] = {}
+        self.test_case_sets: dict[str, TestCaseSetExecutionForImport] = {}
+        self.references: list[ReferenceAssignment] = []
+        self._file: Optional[IO[str]] = None
+        self._end_of_records = 0
+
+    def load(self) -> bool:
+        """Reads the records of an earlier fetch.
+
+        :return: False if there is no journal or it was written for other inputs.
+        """
+        if not self.journal_file.exists():
+            return False
+        self._end_of_records = 0
+        with self.journal_file.open("rb") as journal:
+            records = []
+            for line in journal:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError
+                    records.append(json.loads(line))
+                except ValueError:
+                    logger.debug(f"Ignoring incomplete record in '{self.journal_file}'.")
+                    break
+                self._end_of_records += len(line)
+        if not records or records[0].get("inputs") != self.inputs:
+            return False
+        for record in records[1:]:
+            if "test" in record:
+                self.tests[record["test"]] = from_dict(
+                    TestCaseExecutionForImport, record["protocol"]
+                )
+                self.references.extend(
+                    from_dict(ReferenceAssignment, reference)
+                    for reference in record["references"]
+                )
+            elif "testCaseSet" in record:
+                self.test_case_sets[record["testCaseSet"]] = from_dict(
+                    TestCaseSetExecutionForImport, record["protocol"]
+                )
+        return True
+
+    def open(self, resume: bool) -> None:
+        """Opens the journal, continuing the records of an earlier fetch if ``resume`` is set."""
+        if resume and self.load():
+            logger.info(
+                f"Resuming fetch with {len(self.tests)} tests and "
+                f"{len(self.test_case_sets)} test case sets already written."
+            )
+            self._file = self.journal_file.open("a", encoding="utf-8")
+            self._file.truncate(self._end_of_records)
+            return
+        if resume:
+            logger.warning(
+                f"No checkpoint of an earlier fetch of these results found at "
+                f"'{self.journal_file.parent}'. Starting from the beginning."
+            )
+        self.tests.clear()
+        self.test_case_sets.clear()
+        self.references.clear()
+        self._file = self.journal_file.open("w", encoding="utf-8")
+        self._append({"inputs": self.inputs})
+
+    def add_test(
+        self,
+        uid: str,
+        protocol: TestCaseExecutionForImport,
+        references: list[ReferenceAssignment],
+    ) -> None:
+        self._append({"test": uid, "protocol": protocol, "references": references})
+
+    def add_test_case_set(self, uid: str, protocol: TestCaseSetExecutionForImport) -> None:
+        self._append({"testCaseSet": uid, "protocol": protocol})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _append(self, record: dict) -> None:
+        if self._file is None:
+            return
+        line = io.StringIO()
+        to_json(record, line)
+        self._file.write(f"{line.getvalue()}\n")
+        self._file.flush()
+
+
+def get_journal_inputs(json_report: Path, result_files: list[Path]) -> dict:
+    """Identifies the inputs of a fetch, so a checkpoint is only resumed for the same files."""
+    return {
+        "report": _get_file_state(json_report),
+        "results": [_get_file_state(result_file) for result_file in result_files],
+    }
+
+
+def _get_file_state(path: Path) -> list:
+    stat = Path(path).stat()
+    return [str(Path(path).resolve()), stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,151 @@
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .log import logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_key TEXT NOT NULL UNIQUE,
+    fetched_at TEXT NOT NULL,
+    report TEXT NOT NULL,
+    results TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    uid TEXT NOT NULL,
+    test_case_set TEXT,
+    verdict TEXT NOT NULL,
+    duration INTEGER,
+    start_time TEXT
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_uid TEXT NOT NULL,
+    keyword_path TEXT NOT NULL,
+    sequence_id TEXT NOT NULL,
+    verdict TEXT NOT NULL,
+    duration INTEGER
+);
+CREATE INDEX IF NOT EXISTS tests_by_uid ON tests (uid, run_id);
+CREATE INDEX IF NOT EXISTS tests_by_run ON tests (run_id);
+CREATE INDEX IF NOT EXISTS keywords_by_path ON keywords (keyword_path, run_id);
+CREATE INDEX IF NOT EXISTS keywords_by_test ON keywords (test_uid, run_id);
+"""
+
+
+class ExecutionHistory:
+    """SQLite store of the test and keyword durations and verdicts of every fetched run.
+
+    A run is identified by its fetch inputs, so fetching the same results again replaces
+    the rows of that run, and resuming an interrupted fetch continues it.
+    Rows are written in one transaction per test case set.
+    """
+
+    def __init__(self, database: Path):
+        self.database = Path(database)
+        self.database.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.database)
+        self.connection.executescript(SCHEMA)
+        self.run_id: Optional[int] = None
+
+    def start_run(self, inputs: dict, resume: bool = False) -> int:
+        """Creates the run of the fetch ``inputs`` or reuses it if the same inputs were fetched.
+
+        :param inputs: Report and result files of the fetch, see ``get_journal_inputs``.
+        :param resume: Keeps the rows of an earlier fetch of the same inputs.
+        """
+        run_key = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+        row = self.connection.execute(
+            "SELECT id FROM runs WHERE run_key = ?", (run_key,)
+        ).fetchone()
+        if row is None:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (run_key, fetched_at, report, results) VALUES (?, ?, ?, ?)",
+                (
+                    run_key,
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    inputs["report"][0],
+                    json.dumps([result[0] for result in inputs["results"]]),
+                ),
+            )
+            self.run_id = cursor.lastrowid
+        else:
+            self.run_id = row[0]
+            if not resume:
+                self.connection.execute("DELETE FROM tests WHERE run_id = ?", (self.run_id,))
+                self.connection.execute("DELETE FROM keywords WHERE run_id = ?", (self.run_id,))
+        self.connection.commit()
+        return self.run_id
+
+    def add_test(  # noqa: PLR0913
+        self,
+        uid: str,
+        test_case_set: Optional[str],
+        verdict: str,
+        duration: Optional[int],
+        start_time: Optional[str],
+        keywords: list[tuple[str, str, str, Optional[int]]],
+    ) -> None:
+        """Adds a test and its keywords as ``(keyword path, sequence ID, verdict, duration)``."""
+        self.connection.execute(
+            "INSERT INTO tests (run_id, uid, test_case_set, verdict, duration, start_time) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self.run_id, uid, test_case_set, verdict, duration, start_time),
+        )
+        self.connection.executemany(
+            "INSERT INTO keywords "
+            "(run_id, test_uid, keyword_path, sequence_id, verdict, duration) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(self.run_id, uid, *keyword) for keyword in keywords],
+        )
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
+        logger.info(f"Execution history written to '{self.database.resolve()}'.")
+
+
+def query_history(database: Path, query: str, parameters: tuple) -> list[dict]:
+    if not Path(database).is_file():
+        raise FileNotFoundError(f"Execution history '{database}' does not exist.")
+    connection = sqlite3.connect(database)
+    connection.row_factory = sqlite3.Row
+    try:
+        return [dict(row) for row in connection.execute(query, parameters)]
+    finally:
+        connection.close()
+
+
+def get_test_history(database: Path, uid: str, limit: int = 20) -> list[dict]:
+    """Returns the verdicts and durations of a test case in the latest ``limit`` runs."""
+    return query_history(
+        database,
+        "SELECT runs.id AS run, runs.fetched_at, tests.uid, tests.verdict, tests.duration, "
+        "tests.start_time FROM tests JOIN runs ON runs.id = tests.run_id "
+        "WHERE tests.uid = ? ORDER BY tests.run_id DESC LIMIT ?",
+        (uid, limit),
+    )
+
+
+def get_keyword_history(database: Path, keyword_path: str, limit: int = 20) -> list[dict]:
+    """Returns the count, total and maximum duration and failures of a keyword
+    in the latest ``limit`` runs calling it.
+    """
+    return query_history(
+        database,
+        "SELECT runs.id AS run, runs.fetched_at, keywords.keyword_path, COUNT(*) AS count, "
+        "SUM(keywords.duration) AS total_duration, MAX(keywords.duration) AS max_duration, "
+        "SUM(keywords.verdict = 'Fail') AS failures "
+        "FROM keywords JOIN runs ON runs.id = keywords.run_id "
+        "WHERE keywords.keyword_path = ? GROUP BY keywords.run_id "
+        "ORDER BY keywords.run_id DESC LIMIT ?",
+        (keyword_path, limit),
+    )
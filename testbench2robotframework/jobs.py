@@ -0,0 +1,172 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import (
+    Configuration,
+    find_private_robot_toml,
+    find_pyproject_toml,
+    find_robot_toml,
+    get_tb2robot_file_configuration,
+)
+from .log import logger, setup_logger
+from .robotframework2testbench import robot2testbench
+from .testbench2robotframework import (
+    create_test_suites_from_model,
+    read_report_model,
+    write_generated_test_suites,
+)
+from .testsuite_write import get_generation_directory
+from .utils import get_file_hash
+
+GENERATE_JOB = "generate"
+FETCH_JOB = "fetch"
+
+
+class LruCache:
+    """Keeps the most recently used ``max_size`` values."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values: OrderedDict[Any, Any] = OrderedDict()
+
+    def get(self, key, create_value: Callable[[], Any]):
+        """Returns the value of ``key`` and creates it with ``create_value`` if it is missing."""
+        if key in self._values:
+            self.hits += 1
+            self._values.move_to_end(key)
+            return self._values[key]
+        self.misses += 1
+        value = create_value()
+        self._values[key] = value
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+        return value
+
+
+def get_report_hash(testbench_report: Path) -> str:
+    """Returns a hash of a report ZIP file or of the JSON files of a report directory."""
+    if not testbench_report.is_dir():
+        return get_file_hash(testbench_report)
+    report_hash = hashlib.sha256()
+    for json_file in sorted(testbench_report.glob("*.json")):
+        report_hash.update(json_file.name.encode("utf-8"))
+        report_hash.update(json_file.read_bytes())
+    return report_hash.hexdigest()
+
+
+def get_config_files(config: Optional[str]) -> list[Path]:
+    if config:
+        return [Path(config)]
+    return [
+        config_file
+        for config_file in (find_pyproject_toml(), find_robot_toml(), find_private_robot_toml())
+        if config_file.is_file()
+    ]
+
+
+def get_job_output_paths(job_type: str, job: dict, configuration: Configuration) -> list[Path]:
+    """Returns the files and directories a job writes to."""
+    if job_type == GENERATE_JOB:
+        output_paths = [get_generation_directory(configuration.output_directory)]
+    else:
+        output_paths = [Path(job.get("outputDirectory") or job["report"])]
+    output_paths.extend(
+        Path(output_file)
+        for output_file in (configuration.history_database, configuration.keyword_statistics)
+        if output_file
+    )
+    return output_paths
+
+
+def check_job_output_paths(
+    job_type: str, job: dict, configuration: Configuration, output_root: Path
+) -> None:
+    """Raises a ``PermissionError`` if a job writes outside of ``output_root``."""
+    output_root = output_root.resolve()
+    for output_path in get_job_output_paths(job_type, job, configuration):
+        if not output_path.resolve().is_relative_to(output_root):
+            raise PermissionError(
+                f"Output '{output_path}' of the job is outside of the output root '{output_root}'."
+            )
+
+
+class JobRunner:
+    """Runs generate and fetch jobs with the reports and configurations of former jobs.
+
+    Reports are cached by the hash of their content, configuration files by their path
+    and content, so changed files are read again.
+    """
+
+    def __init__(self, cache_size: int):
+        self.report_cache = LruCache(cache_size)
+        self.config_cache = LruCache(cache_size)
+
+    def run(self, job_type: str, job: dict, output_root: Optional[str] = None) -> dict:
+        """Runs a job. With ``output_root``, jobs writing outside of it are rejected."""
+        start = time.perf_counter()
+        config = self.get_config(job)
+        if output_root:
+            check_job_output_paths(
+                job_type, job, Configuration.from_dict(config), Path(output_root)
+            )
+        if job_type == GENERATE_JOB:
+            report_cached = self.generate(job, config)
+        else:
+            report_cached = False
+            robot2testbench(job["report"], job["results"], job.get("outputDirectory"), config)
+        return {
+            "job": job_type,
+            "duration": round(time.perf_counter() - start, 3),
+            "reportCached": report_cached,
+        }
+
+    def get_config(self, job: dict) -> dict:
+        config_files = get_config_files(job.get("config"))
+        key = tuple(
+            (str(config_file), get_file_hash(config_file) if config_file.is_file() else "")
+            for config_file in config_files
+        )
+        file_config = self.config_cache.get(
+            key, lambda: get_tb2robot_file_configuration(job.get("config"))
+        )
+        return {**file_config, **job.get("options", {})}
+
+    def generate(self, job: dict, config: dict) -> bool:
+        config.setdefault("clean", False)
+        configuration = Configuration.from_dict(config)
+        setup_logger(configuration)
+        testbench_report = Path(job["report"])
+        if not testbench_report.exists():
+            raise FileNotFoundError(f"TestBench report '{testbench_report}' does not exist.")
+        misses = self.report_cache.misses
+        test_theme_tree, test_case_set_catalog = self.report_cache.get(
+            get_report_hash(testbench_report), lambda: read_report_model(testbench_report)
+        )
+        test_suites = create_test_suites_from_model(
+            test_theme_tree, test_case_set_catalog, configuration
+        )
+        if not test_suites:
+            logger.warning("There are no test suites in the exported TestBench Projekt.")
+        else:
+            write_generated_test_suites(test_suites, test_case_set_catalog, configuration)
+        return self.report_cache.misses == misses
+
+
+_job_runner: Optional[JobRunner] = None
+
+
+def init_worker(cache_size: int) -> None:
+    global _job_runner  # noqa: PLW0603
+    _job_runner = JobRunner(cache_size)
+
+
+def run_job(job_type: str, job: dict, output_root: Optional[str] = None) -> dict:
+    if _job_runner is None:
+        init_worker(1)
+    return _job_runner.run(job_type, job, output_root)
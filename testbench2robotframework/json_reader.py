@@ -129,6 +129,13 @@ class TestBenchJsonReader:
             # return None  # TODO: wenn nicht da dann Fehler?
         return from_dict(TestCaseDetails, tc_dict)
 
+    def read_test_case_execution_key(self, uid) -> Optional[str]:
+        """Reads only the execution key of a test case without building its model."""
+        tc_dict = read_json(str(Path(self.json_dir, f"{uid}.json")))
+        if tc_dict is None:
+            return None
+        return str((tc_dict.get("exec") or {}).get("key", ""))
+
     def read_test_theme_tree(self, is_tov=False) -> Optional[TestStructureTree]:
         test_structure_tree = read_json(str(Path(self.json_dir, TEST_STRUCTURE_TREE_FILE)))
         if test_structure_tree is None:
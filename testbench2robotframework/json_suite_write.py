@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path, PurePath
+
+from robot.api.parsing import SettingSection, TestSetup, TestTeardown, TestTimeout
+from robot.parsing.model.blocks import File
+from robot.running import TestSuite as RunningTestSuite
+
+from .log import logger
+from .testsuite_write import INIT_FILE_NAME, ROBOT_FILE_SUFFIX, get_json_suite_file
+
+try:
+    from robot.api.parsing import TestTags
+except ImportError:
+    from robot.api.parsing import ForceTags as TestTags
+
+try:
+    from robot.running import TestDefaults
+except ImportError:
+    TestDefaults = None
+
+
+def write_json_test_suite(test_suites: dict[str, File], generation_directory: Path) -> None:
+    """Writes all test suites as one Robot Framework JSON suite file next to the
+    generation directory, e.g. ``Generated.rbt`` for ``Generated``.
+    """
+    json_suite_file = get_json_suite_file(generation_directory).resolve()
+    json_suite_file.parent.mkdir(parents=True, exist_ok=True)
+    create_running_test_suite(
+        test_suites, json_suite_file.with_name(json_suite_file.stem)
+    ).to_json(json_suite_file)
+    logger.debug(f"File written to {os.path.relpath(json_suite_file)}")
+
+
+def create_running_test_suite(
+    test_suites: dict[str, File], generation_directory: Path
+) -> RunningTestSuite:
+    """Builds the executable suite structure Robot Framework would create from
+    the test suite files written to ``generation_directory``, without writing or parsing them.
+
+    Only the public API of Robot Framework is used: suite files are built with
+    ``TestSuite.from_model`` and the test defaults of init files are passed on as ``TestDefaults``.
+    """
+    if TestDefaults is None:
+        raise RuntimeError("Building test suites in memory requires Robot Framework 6.1 or newer.")
+    suite_files: dict[PurePath, File] = {}
+    init_files: dict[PurePath, File] = {}
+    children: dict[PurePath, set[PurePath]] = {}
+    for test_suite_file in test_suites.values():
+        path = PurePath(test_suite_file.source)
+        if path.name == INIT_FILE_NAME:
+            init_files[path.parent] = test_suite_file
+            path = path.parent
+        else:
+            suite_files[path] = test_suite_file
+        while path != PurePath():
+            children.setdefault(path.parent, set()).add(path)
+            path = path.parent
+    return _create_directory_suite(
+        PurePath(), generation_directory, suite_files, init_files, children, None
+    )
+
+
+def _create_directory_suite(  # noqa: PLR0913
+    path: PurePath,
+    generation_directory: Path,
+    suite_files: dict[PurePath, File],
+    init_files: dict[PurePath, File],
+    children: dict[PurePath, set[PurePath]],
+    parent_defaults: TestDefaults | None,
+) -> RunningTestSuite:
+    source = generation_directory / path
+    suite = RunningTestSuite(name=RunningTestSuite.name_from_source(source), source=source)
+    defaults = TestDefaults(parent_defaults)
+    init_file = init_files.get(path)
+    if init_file is not None:
+        init_file.source = source / f"{INIT_FILE_NAME}{ROBOT_FILE_SUFFIX}"
+        _apply_init_file(suite, defaults, init_file)
+    for child in sorted(
+        children.get(path, ()), key=lambda child: _get_sort_name(child, child in suite_files)
+    ):
+        if child in suite_files:
+            suite_file = suite_files[child]
+            suite_file.source = generation_directory / f"{child}{ROBOT_FILE_SUFFIX}"
+            suite.suites.append(RunningTestSuite.from_model(suite_file, defaults=defaults))
+        else:
+            suite.suites.append(
+                _create_directory_suite(
+                    child, generation_directory, suite_files, init_files, children, defaults
+                )
+            )
+    return suite
+
+
+def _apply_init_file(suite: RunningTestSuite, defaults: TestDefaults, init_file: File) -> None:
+    """Sets the suite settings of an init file to the directory suite and its test settings
+    to the defaults of the tests below it, like Robot Framework does when parsing the file.
+    """
+    init_suite = RunningTestSuite.from_model(init_file)
+    suite.doc = init_suite.doc
+    suite.metadata = init_suite.metadata
+    suite.resource = init_suite.resource
+    if init_suite.has_setup:
+        suite.setup = init_suite.setup
+    if init_suite.has_teardown:
+        suite.teardown = init_suite.teardown
+    for section in init_file.sections:
+        if not isinstance(section, SettingSection):
+            continue
+        for setting in section.body:
+            if isinstance(setting, TestTags):
+                defaults.tags = setting.values
+            elif isinstance(setting, TestSetup):
+                defaults.setup = _get_fixture(setting)
+            elif isinstance(setting, TestTeardown):
+                defaults.teardown = _get_fixture(setting)
+            elif isinstance(setting, TestTimeout):
+                defaults.timeout = setting.value
+
+
+def _get_fixture(setting: TestSetup | TestTeardown) -> dict:
+    return {"name": setting.name, "args": setting.args, "lineno": setting.lineno}
+
+
+def _get_sort_name(path: PurePath, is_suite_file: bool) -> str:
+    if is_suite_file:
+        return f"{path.name}{ROBOT_FILE_SUFFIX}".lower()
+    return path.name.lower()
@@ -1,8 +1,6 @@
 import json
-from dataclasses import asdict
-from enum import Enum
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from .config import Configuration
 from .log import logger
@@ -13,48 +11,43 @@ from .model import (
     TestCaseSetExecutionForImport,
     TestStructureTree,
 )
+from .model_utils import to_json
 
 TEST_STRUCTURE_TREE_FILE = "cycle_structure"
+DEFAULT_JSON_INDENT = 2
 
 
 def write_test_structure_element(
     json_dir: str,
     test_structure_element: Union[TestStructureTree, TestCaseSetDetails, TestCaseDetails],
+    indent: Optional[int] = DEFAULT_JSON_INDENT,
 ) -> None:
     if isinstance(test_structure_element, TestStructureTree):
         filepath = Path(json_dir) / Path(TEST_STRUCTURE_TREE_FILE + ".json")
     else:
         filepath = Path(json_dir) / Path(f"{test_structure_element.uniqueID}.json")
     with Path(filepath).open("w+", encoding="utf8") as output_file:
-        json.dump(
-            asdict(test_structure_element),
-            output_file,
-            indent=2,
-            default=lambda o: o.value if isinstance(o, Enum) else str(o),
-        )
+        to_json(test_structure_element, output_file, indent)
 
 
-def write_main_protocol(json_dir: str, main_protocol: list[TestCaseSetExecutionForImport]) -> None:
-    protocol = [asdict(tcs) for tcs in main_protocol]
+def write_main_protocol(
+    json_dir: str,
+    main_protocol: list[TestCaseSetExecutionForImport],
+    indent: Optional[int] = DEFAULT_JSON_INDENT,
+) -> None:
     filepath = Path(json_dir) / Path("protocol.json")
     with Path(filepath).open("w+", encoding="utf8") as output_file:
-        json.dump(
-            protocol,
-            output_file,
-            indent=2,
-            default=lambda o: o.value if isinstance(o, Enum) else str(o),
-        )
+        to_json(main_protocol, output_file, indent)
 
 
-def write_references(json_dir: str, references: list[ReferenceAssignment]) -> None:
+def write_references(
+    json_dir: str,
+    references: list[ReferenceAssignment],
+    indent: Optional[int] = DEFAULT_JSON_INDENT,
+) -> None:
     filepath = Path(json_dir) / Path("references.json")
     with Path(filepath).open("w+", encoding="utf8") as output_file:
-        json.dump(
-            [asdict(ref) for ref in references],
-            output_file,
-            indent=2,
-            default=lambda o: o.value if isinstance(o, Enum) else str(o),
-        )
+        to_json(references, output_file, indent)
 
 
 def write_default_config(config_file):
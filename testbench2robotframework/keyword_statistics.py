@@ -0,0 +1,116 @@
+import csv
+import json
+import math
+import random
+from pathlib import Path
+from typing import Optional
+
+from .log import logger
+
+DEFAULT_SAMPLE_SIZE = 1000
+SUMMARY_ROWS = 10
+STATISTICS_FIELDS = (
+    "keywordPath",
+    "count",
+    "totalDuration",
+    "p50Duration",
+    "p95Duration",
+    "maxDuration",
+    "failureRate",
+)
+
+
+class KeywordStatistics:
+    """Duration and failure statistics of the calls of one keyword.
+
+    Percentiles are computed from a uniform sample of at most ``sample_size`` durations,
+    so they are exact up to that number of calls and estimated for more calls.
+    """
+
+    def __init__(self, sample_size: int, rng: random.Random):
+        self.sample_size = sample_size
+        self.rng = rng
+        self.count = 0
+        self.failures = 0
+        self.total_duration = 0
+        self.max_duration = 0
+        self.samples: list[int] = []
+
+    def add(self, duration: int, failed: bool) -> None:
+        self.count += 1
+        self.failures += failed
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        if len(self.samples) < self.sample_size:
+            self.samples.append(duration)
+            return
+        index = self.rng.randrange(self.count)
+        if index < self.sample_size:
+            self.samples[index] = duration
+
+    def get_percentile(self, percentile: float) -> int:
+        samples = sorted(self.samples)
+        return samples[max(math.ceil(percentile * len(samples)) - 1, 0)] if samples else 0
+
+
+class KeywordAnalytics:
+    """Aggregates the durations and verdicts of keyword calls by keyword path
+    while the results are fetched.
+    """
+
+    def __init__(self, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self.rng = random.Random(0)
+        self.keywords: dict[str, KeywordStatistics] = {}
+
+    def add(self, keyword_path: str, duration: Optional[int], failed: bool) -> None:
+        statistics = self.keywords.get(keyword_path)
+        if statistics is None:
+            statistics = self.keywords[keyword_path] = KeywordStatistics(
+                self.sample_size, self.rng
+            )
+        statistics.add(duration or 0, failed)
+
+    def get_rows(self) -> list[dict]:
+        """Returns the statistics of all keywords, starting with the highest total duration."""
+        return [
+            {
+                "keywordPath": keyword_path,
+                "count": statistics.count,
+                "totalDuration": statistics.total_duration,
+                "p50Duration": statistics.get_percentile(0.5),
+                "p95Duration": statistics.get_percentile(0.95),
+                "maxDuration": statistics.max_duration,
+                "failureRate": round(statistics.failures / statistics.count, 4),
+            }
+            for keyword_path, statistics in sorted(
+                self.keywords.items(), key=lambda item: item[1].total_duration, reverse=True
+            )
+        ]
+
+    def write(self, statistics_file: Path) -> None:
+        """Writes the statistics as CSV for a ``.csv`` file and as JSON otherwise."""
+        statistics_file = Path(statistics_file)
+        statistics_file.parent.mkdir(parents=True, exist_ok=True)
+        rows = self.get_rows()
+        if statistics_file.suffix.lower() == ".csv":
+            with statistics_file.open("w", encoding="utf-8", newline="") as csv_file:
+                writer = csv.DictWriter(csv_file, STATISTICS_FIELDS)
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            statistics_file.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+        logger.info(f"Keyword statistics written to '{statistics_file.resolve()}'.")
+
+    def format_summary(self, max_rows: int = SUMMARY_ROWS) -> str:
+        lines = [
+            "| Keyword | Count | Total | p50 | p95 | Max | Failures |",
+            "|---|---|---|---|---|---|---|",
+        ]
+        lines.extend(
+            f"| {row['keywordPath']} | {row['count']} | {row['totalDuration'] / 1000:.3f} s "
+            f"| {row['p50Duration'] / 1000:.3f} s | {row['p95Duration'] / 1000:.3f} s "
+            f"| {row['maxDuration'] / 1000:.3f} s | {row['failureRate']:.1%} |"
+            for row in self.get_rows()[:max_rows]
+        )
+        return "\n".join(lines)
@@ -0,0 +1,95 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional, Union
+
+from robot.libraries.BuiltIn import BuiltIn
+from robot.result import TestCase, TestSuite
+from robot.running import TestCase as RunningTestCase
+from robot.running import TestSuite as RunningTestSuite
+
+from .config import Configuration, get_tb2robot_file_configuration
+from .log import logger, setup_logger
+from .result_writer import ResultWriter
+
+ROBOT_OUTPUT_FILE_PLACEHOLDER = "output.xml"
+
+
+class ListenerResultWriter(ResultWriter):
+    """Result writer of a running execution, whose output is written after its results."""
+
+    listener_mode = True
+
+
+class TestBenchListener:
+    """Robot Framework listener writing the execution results to a TestBench report.
+
+    Every finished test and suite is written through the same logic as ``fetch-results``,
+    so the report is complete as soon as Robot Framework closes the listener.
+    The JSON file of every finished test and test case set is written to the checkpoint
+    directory ``<output>.checkpoint`` right away and its protocol entry to the journal there.
+    The protocol is written once when the listener is closed. If the execution is killed,
+    the results written so far remain in the checkpoint.
+
+    Usage::
+
+        robot --listener testbench2robotframework.listener.TestBenchListener:report.zip:out tests
+
+    :param testbench_report: TestBench JSON report (directory or ZIP) the tests were generated from.
+    :param output: Directory or ZIP file the report with results is written to.
+        Without it the input report is updated.
+    :param config: Path to a configuration file for TestBench2RobotFramework
+        or, when the listener is created in Python, the configuration itself.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"
+
+    def __init__(
+        self,
+        testbench_report: str,
+        output: Optional[str] = None,
+        config: Union[str, Configuration, None] = None,
+    ):
+        if not Path(testbench_report).exists():
+            raise FileNotFoundError(
+                f"Could not find json directory or zip file at '{testbench_report}'."
+            )
+        self.testbench_report = testbench_report
+        self.output = output or None
+        self.configuration = (
+            config
+            if isinstance(config, Configuration)
+            else Configuration.from_dict(
+                get_tb2robot_file_configuration(Path(config) if config else None)
+            )
+        )
+        self._result_writer: Optional[ResultWriter] = None
+
+    @property
+    def result_writer(self) -> ResultWriter:
+        if self._result_writer is None:
+            setup_logger(self.configuration)
+            output_dir = BuiltIn().get_variable_value("${OUTPUT DIR}", ".")
+            self._result_writer = ListenerResultWriter(
+                self.testbench_report,
+                self.output,
+                replace(self.configuration, checkpoint=True, resume=False),
+                str(Path(output_dir, ROBOT_OUTPUT_FILE_PLACEHOLDER)),
+            )
+            logger.debug("TestBench listener started.")
+        return self._result_writer
+
+    def start_suite(self, data: RunningTestSuite, result: TestSuite):
+        self.result_writer.start_suite(result)
+
+    def end_test(self, data: RunningTestCase, result: TestCase):
+        self.result_writer.end_test(result)
+
+    def end_suite(self, data: RunningTestSuite, result: TestSuite):
+        self.result_writer.end_suite(result)
+
+    def close(self):
+        if self._result_writer is None:
+            return
+        self._result_writer.end_result(None)
+        self._result_writer = None
@@ -1,7 +1,9 @@
+from collections.abc import Callable
 from dataclasses import fields, is_dataclass
 from enum import Enum
+from json.encoder import encode_basestring_ascii
 from types import UnionType as TypesUnion
-from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+from typing import IO, Any, Optional, TypeVar, get_args, get_origin, get_type_hints
 from typing import Union as TypingUnion
 
 T = TypeVar("T")
@@ -105,3 +107,148 @@ def convert_value(value: Any, type_hint: Any) -> Any:
     if origin is Origin.UNION:
         return convert_value_with_union_type(value, type_hint)
     return convert_value_with_list_type(value, type_hint)
+
+
+Write = Callable[[str], Any]
+ValueEncoder = Callable[[Any, Write, Optional[int], int], None]
+DataclassEncoder = ValueEncoder
+
+_DATACLASS_ENCODERS: dict[type, DataclassEncoder] = {}
+
+
+def to_json(obj: Any, output_file: IO[str], indent: Optional[int] = None) -> None:
+    """Streams ``obj`` as JSON to ``output_file`` without building an intermediate dict.
+
+    The output equals ``json.dump(asdict(obj), indent=indent)`` for indented output.
+    Without indent the most compact separators are used.
+    """
+    encode_value(obj, output_file.write, indent, 0)
+
+
+def get_dataclass_encoder(cls: type) -> DataclassEncoder:
+    encoder = _DATACLASS_ENCODERS.get(cls)
+    if encoder is None:
+        encoder = _compile_dataclass_encoder(cls)
+        _DATACLASS_ENCODERS[cls] = encoder
+    return encoder
+
+
+def _compile_dataclass_encoder(cls: type) -> DataclassEncoder:
+    if not is_dataclass(cls):
+        raise ValueError(ERROR_NOT_A_DATACLASS.format(dataclass=cls.__name__))
+    field_names = tuple(cls_field.name for cls_field in fields(cls))
+    encoded_keys = tuple(encode_basestring_ascii(name) for name in field_names)
+    indented_keys = tuple(f"{key}: " for key in encoded_keys)
+    compact_keys = tuple(f"{key}:" for key in encoded_keys)
+
+    def encode_dataclass(obj: Any, write: Write, indent: Optional[int], level: int) -> None:
+        if not field_names:
+            write("{}")
+            return
+        if indent is None:
+            write("{")
+            for index, name in enumerate(field_names):
+                if index:
+                    write(",")
+                write(compact_keys[index])
+                encode_value(getattr(obj, name), write, indent, level)
+            write("}")
+            return
+        item_separator = "\n" + " " * (indent * (level + 1))
+        write("{")
+        for index, name in enumerate(field_names):
+            write("," + item_separator if index else item_separator)
+            write(indented_keys[index])
+            encode_value(getattr(obj, name), write, indent, level + 1)
+        write("\n" + " " * (indent * level) + "}")
+
+    return encode_dataclass
+
+
+def encode_value(value: Any, write: Write, indent: Optional[int], level: int) -> None:
+    value_type = type(value)
+    encoder = _VALUE_ENCODERS.get(value_type) or _DATACLASS_ENCODERS.get(value_type)
+    if encoder is None:
+        _encode_subclass_value(value, write, indent, level)
+    else:
+        encoder(value, write, indent, level)
+
+
+def _encode_subclass_value(value: Any, write: Write, indent: Optional[int], level: int) -> None:
+    if isinstance(value, str):
+        write(encode_basestring_ascii(value))
+    elif isinstance(value, Enum):
+        encode_value(value.value, write, indent, level)
+    elif isinstance(value, int):
+        write(int.__repr__(value))
+    elif isinstance(value, float):
+        write(_encode_float(value))
+    elif isinstance(value, (list, tuple)):
+        _encode_list(value, write, indent, level)
+    elif isinstance(value, dict):
+        _encode_dict(value, write, indent, level)
+    elif is_dataclass(value):
+        get_dataclass_encoder(type(value))(value, write, indent, level)
+    else:
+        write(encode_basestring_ascii(str(value)))
+
+
+def _encode_float(value: float) -> str:
+    if value != value:  # noqa: PLR0124
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _encode_list(value: list | tuple, write: Write, indent: Optional[int], level: int) -> None:
+    if not value:
+        write("[]")
+        return
+    if indent is None:
+        write("[")
+        for index, item in enumerate(value):
+            if index:
+                write(",")
+            encode_value(item, write, indent, level)
+        write("]")
+        return
+    item_separator = "\n" + " " * (indent * (level + 1))
+    write("[")
+    for index, item in enumerate(value):
+        write("," + item_separator if index else item_separator)
+        encode_value(item, write, indent, level + 1)
+    write("\n" + " " * (indent * level) + "]")
+
+
+def _encode_dict(value: dict, write: Write, indent: Optional[int], level: int) -> None:
+    if not value:
+        write("{}")
+        return
+    key_separator = ":" if indent is None else ": "
+    item_separator = "" if indent is None else "\n" + " " * (indent * (level + 1))
+    write("{")
+    for index, (key, item) in enumerate(value.items()):
+        if index:
+            write(",")
+        write(item_separator)
+        write(encode_basestring_ascii(str(key.value if isinstance(key, Enum) else key)))
+        write(key_separator)
+        encode_value(item, write, indent, level + 1)
+    if indent is not None:
+        write("\n" + " " * (indent * level))
+    write("}")
+
+
+_VALUE_ENCODERS: dict[type, ValueEncoder] = {
+    type(None): lambda value, write, indent, level: write("null"),
+    str: lambda value, write, indent, level: write(encode_basestring_ascii(value)),
+    bool: lambda value, write, indent, level: write("true" if value else "false"),
+    int: lambda value, write, indent, level: write(int.__repr__(value)),
+    float: lambda value, write, indent, level: write(_encode_float(value)),
+    list: _encode_list,
+    tuple: _encode_list,
+    dict: _encode_dict,
+}
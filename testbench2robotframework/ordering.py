@@ -0,0 +1,185 @@
+from pathlib import Path, PurePath
+
+from robot.model import TestSuite
+from robot.parsing.model.blocks import File, TestCaseSection
+
+from .config import Configuration, PabotOrdering
+from .json_reader import TestCaseSet
+from .log import logger
+from .model import TestCaseDetails
+from .result_writer import get_test_chain
+from .robot_result_reader import get_robot_result_files, read_robot_results
+from .testsuite_write import ROBOT_FILE_SUFFIX, get_generation_directory, write_test_suites
+
+ORDERING_FILE_SUFFIX = "_ordering.txt"
+
+
+def get_test_case_duration(test_case: TestCaseDetails) -> float:
+    """Returns the actual duration of the last execution of a test case in milliseconds
+    or its planned duration if it was not executed yet, 0 if it has none.
+    """
+    if test_case.exec is None:
+        return 0
+    return test_case.exec.actualDuration or test_case.exec.plannedDuration or 0
+
+
+def read_result_durations(robot_results: list[str]) -> dict[str, dict[str, float]]:
+    """Returns the elapsed time of every test of previous results in milliseconds
+    by the UID of its test case set and the test name.
+    """
+    result_files = [
+        result_file
+        for result_file in get_robot_result_files(robot_results)
+        if result_file.is_file()
+    ]
+    if not result_files:
+        logger.warning("There are no previous Robot Framework results to take durations from.")
+        return {}
+    result, _ = read_robot_results(result_files)
+    durations: dict[str, dict[str, float]] = {}
+    for test in result.suite.all_tests:
+        uid = test.parent.metadata.get("uniqueID")
+        if uid and test.status in ("PASS", "FAIL"):
+            durations.setdefault(uid, {})[test.name] = test.elapsedtime
+    return durations
+
+
+def get_test_names(test_suite: File) -> list[str]:
+    return [
+        test_case.name
+        for section in test_suite.sections
+        if isinstance(section, TestCaseSection)
+        for test_case in section.body
+        if hasattr(test_case, "name")
+    ]
+
+
+def get_test_chains(test_suite: File, phase_pattern: str) -> dict[str, list[str]]:
+    """Returns the test names of every TestBench test case of a test suite.
+
+    Test cases split into phases have several tests, which share the setup of the first
+    phase and the teardown of the last one.
+    """
+    test_chains: dict[str, list[str]] = {}
+    for test_name in get_test_names(test_suite):
+        test_chain = get_test_chain(test_name, phase_pattern)
+        test_chains.setdefault(test_chain.name if test_chain else test_name, []).append(test_name)
+    return test_chains
+
+
+def get_expected_durations(
+    test_suites: dict[str, File],
+    test_case_set_catalog: dict[str, TestCaseSet],
+    configuration: Configuration,
+) -> dict[str, dict[str, float]]:
+    """Returns the expected duration of every test of the test case set suites in milliseconds.
+
+    Durations are taken from the results of ``configuration.durations_from``, then from
+    the actual or planned duration of the TestBench test case, split equally between
+    its phases. Tests without a duration count with the mean duration of the other tests,
+    or with 1 if no test has a duration, so they are balanced by their number.
+    """
+    result_durations = (
+        read_result_durations(configuration.durations_from)
+        if configuration.durations_from
+        else {}
+    )
+    durations: dict[str, dict[str, float]] = {}
+    for uid, test_case_set in test_case_set_catalog.items():
+        test_durations = durations.setdefault(uid, {})
+        suite_result_durations = result_durations.get(uid, {})
+        for tc_uid, test_names in get_test_chains(
+            test_suites[uid], configuration.phasePattern
+        ).items():
+            test_case = test_case_set.test_cases.get(tc_uid)
+            report_duration = get_test_case_duration(test_case) if test_case else 0
+            for test_name in test_names:
+                test_durations[test_name] = suite_result_durations.get(
+                    test_name, report_duration / len(test_names)
+                )
+    known_durations = [
+        duration
+        for test_durations in durations.values()
+        for duration in test_durations.values()
+        if duration
+    ]
+    if not known_durations:
+        logger.info("There are no test durations, so all tests count equally.")
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1
+    return {
+        uid: {name: duration or default_duration for name, duration in test_durations.items()}
+        for uid, test_durations in durations.items()
+    }
+
+
+def get_suite_name(path: PurePath) -> str:
+    # The suffix is added and removed again, so dots in names are not taken as extensions.
+    return TestSuite.name_from_source(f"{path}{ROBOT_FILE_SUFFIX}", ROBOT_FILE_SUFFIX)
+
+
+def get_root_directory(generation_directory: Path) -> Path:
+    if generation_directory.suffix.lower() == ".zip":
+        return generation_directory.with_suffix("")
+    return generation_directory
+
+
+def get_suite_long_name(source: PurePath, generation_directory: Path) -> str:
+    """Returns the full name Robot Framework gives the suite of a test suite file."""
+    parts = (get_root_directory(generation_directory).name, *PurePath(source).parts)
+    return ".".join(get_suite_name(PurePath(part)) for part in parts)
+
+
+def get_ordering_file(generation_directory: Path) -> Path:
+    return Path(f"{get_root_directory(generation_directory)}{ORDERING_FILE_SUFFIX}")
+
+
+def get_ordering_items(
+    test_suites: dict[str, File],
+    durations: dict[str, dict[str, float]],
+    configuration: Configuration,
+) -> list[list[str]]:
+    """Returns the lines of the pabot ordering items, starting with the longest one.
+
+    With ``PabotOrdering.SUITE``, every test case set suite is one item. With
+    ``PabotOrdering.TEST``, every test is one item, but the phases of a test case
+    are one group, because they depend on its setup and teardown.
+    """
+    generation_directory = get_generation_directory(configuration.output_directory)
+    items: list[tuple[float, list[str]]] = []
+    for uid, test_durations in durations.items():
+        suite_name = get_suite_long_name(test_suites[uid].source, generation_directory)
+        if configuration.pabot_ordering != PabotOrdering.TEST:
+            items.append((sum(test_durations.values()), [f"--suite {suite_name}"]))
+            continue
+        for test_names in get_test_chains(test_suites[uid], configuration.phasePattern).values():
+            lines = [f"--test {suite_name}.{test_name}" for test_name in test_names]
+            items.append(
+                (
+                    sum(test_durations[test_name] for test_name in test_names),
+                    ["{", *lines, "}"] if len(lines) > 1 else lines,
+                )
+            )
+    return [lines for _, lines in sorted(items, key=lambda item: item[0], reverse=True)]
+
+
+def write_pabot_ordering(items: list[list[str]], ordering_file: Path) -> None:
+    ordering_file.parent.mkdir(parents=True, exist_ok=True)
+    ordering_file.write_text(
+        "".join(f"{line}\n" for lines in items for line in lines), encoding="utf-8"
+    )
+    logger.info(f"Pabot ordering file written to {ordering_file.resolve()!s}")
+
+
+def write_ordered_test_suites(
+    test_suites: dict[str, File],
+    test_case_set_catalog: dict[str, TestCaseSet],
+    configuration: Configuration,
+) -> None:
+    """Writes the test suites and a pabot ordering file starting with the longest suites."""
+    durations = get_expected_durations(test_suites, test_case_set_catalog, configuration)
+    # The names are taken before writing, because writing changes the sources of the suites.
+    items = get_ordering_items(test_suites, durations, configuration)
+    write_test_suites(test_suites, configuration)
+    write_pabot_ordering(
+        items, get_ordering_file(get_generation_directory(configuration.output_directory))
+    )
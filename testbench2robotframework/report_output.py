@@ -0,0 +1,230 @@
+import copy
+import shutil
+import struct
+import threading
+import zipfile
+from pathlib import Path
+from typing import Optional
+from zipfile import ZipFile, ZipInfo
+
+from .log import logger
+from .utils import get_file_hash, get_stream_hash, is_zip_file
+
+ATTACHMENTS_DIRECTORY = "attachments"
+COPY_CHUNK_SIZE = 1024 * 1024
+DATA_DESCRIPTOR_FLAG = 0x08
+FILE_HEADER_FILENAME_LENGTH = 10
+FILE_HEADER_EXTRA_FIELD_LENGTH = 11
+ZIP64_LIMIT = (1 << 31) - 1
+RAW_COPY_MODULE_ATTRIBUTES = ("structFileHeader", "sizeFileHeader")
+RAW_COPY_ARCHIVE_ATTRIBUTES = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
+
+class ReportOutput:
+    """Writes the result report without copying the complete input report.
+
+    Changed JSON files and new attachments are written to a staging directory.
+    On finalization, untouched files of the input report are copied into an
+    output directory or, for ZIP output, copied from the input ZIP without recompressing.
+    """
+
+    def __init__(self, json_report: Path, json_result: Path, create_zip: bool, work_dir: Path):
+        self.source = Path(json_report)
+        self.target = Path(json_result)
+        self.create_zip = create_zip
+        self.staging_dir = work_dir / "result"
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        if is_zip_file(self.source):
+            self.json_dir = work_dir / "report"
+            extract_json_files(self.source, self.json_dir)
+        else:
+            self.json_dir = self.source.resolve()
+
+    @property
+    def existing_attachments(self) -> "ExistingAttachments":
+        return ExistingAttachments(self.source)
+
+    def get_changed_files(self) -> dict[str, Path]:
+        return {
+            path.relative_to(self.staging_dir).as_posix(): path
+            for path in self.staging_dir.rglob("*")
+            if path.is_file()
+        }
+
+    def finalize(self) -> None:
+        changed_files = self.get_changed_files()
+        logger.debug(f"Writing {len(changed_files)} changed files to '{self.target}'.")
+        if self.create_zip:
+            self._write_zip(changed_files)
+        else:
+            self._write_directory(changed_files)
+
+    def _write_directory(self, changed_files: dict[str, Path]) -> None:
+        self.target.mkdir(parents=True, exist_ok=True)
+        if is_zip_file(self.source):
+            self._extract_unchanged_files(changed_files)
+        elif self.source.resolve() != self.target.resolve():
+            self._copy_unchanged_files(changed_files)
+        for name, path in changed_files.items():
+            target_path = self.target / name
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(path), str(target_path))
+
+    def _copy_unchanged_files(self, changed_files: dict[str, Path]) -> None:
+        for path in self.source.rglob("*"):
+            name = path.relative_to(self.source).as_posix()
+            if not path.is_file() or name in changed_files:
+                continue
+            target_path = self.target / name
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, target_path)
+
+    def _extract_unchanged_files(self, changed_files: dict[str, Path]) -> None:
+        with ZipFile(self.source) as source_zip:
+            for info in source_zip.infolist():
+                if info.filename not in changed_files:
+                    source_zip.extract(info, self.target)
+
+    def _write_zip(self, changed_files: dict[str, Path]) -> None:
+        zip_path = self.target.with_name(f"{self.target.name}.zip")
+        temp_zip_path = zip_path.with_name(f".{zip_path.name}.tmp")
+        with ZipFile(temp_zip_path, "w", zipfile.ZIP_DEFLATED) as target_zip:
+            if is_zip_file(self.source):
+                with ZipFile(self.source) as source_zip:
+                    for info in source_zip.infolist():
+                        if info.filename not in changed_files:
+                            copy_zip_entry(source_zip, target_zip, info)
+            else:
+                for path in self.source.rglob("*"):
+                    name = path.relative_to(self.source).as_posix()
+                    if path.is_file() and name not in changed_files:
+                        target_zip.write(path, name)
+            for name, path in changed_files.items():
+                target_zip.write(path, name)
+        temp_zip_path.replace(zip_path)
+
+
+class ExistingAttachments:
+    """Attachments of the input report.
+
+    New attachments are compared with them by content. To keep this cheap, only the
+    attachments with the same size as a new attachment are hashed, each at most once.
+    """
+
+    def __init__(self, report: Optional[Path] = None):
+        self.report = report
+        self.sizes: dict[str, int] = {}
+        self._members: dict[str, str] = {}
+        self._hashes: dict[str, str] = {}
+        self._names_by_size: Optional[dict[int, list[str]]] = None
+        self._lock = threading.Lock()
+        if report is None:
+            return
+        if is_zip_file(report):
+            with ZipFile(report) as report_zip:
+                for info in report_zip.infolist():
+                    if info.filename.startswith(f"{ATTACHMENTS_DIRECTORY}/") and not info.is_dir():
+                        name = Path(info.filename).name
+                        self.sizes[name] = info.file_size
+                        self._members[name] = info.filename
+            return
+        attachments_dir = report / ATTACHMENTS_DIRECTORY
+        if attachments_dir.is_dir():
+            for path in attachments_dir.iterdir():
+                if path.is_file():
+                    self.sizes[path.name] = path.stat().st_size
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.sizes
+
+    def find(self, size: int, content_hash: str) -> Optional[str]:
+        """Returns the name of an attachment with the given content or None."""
+        if self._names_by_size is None:
+            self._names_by_size = {}
+            for name, attachment_size in self.sizes.items():
+                self._names_by_size.setdefault(attachment_size, []).append(name)
+        for name in self._names_by_size.get(size, []):
+            if self.get_hash(name) == content_hash:
+                return name
+        return None
+
+    def get_hash(self, name: str) -> str:
+        with self._lock:
+            content_hash = self._hashes.get(name)
+        if content_hash is not None:
+            return content_hash
+        if name in self._members:
+            with ZipFile(self.report) as report_zip, report_zip.open(
+                self._members[name]
+            ) as attachment:
+                content_hash = get_stream_hash(attachment)
+        else:
+            content_hash = get_file_hash(self.report / ATTACHMENTS_DIRECTORY / name)
+        with self._lock:
+            self._hashes[name] = content_hash
+        return content_hash
+
+
+def extract_json_files(zip_file: Path, target_dir: Path) -> None:
+    with ZipFile(zip_file) as zip_ref:
+        for info in zip_ref.infolist():
+            if info.filename.endswith(".json") and "/" not in info.filename:
+                zip_ref.extract(info, target_dir)
+
+
+def can_copy_raw_zip_entries(source_zip: ZipFile, target_zip: ZipFile) -> bool:
+    """Raw copies use attributes of ``zipfile`` that are not part of its public API,
+    so they are only made if the running Python version provides them.
+    """
+    return (
+        all(hasattr(zipfile, name) for name in RAW_COPY_MODULE_ATTRIBUTES)
+        and all(hasattr(target_zip, name) for name in RAW_COPY_ARCHIVE_ATTRIBUTES)
+        and getattr(source_zip, "fp", None) is not None
+        and target_zip.fp is not None
+    )
+
+
+def copy_zip_entry(source_zip: ZipFile, target_zip: ZipFile, info: ZipInfo) -> None:
+    """Copies the compressed data of a ZIP entry without decompressing it.
+
+    Falls back to decompressing and compressing the entry again through the public
+    ``zipfile`` API if raw copies are not possible.
+    """
+    if not can_copy_raw_zip_entries(source_zip, target_zip):
+        copy_zip_entry_content(source_zip, target_zip, info)
+        return
+    source_fp = source_zip.fp
+    source_fp.seek(info.header_offset)
+    file_header = struct.unpack(
+        zipfile.structFileHeader, source_fp.read(zipfile.sizeFileHeader)
+    )
+    source_fp.seek(
+        file_header[FILE_HEADER_FILENAME_LENGTH] + file_header[FILE_HEADER_EXTRA_FIELD_LENGTH], 1
+    )
+    target_info = copy.copy(info)
+    target_info.flag_bits &= ~DATA_DESCRIPTOR_FLAG
+    target_info.header_offset = target_zip.fp.tell()
+    target_zip.fp.write(target_info.FileHeader())
+    remaining_bytes = info.compress_size
+    while remaining_bytes > 0:
+        chunk = source_fp.read(min(COPY_CHUNK_SIZE, remaining_bytes))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for '{info.filename}'.")
+        target_zip.fp.write(chunk)
+        remaining_bytes -= len(chunk)
+    target_zip.filelist.append(target_info)
+    target_zip.NameToInfo[target_info.filename] = target_info
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip._didModify = True
+
+
+def copy_zip_entry_content(source_zip: ZipFile, target_zip: ZipFile, info: ZipInfo) -> None:
+    target_info = copy.copy(info)
+    target_info.flag_bits &= ~DATA_DESCRIPTOR_FLAG
+    if info.is_dir():
+        target_zip.writestr(target_info, b"")
+        return
+    with source_zip.open(info) as source_file, target_zip.open(
+        target_info, "w", force_zip64=info.file_size > ZIP64_LIMIT
+    ) as target_file:
+        shutil.copyfileobj(source_file, target_file, COPY_CHUNK_SIZE)
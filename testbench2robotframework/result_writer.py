@@ -3,10 +3,11 @@ import os
 import re
 import shutil
 import tempfile
+import time
 import uuid
-from datetime import datetime, timedelta, timezone
+from collections import deque
+from datetime import timedelta
 from pathlib import Path
-from shutil import copytree
 from typing import Optional
 
 from robot.result import Keyword, ResultVisitor, TestCase, TestSuite
@@ -15,8 +16,16 @@ from testbench2robotframework.model_utils import from_dict
 
 from .config import Configuration
 from .execution_artifacts import ExecutionArtifactStorage
+from .fetch_journal import CHECKPOINT_SUFFIX, JOURNAL_FILE, FetchJournal, get_journal_inputs
+from .history import ExecutionHistory
 from .json_reader import TestBenchJsonReader
-from .json_writer import write_main_protocol, write_references, write_test_structure_element
+from .json_writer import (
+    DEFAULT_JSON_INDENT,
+    write_main_protocol,
+    write_references,
+    write_test_structure_element,
+)
+from .keyword_statistics import KeywordAnalytics
 from .log import logger
 from .model import (
     ActivityStatus,
@@ -27,15 +36,19 @@ from .model import (
     KeywordCallExecution,
     KeywordType,
     KeywordVerdict,
+    ReferenceAssignment,
     RichTextForImport,
     SequencePhase,
     TestCaseDetails,
     TestCaseExecutionDetails,
     TestCaseExecutionForImport,
+    TestCaseSetDetails,
     TestCaseSetExecutionForImport,
     VerdictStatus,
 )
-from .utils import directory_to_zip, get_directory
+from .report_output import ReportOutput
+from .timestamps import UtcTimestampFormatter, format_local_time, format_local_timestamp
+from .utils import check_report_path, is_zip_file
 
 try:
     from robot.result import Group
@@ -61,34 +74,56 @@ COLOR = {
 
 MEGABYTE = 1000 * 1000
 TB_ARTIFACT_REGEX = r"itb-reference:\s*(\S*)"
+MESSAGE_LEVELS = {
+    level: index
+    for index, level in enumerate(
+        ["TRACE", "DEBUG", "INFO", "WARN", "ERROR", "FAIL", "SKIP", "NONE"]
+    )
+}
 
 
 class ResultWriter(ResultVisitor):
+    listener_mode = False
+
     def __init__(
         self,
         json_report: str,
         json_result: Optional[str],
         config: Configuration,
         output_xml,
-        listener_uid=None,
+        test_sources: Optional[dict[str, Path]] = None,
     ) -> None:
-        self.listener_uid = listener_uid
-        self.json_dir = get_directory(json_report)
         self.output_xml = output_xml
+        self.test_sources = test_sources or {}
         self.reference_behaviour = config.referenceBehaviour
         self.attachment_conflict_behaviour = config.attachmentConflictBehaviour
-        self.tempdir = tempfile.TemporaryDirectory(dir=os.curdir)
+        self.json_indent = None if config.compact_json else DEFAULT_JSON_INDENT
+        self.max_keyword_messages = config.keyword_messages.maxMessages
+        self.max_keyword_message_bytes = config.keyword_messages.maxBytes
+        self.min_message_level = MESSAGE_LEVELS[config.keyword_messages.minLevel]
+        self.utc_timestamp_formatter = UtcTimestampFormatter()
+        self.protocol_only = config.protocol_only
         self._test_setup_passed: Optional[bool] = None
+        check_report_path(json_report)
         if json_result is None:
-            self.json_result = self.json_dir
-            self.json_result_path = self.json_dir
-            self.create_zip = bool(Path(json_report).suffix == ".zip")
+            self.create_zip = is_zip_file(Path(json_report))
+            self.json_result_path = (
+                str(Path(json_report).parent / Path(json_report).stem)
+                if self.create_zip
+                else str(Path(json_report).resolve())
+            )
         else:
             self.create_zip = bool(Path(json_result).suffix == ".zip")
             self.json_result_path = str(Path(json_result).parent / Path(json_result).stem)
-            self.json_result = self.tempdir.name
-            if self.create_zip:
-                copytree(self.json_dir, self.json_result, dirs_exist_ok=True)
+        self.tempdir: Optional[tempfile.TemporaryDirectory] = None
+        checkpoint = config.checkpoint or config.resume
+        resume = config.resume
+        self.work_dir = self._create_work_dir(checkpoint, resume)
+        self.report_output = ReportOutput(
+            Path(json_report), Path(self.json_result_path), self.create_zip, self.work_dir
+        )
+        self.json_dir = str(self.report_output.json_dir)
+        self.json_result = str(self.report_output.staging_dir)
         self.json_reader = TestBenchJsonReader(self.json_dir)
         self.attachments_path = Path(self.json_result, "attachments")
         self.artifact_storage = self._create_artifact_storage()
@@ -97,7 +132,65 @@ class ResultWriter(ResultVisitor):
         self.itb_test_case_catalog: dict[str, TestCaseDetails] = {}
         self.phase_pattern = config.phasePattern
         self.test_chain: list[TestCase] = []
+        self.pending_test_chains: dict[str, dict[int, TestCase]] = {}
         self.main_protocol = from_dict(ExecutionImportingSuccess, {"testCaseSets": [], "checkedInTestStructureElements":[], "checkedInTestElements": []})
+        self.journal: Optional[FetchJournal] = None
+        self._unjournaled_tests: deque[
+            tuple[str, TestCaseExecutionForImport, list[ReferenceAssignment]]
+        ] = deque()
+        if checkpoint:
+            self.journal = self._open_journal(json_report, resume)
+        self.history: Optional[ExecutionHistory] = None
+        if config.history_database:
+            self.history = self._open_history(json_report, config.history_database, resume)
+        self.keyword_statistics_file = config.keyword_statistics
+        self.keyword_analytics: Optional[KeywordAnalytics] = (
+            KeywordAnalytics() if config.keyword_statistics else None
+        )
+
+    def _create_work_dir(self, checkpoint: bool, resume: bool) -> Path:
+        if not checkpoint:
+            self.tempdir = tempfile.TemporaryDirectory(dir=os.curdir)
+            return Path(self.tempdir.name)
+        work_dir = Path(f"{self.json_result_path}{CHECKPOINT_SUFFIX}")
+        if not resume and work_dir.exists():
+            shutil.rmtree(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        return work_dir
+
+    def _open_journal(self, json_report: str, resume: bool) -> FetchJournal:
+        if self.listener_mode:
+            # The output of a running execution is written after the results.
+            inputs = get_journal_inputs(Path(json_report), [])
+            inputs["listener"] = True
+        else:
+            result_files = list(
+                dict.fromkeys([Path(self.output_xml), *self.test_sources.values()])
+            )
+            inputs = get_journal_inputs(Path(json_report), result_files)
+        inputs["protocolOnly"] = self.protocol_only
+        journal = FetchJournal(self.work_dir / JOURNAL_FILE, inputs)
+        journal.open(resume)
+        for reference in journal.references:
+            self.artifact_storage.restore_reference(reference)
+        self.main_protocol.testCaseSets.extend(journal.test_case_sets.values())
+        return journal
+
+    def _open_history(self, json_report: str, database: str, resume: bool) -> ExecutionHistory:
+        result_files = list(dict.fromkeys([Path(self.output_xml), *self.test_sources.values()]))
+        if all(result_file.is_file() for result_file in result_files):
+            inputs = get_journal_inputs(Path(json_report), result_files)
+        else:
+            # The output of a running execution is written after the results are fetched.
+            inputs = {
+                "report": [str(Path(json_report).resolve())],
+                "results": [
+                    [str(result_file.resolve()), time.time_ns()] for result_file in result_files
+                ],
+            }
+        history = ExecutionHistory(Path(database))
+        history.start_run(inputs, resume)
+        return history
 
     def _create_artifact_storage(self):
         return ExecutionArtifactStorage(
@@ -106,12 +199,17 @@ class ResultWriter(ResultVisitor):
             self.json_reader.read_references(),
             self.output_xml,
             self.attachments_path.as_posix(),
+            existing_attachments=self.report_output.existing_attachments,
         )
 
     def start_suite(self, suite: TestSuite):
         if suite.metadata:
             self.test_suites[suite.metadata["uniqueID"]] = suite
         self.protocol_test_cases: list[TestCaseExecutionForImport] = []
+        if self.journal and suite.metadata.get("uniqueID") in self.journal.test_case_sets:
+            logger.debug(f"Skipping suite {suite.metadata['uniqueID']} written before.")
+            return False
+        return None
 
     def _get_keywords_by_type(
         self, keywords: list[KeywordCall], keyword_type: KeywordType
@@ -124,18 +222,15 @@ class ResultWriter(ResultVisitor):
 
     def end_test(self, test: TestCase):
         self._test_setup_passed = None
-        test_chain = get_test_chain(test.name, self.phase_pattern)
-        if test_chain:
-            if test_chain.index == 1:
-                self.test_chain = [test]
-            else:
-                self.test_chain.append(test)
-            if test_chain.index != test_chain.length:
-                return
-        else:
-            self.test_chain = [test]
-
-        test_uid = test_chain.name if test_chain else test.name
+        test_uid = self._complete_test_chain(test)
+        if test_uid is None:
+            return
+        if self.journal and test_uid in self.journal.tests:
+            self._restore_written_test_case(test_uid)
+            return
+        if self.protocol_only:
+            self._add_protocol_test_case(test_uid)
+            return
         itb_test_case = self.json_reader.read_test_case(test_uid)  # TODO What if name != UID
         if not itb_test_case:
             logger.warning(f"No JSON file corresponding to test '{test_uid}' found in report.")
@@ -150,6 +245,41 @@ class ResultWriter(ResultVisitor):
                 f"Test case {itb_test_case.uniqueID} was not exported based on "
                 f"execution and is therefore not importable."
             )
+        reference_count = len(self.artifact_storage.tb_references)
+        self._set_itb_test_case_results(itb_test_case)
+        self.itb_test_case_catalog[test_uid] = itb_test_case
+        self.protocol_test_cases.append(self.protocol_test_case)
+        self._add_test_statistics(itb_test_case, test)
+        write_test_structure_element(self.json_result, itb_test_case, self.json_indent)
+        if self.journal:
+            self._journal_test(
+                test_uid,
+                self.protocol_test_case,
+                self.artifact_storage.tb_references[reference_count:],
+            )
+        logger.debug(
+            f"Successfully wrote the result from test "
+            f"{itb_test_case.uniqueID} to TestBench's Json Report."
+        )
+
+    def _complete_test_chain(self, test: TestCase) -> Optional[str]:
+        """Sets the phases of the test chain ``test`` belongs to as the current test chain.
+
+        :return: The unique ID of the test or None if phases of its chain are still missing.
+        """
+        test_chain = get_test_chain(test.name, self.phase_pattern)
+        if not test_chain:
+            self.test_chain = [test]
+            return test.name
+        test_phases = self.pending_test_chains.setdefault(test_chain.name, {})
+        test_phases[test_chain.index] = test
+        if len(test_phases) < test_chain.length:
+            return None
+        self.test_chain = [test_phases[index] for index in sorted(test_phases)]
+        del self.pending_test_chains[test_chain.name]
+        return test_chain.name
+
+    def _set_itb_test_case_results(self, itb_test_case: TestCaseDetails) -> None:
         try:
             atomic_keywords = list(
                 self._get_keywords_by_type(itb_test_case.testSequence, KeywordType.Atomic)
@@ -178,13 +308,91 @@ class ResultWriter(ResultVisitor):
                 "to the given Robot Framework testcase."
             )
             raise e
-        self.itb_test_case_catalog[test_uid] = itb_test_case
-        self.protocol_test_cases.append(self.protocol_test_case)
-        write_test_structure_element(self.json_result, itb_test_case)
-        logger.debug(
-            f"Successfully wrote the result from test "
-            f"{itb_test_case.uniqueID} to TestBench's Json Report."
+
+    def _add_test_statistics(self, itb_test_case: TestCaseDetails, test: TestCase) -> None:
+        """Adds the test and its executed keywords to the history and the keyword analytics."""
+        if not self.history and not self.keyword_analytics:
+            return
+        executed_keywords = list(get_executed_keywords(itb_test_case))
+        if self.history:
+            self._add_test_to_history(itb_test_case, test, executed_keywords)
+        if self.keyword_analytics:
+            for path, keyword in executed_keywords:
+                self.keyword_analytics.add(
+                    path, keyword.exec.duration, keyword.exec.verdict == KeywordVerdict.Fail
+                )
+
+    def _add_test_to_history(
+        self,
+        itb_test_case: TestCaseDetails,
+        test: TestCase,
+        executed_keywords: list[tuple[str, KeywordCall]],
+    ) -> None:
+        self.history.add_test(
+            itb_test_case.uniqueID,
+            test.parent.metadata.get("uniqueID") if test.parent else None,
+            itb_test_case.exec.verdict.value,
+            itb_test_case.exec.actualDuration,
+            self.utc_timestamp_formatter.format(self.test_chain[0].start_time),
+            [
+                (path, keyword.sequenceID, keyword.exec.verdict.value, keyword.exec.duration)
+                for path, keyword in executed_keywords
+            ],
+        )
+
+    def _restore_written_test_case(self, test_uid: str):
+        if not self.protocol_only:
+            itb_test_case = TestBenchJsonReader(self.json_result).read_test_case(test_uid)
+            if itb_test_case is None:
+                return
+            self.itb_test_case_catalog[test_uid] = itb_test_case
+        self.protocol_test_cases.append(self.journal.tests[test_uid])
+        logger.debug(f"Skipping test {test_uid} written before.")
+
+    def _add_protocol_test_case(self, test_uid: str):
+        execution_key = self.json_reader.read_test_case_execution_key(test_uid)
+        if execution_key is None:
+            logger.warning(f"No JSON file corresponding to test '{test_uid}' found in report.")
+            return
+        if execution_key in ["", "-1"]:
+            logger.warning(
+                f"Test case {test_uid} was not exported based on "
+                f"execution and is therefore not importable."
+            )
+        self.protocol_test_case = TestCaseExecutionForImport(
+            test_uid, execution_key, None, None, None
         )
+        self.protocol_test_case.result = self._get_execution_result_for_import(
+            get_test_chain_status(self.test_chain)
+        )
+        self._set_protocol_execution_comment(
+            self._get_execution_comment(self.test_chain), self.test_chain
+        )
+        self.protocol_test_cases.append(self.protocol_test_case)
+        if self.journal:
+            self._journal_test(test_uid, self.protocol_test_case, [])
+
+    def _journal_test(
+        self,
+        test_uid: str,
+        protocol_test_case: TestCaseExecutionForImport,
+        references: list[ReferenceAssignment],
+    ) -> None:
+        self._unjournaled_tests.append((test_uid, protocol_test_case, references))
+        self._journal_stored_tests(wait=False)
+
+    def _journal_stored_tests(self, wait: bool) -> None:
+        """Journals the written tests in their order once their attachments are stored,
+        so a resumed fetch never restores references to attachments that were not copied.
+
+        :param wait: Waits for the attachments of all written tests.
+        """
+        while self._unjournaled_tests:
+            test_uid, protocol_test_case, references = self._unjournaled_tests[0]
+            if not self.artifact_storage.store_references(references, wait):
+                return
+            self.journal.add_test(test_uid, protocol_test_case, references)
+            self._unjournaled_tests.popleft()
 
     def _set_itb_testcase_references(
         self, itb_test_case: TestCaseDetails, test_chain: list[TestCase]
@@ -192,6 +400,9 @@ class ResultWriter(ResultVisitor):
         if not itb_test_case.exec:
             return
         for test in test_chain:
+            self.artifact_storage.output_xml = str(
+                self.test_sources.get(test.full_name, self.output_xml)
+            )
             reference_values = self._get_itb_reference_values(test.message)
             for reference_value in reference_values:
                 reference_key = self.artifact_storage.add_artifact(reference_value)
@@ -214,6 +425,11 @@ class ResultWriter(ResultVisitor):
         return attachement_path
 
     def _set_itb_testcase_execution_comment(self, itb_test_case, test_chain: list[TestCase]):
+        exec_comment = self._get_execution_comment(test_chain)
+        itb_test_case.exec.comments = exec_comment
+        self._set_protocol_execution_comment(exec_comment, test_chain)
+
+    def _get_execution_comment(self, test_chain: list[TestCase]) -> str:
         exec_comments = []
         for test in test_chain:
             message = re.sub(TB_ARTIFACT_REGEX, "", test.message)
@@ -232,40 +448,31 @@ class ResultWriter(ResultVisitor):
             exec_comment = (
                 f"{test_phase_name}"
                 "<pre>"
-                f"Start Time:   {self.get_isotime_from_robot_timestamp(test.starttime)}\n"
-                f"End Time:     {self.get_isotime_from_robot_timestamp(test.endtime)}\n"
+                f"Start Time:   {format_local_timestamp(test.start_time)}\n"
+                f"End Time:     {format_local_timestamp(test.end_time)}\n"
                 f"Elapsed Time: {timedelta(milliseconds=test.elapsedtime)!s}\n"
                 "</pre>"
                 f"Message: <p><pre>{html_message}</pre></p>\n"
             )
             exec_comments.append(exec_comment)
-        itb_test_case.exec.comments = f"{''.join(exec_comments)}"
-        self.protocol_test_case.comments = RichTextForImport(html=f"{''.join(exec_comments)}")
-        end_time = test.end_time.replace(
-            tzinfo=timezone(datetime.now(timezone.utc).astimezone().utcoffset())
-        )
-        # Isoformat currently not suported by server
-        # self.protocol_test_case.result.timestamp = end_time.isoformat()
-        self.protocol_test_case.result.timestamp = (
-            f"{end_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z"
+        return "".join(exec_comments)
+
+    def _set_protocol_execution_comment(self, exec_comment: str, test_chain: list[TestCase]):
+        test = test_chain[-1]
+        self.protocol_test_case.comments = RichTextForImport(html=exec_comment)
+        # Isoformat with offset currently not suported by server
+        self.protocol_test_case.result.timestamp = self.utc_timestamp_formatter.format(
+            test.end_time
         )
         self.protocol_test_case.durationMillis = test.elapsedtime
 
     def _set_itb_testcase_execution_result(self, itb_test_case: TestCaseDetails, test_chain):
-        has_failed_chain = list(filter(lambda tc: tc.status.upper() == "FAIL", test_chain))
-        passed_keywords = all(tc.status.upper() == "PASS" for tc in test_chain)
         elapsed_time = sum([tc.elapsedtime for tc in test_chain])
         itb_test_case.exec.actualDuration = elapsed_time
         self.protocol_test_case.durationMillis = elapsed_time
-        if has_failed_chain:
-            protocol_result = self._set_itb_test_case_status(itb_test_case, "fail")
-            self.protocol_test_case.result = protocol_result
-        elif passed_keywords:
-            protocol_result = self._set_itb_test_case_status(itb_test_case, "pass")
-            self.protocol_test_case.result = protocol_result
-        else:
-            protocol_result = self._set_itb_test_case_status(itb_test_case, "undef")
-            self.protocol_test_case.result = protocol_result
+        self.protocol_test_case.result = self._set_itb_test_case_status(
+            itb_test_case, get_test_chain_status(test_chain)
+        )
 
     def _get_test_phase_body(self, test_phase: TestCase) -> list[Keyword]:
         return self._get_keywords_from_rf_body(test_phase)
@@ -366,17 +573,11 @@ class ResultWriter(ResultVisitor):
         )
 
     def _get_keyword_exec_from_keyword(self, keyword: Keyword) -> KeywordCallExecution:
-        end_time = keyword.end_time.replace(
-            tzinfo=timezone(datetime.now(timezone.utc).astimezone().utcoffset())
-        )
-
         return from_dict(
             KeywordCallExecution,
             {
                 "verdict": self._get_keyword_result(keyword.status),
-                "time": (
-                    f"{end_time.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3]}Z"
-                ),
+                "time": self.utc_timestamp_formatter.format(keyword.end_time),
                 "duration": keyword.elapsedtime,
                 "comments": self.get_html_keyword_comment(keyword),
                 "currentUser": None,
@@ -400,23 +601,54 @@ class ResultWriter(ResultVisitor):
     def _get_keyword_messages(self, keyword: Keyword):
         if hasattr(keyword, "messages"):
             for message in keyword.messages:
-                yield self._create_itb_exec_comment(message)
+                if self._get_message_level(message) >= self.min_message_level:
+                    yield message
         if hasattr(keyword, "body"):
             for kw in keyword.body:
                 yield from self._get_keyword_messages(kw)
 
+    def _get_unique_keyword_messages(self, keyword: Keyword) -> list[str]:
+        """Collects the distinct messages of a keyword in their order, within the limits.
+
+        Messages are rendered one by one and the keyword is not traversed further once the
+        maximum number of messages or bytes is reached. A marker row is added in that case.
+        """
+        unique_messages: dict[str, None] = {}
+        message_bytes = 0
+        for message in self._get_keyword_messages(keyword):
+            msg = self._create_itb_exec_comment(message)
+            if msg in unique_messages:
+                continue
+            msg_bytes = len(msg.encode("utf-8"))
+            if (
+                0 < self.max_keyword_messages <= len(unique_messages)
+                or 0 < self.max_keyword_message_bytes < message_bytes + msg_bytes
+            ):
+                unique_messages[self._create_truncation_comment(len(unique_messages))] = None
+                break
+            unique_messages[msg] = None
+            message_bytes += msg_bytes
+        return list(unique_messages)
+
+    @staticmethod
+    def _get_message_level(message) -> int:
+        return MESSAGE_LEVELS.get(message.level, MESSAGE_LEVELS["INFO"])
+
+    @staticmethod
+    def _create_truncation_comment(message_count: int) -> str:
+        return (
+            f"<td colspan='3'><i>Further messages were omitted "
+            f"after {message_count} messages.</i></td>"
+        )
+
     def get_html_keyword_comment(self, keyword: Keyword):
-        messages = list(self._get_keyword_messages(keyword))
-        unique_messages = []
-        for msg in messages:
-            if msg not in unique_messages:
-                unique_messages.append(msg)
+        unique_messages = self._get_unique_keyword_messages(keyword)
         return (
             "<html>"
             "<body>"
             "<pre>"
-            f"Start Time:   {self.get_isotime_from_robot_timestamp(keyword.starttime)}\n"
-            f"End Time:     {self.get_isotime_from_robot_timestamp(keyword.endtime)}\n"
+            f"Start Time:   {format_local_timestamp(keyword.start_time)}\n"
+            f"End Time:     {format_local_timestamp(keyword.end_time)}\n"
             f"Elapsed Time: {timedelta(milliseconds=keyword.elapsedtime)!s}\n"
             "</pre>"
             "<table style='font-family: monospace; border: none; table-layout: auto;'>"
@@ -432,26 +664,13 @@ class ResultWriter(ResultVisitor):
         self,
         message,
     ) -> str:  # Todo: low prio: pattern für message in config festlegen
-        message_time = self.get_isotime_from_robot_timestamp(
-            message.timestamp, time_format="%H:%M:%S.%f"
-        )
+        message_time = format_local_time(message.timestamp)
         msg = message.html_message.replace("<hr>", "<br/>").replace("<br>", "<br/>").strip()
         return (
             f"<td {self.render_status(message.level)}><b>{message.level}</b></td>"
             f"<td><pre>{msg}</pre></td><td>{message_time}</td>"
         )
 
-    @staticmethod
-    def get_isotime_from_robot_timestamp(timestamp, time_format="%Y-%m-%d %H:%M:%S.%f"):
-        try:
-            return timestamp.astimezone().strftime(time_format)[:-3]
-        except AttributeError:
-            return (
-                datetime.strptime(timestamp, "%Y%m%d %H:%M:%S.%f")
-                .astimezone()
-                .strftime(time_format)[:-3]
-            )
-
     def _set_compound_keyword_execution_verdict(
         self, compound_keyword: KeywordCall, test_steps: list[KeywordCall]
     ):
@@ -486,25 +705,26 @@ class ResultWriter(ResultVisitor):
     def _set_itb_test_case_status(itb_test_case: TestCaseDetails, robot_status: str):
         if not itb_test_case.exec:
             return None
+        execution_result = ResultWriter._get_execution_result_for_import(robot_status)
+        itb_test_case.exec.status = execution_result.status
+        itb_test_case.exec.verdict = execution_result.verdict
+        return execution_result
+
+    @staticmethod
+    def _get_execution_result_for_import(robot_status: str) -> ExecutionResultForImport:
         robot_status = robot_status.lower()
         if robot_status == "pass":
-            itb_test_case.exec.status = ActivityStatus.Performed
-            itb_test_case.exec.verdict = VerdictStatus.Pass
             return ExecutionResultForImport(
                 status=ActivityStatus.Performed,
                 verdict=VerdictStatus.Pass,
                 execStatus=ExecStatus.NotBlocked,
             )
         if robot_status == "fail":
-            itb_test_case.exec.status = ActivityStatus.Performed
-            itb_test_case.exec.verdict = VerdictStatus.Fail
             return ExecutionResultForImport(
                 status=ActivityStatus.Performed,
                 verdict=VerdictStatus.Fail,
                 execStatus=ExecStatus.NotBlocked,
             )
-        itb_test_case.exec.status = ActivityStatus.Running
-        itb_test_case.exec.verdict = VerdictStatus.Undefined
         return ExecutionResultForImport(
             status=ActivityStatus.Running,
             verdict=VerdictStatus.Undefined,
@@ -527,43 +747,13 @@ class ResultWriter(ResultVisitor):
                 testcase.exec.status = current_itb_test_case.exec.status
                 testcase.exec.execStatus = current_itb_test_case.exec.execStatus
                 testcase.exec.comments = current_itb_test_case.exec.comments
-        suite_start_time = "99999999 00:00:00.000"
-        suite_end_time = "00000000 00:00:00.000"
-        table_content = []
-        for test in suite.tests:
-            suite_start_time = min(suite_start_time, test.starttime)
-            suite_end_time = max(suite_end_time, test.endtime)
-            test_chain = get_test_chain(test.name, self.phase_pattern)
-
-            if test_chain:
-                name = test_chain.name if test_chain.index == 1 else ""
-                phase = f"Phase {test_chain.index}/{test_chain.length}"
-            else:
-                name = test.name
-                phase = ""
-            if test.status != "PASS":
-                message = re.sub(TB_ARTIFACT_REGEX, "", test.message)
-                message = (
-                    message[len("*HTML*") :]
-                    .replace("<hr>", "<br />")
-                    .replace("<br>", "<br />")
-                    .strip()
-                    if message.startswith("*HTML*")
-                    else html.escape(message)
-                )
-            else:
-                message = self.get_isotime_from_robot_timestamp(test.endtime)
-            table_content.append(
-                f"<td>{name}</td>"
-                f"<td>{phase}</td>"
-                f"<td {self.render_status(test.status)}><b>{test.status}</b></td>"
-                f"<td><pre>{message}</pre></td>"
-            )
-
+        start_times = [test.start_time for test in suite.tests if test.start_time]
+        end_times = [test.end_time for test in suite.tests if test.end_time]
+        table_content = [self._get_test_table_row(test) for test in suite.tests]
         test_case_set.exec.comments = (
             "<pre>"
-            f"Start Time:   {self.get_isotime_from_robot_timestamp(suite_start_time)}\n"
-            f"End Time:     {self.get_isotime_from_robot_timestamp(suite_end_time)}\n"
+            f"Start Time:   {format_local_timestamp(min(start_times, default=None))}\n"
+            f"End Time:     {format_local_timestamp(max(end_times, default=None))}\n"
             "</pre>"
             "<table style='font-family: monospace; border: none; table-layout: auto;'>"
             "<tr>"
@@ -579,33 +769,48 @@ class ResultWriter(ResultVisitor):
             comments=RichTextForImport(html=test_case_set.exec.comments),
         )
         self.main_protocol.testCaseSets.append(self.protocol_test_case_set)
-        write_test_structure_element(self.json_result, test_case_set)
+        self._flush_suite(test_case_set)
         logger.debug(
             f"Successfully wrote the result from suite "
             f"{test_case_set.uniqueID} to TestBench's Json Report."
         )
-        if self.listener_uid:
-            self.write_listener_mode_protocols()
-
-    def write_listener_mode_protocols(self):
-        write_main_protocol(self.json_result, self.main_protocol.testCaseSets)
-        Path.mkdir(Path(self.json_result_path), parents=True)
-        shutil.copy(
-            Path(self.json_result) / "protocol.json",
-            Path(self.json_result_path) / "protocol.json",
-        )
-        shutil.copy(
-            Path(self.json_dir) / "project.json",
-            Path(self.json_result_path) / "project.json",
+
+    def _flush_suite(self, test_case_set: TestCaseSetDetails) -> None:
+        """Writes the test case set and persists the journal and history of its tests."""
+        if not self.protocol_only:
+            write_test_structure_element(self.json_result, test_case_set, self.json_indent)
+        if self.journal:
+            self._journal_stored_tests(wait=True)
+            self.journal.add_test_case_set(test_case_set.uniqueID, self.protocol_test_case_set)
+        if self.history:
+            self.history.commit()
+
+    def _get_test_table_row(self, test: TestCase) -> str:
+        test_chain = get_test_chain(test.name, self.phase_pattern)
+        if test_chain:
+            name = test_chain.name if test_chain.index == 1 else ""
+            phase = f"Phase {test_chain.index}/{test_chain.length}"
+        else:
+            name = test.name
+            phase = ""
+        if test.status != "PASS":
+            message = re.sub(TB_ARTIFACT_REGEX, "", test.message)
+            message = (
+                message[len("*HTML*") :]
+                .replace("<hr>", "<br />")
+                .replace("<br>", "<br />")
+                .strip()
+                if message.startswith("*HTML*")
+                else html.escape(message)
+            )
+        else:
+            message = format_local_timestamp(test.end_time)
+        return (
+            f"<td>{name}</td>"
+            f"<td>{phase}</td>"
+            f"<td {self.render_status(test.status)}><b>{test.status}</b></td>"
+            f"<td><pre>{message}</pre></td>"
         )
-        for filename in os.listdir(self.json_result):
-            if filename.startswith(self.listener_uid) and filename.endswith(".json"):
-                shutil.copy(
-                    Path(self.json_result) / filename,
-                    Path(self.json_result_path) / filename,
-                )
-        directory_to_zip(Path(self.json_result_path))
-        shutil.rmtree(Path(self.json_result_path))
 
     @staticmethod
     def render_status(status):
@@ -616,6 +821,7 @@ class ResultWriter(ResultVisitor):
         )
 
     def end_result(self, result):
+        self.artifact_storage.wait_for_attachments()
         tt_tree = self.json_reader.read_test_theme_tree()
         if tt_tree:
             test_suite_counter = 0
@@ -628,25 +834,47 @@ class ResultWriter(ResultVisitor):
                 tse.exec.verdict = execution_result["execution_verdict"]
                 tse.exec.status = execution_result["activity_status"]
                 test_suite_counter += 1
-            write_test_structure_element(self.json_result, tt_tree)
-            write_main_protocol(self.json_result, self.main_protocol.testCaseSets)
-            write_references(self.json_result, self.artifact_storage.tb_references)
-            if test_suite_counter and self.itb_test_case_catalog:
+            if not self.protocol_only:
+                write_test_structure_element(self.json_result, tt_tree, self.json_indent)
+            write_main_protocol(
+                self.json_result, self.main_protocol.testCaseSets, self.json_indent
+            )
+            if not self.protocol_only:
+                write_references(
+                    self.json_result, self.artifact_storage.tb_references, self.json_indent
+                )
+            if test_suite_counter and (
+                self.itb_test_case_catalog or self.main_protocol.testCaseSets
+            ):
                 logger.info(f"Successfully read {test_suite_counter} test suites.")
             else:
                 logger.warning("No test suites with execution information found.")
-            if self.create_zip:
-                directory_to_zip(Path(self.json_result), self.json_result_path)
-            elif self.json_result != self.json_result_path:
-                # if not self.create_zip:
-                copytree(self.json_dir, self.json_result_path, dirs_exist_ok=True)
-                copytree(self.json_result, self.json_result_path, dirs_exist_ok=True)
-            self.tempdir.cleanup()
+            self.report_output.finalize()
+            if self.keyword_analytics:
+                self._write_keyword_statistics()
+            self._cleanup_work_dir()
         logger.info(
             f"Successfully wrote the robot execution results to TestBench's Json Report: "
             f"'{Path(self.json_result_path).absolute()}{self.create_zip * '.zip'}'"
         )
 
+    def _write_keyword_statistics(self):
+        if not self.keyword_analytics.keywords:
+            logger.warning("No executed keywords found for the keyword statistics.")
+            return
+        self.keyword_analytics.write(Path(self.keyword_statistics_file))
+        logger.info(f"Slowest keywords:\n{self.keyword_analytics.format_summary()}")
+
+    def _cleanup_work_dir(self):
+        if self.journal:
+            self.journal.close()
+        if self.history:
+            self.history.close()
+        if self.tempdir is not None:
+            self.tempdir.cleanup()
+        else:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+
     @staticmethod
     def _get_execution_result(robot_status: str) -> dict:
         robot_status = robot_status.lower()
@@ -684,6 +912,35 @@ class TestChain:
         self.length = int(length)
 
 
+def get_keyword_paths(itb_test_case: TestCaseDetails) -> dict[str, str]:
+    """Returns the path of every keyword of a test case, e.g. ``RF.BuiltIn.Log``, by its key."""
+    return {
+        keyword.key: f"{keyword.path}.{keyword.name}" if keyword.path else keyword.name
+        for keyword in itb_test_case.keywords
+    }
+
+
+def get_executed_keywords(itb_test_case: TestCaseDetails):
+    """Yields the path and call of every atomic and compound keyword that passed or failed."""
+    keyword_paths = get_keyword_paths(itb_test_case)
+    for keyword in itb_test_case.testSequence:
+        if (
+            keyword.exec is None
+            or keyword.spec.keywordType not in (KeywordType.Atomic, KeywordType.Compound)
+            or keyword.exec.verdict not in (KeywordVerdict.Pass, KeywordVerdict.Fail)
+        ):
+            continue
+        yield keyword_paths.get(keyword.spec.keywordKey, keyword.spec.name), keyword
+
+
+def get_test_chain_status(test_chain: list[TestCase]) -> str:
+    if any(test.status.upper() == "FAIL" for test in test_chain):
+        return "fail"
+    if all(test.status.upper() == "PASS" for test in test_chain):
+        return "pass"
+    return "undef"
+
+
 def get_test_chain(test_name: str, phase_pattern: str) -> Optional[TestChain]:
     matcher = re.match(get_test_chain_pattern(phase_pattern), test_name)
     if matcher:
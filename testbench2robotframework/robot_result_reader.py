@@ -0,0 +1,242 @@
+import json
+import os
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from robot.api import ExecutionResult
+from robot.result import Result, ResultVisitor, TestCase, TestSuite
+from robot.result.suiteteardownfailed import SuiteTeardownFailed
+
+from .log import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+GLOB_CHARACTERS = "*?["
+JSON_RESULT_SUFFIX = ".json"
+PARALLEL_PARSE_MIN_SIZE = 16 * 1024 * 1024
+
+
+def get_robot_result_files(robot_results: Iterable) -> list[Path]:
+    """Expands glob patterns and returns the existing result files in the given order."""
+    result_files: list[Path] = []
+    for robot_result in robot_results:
+        pattern = str(robot_result)
+        if any(character in pattern for character in GLOB_CHARACTERS):
+            matches = _glob(pattern)
+            if not matches:
+                logger.warning(f"No Robot Framework result matches '{pattern}'.")
+            result_files.extend(matches)
+        else:
+            result_files.append(Path(robot_result))
+    return list(dict.fromkeys(result_files))
+
+
+def _glob(pattern: str) -> list[Path]:
+    parts = Path(pattern).parts
+    static_parts = 0
+    while not any(character in parts[static_parts] for character in GLOB_CHARACTERS):
+        static_parts += 1
+    base = Path(*parts[:static_parts]) if static_parts else Path()
+    return sorted(base.glob(str(Path(*parts[static_parts:]))))
+
+
+def read_robot_results(result_files: list[Path]) -> tuple[Result, dict[str, Path]]:
+    """Reads one or more Robot Framework results as one logical result.
+
+    Results of sharded runs (e.g. pabot) are combined by suite name, so a test case set
+    split across several files is visited as one suite. Several large output XML files
+    are parsed in parallel.
+    Tests existing in several files are taken from the last file.
+
+    :return: The combined result and the result file of every test by its full name.
+    """
+    if len(result_files) == 1:
+        result = read_robot_result(result_files[0])
+        return result, {test.full_name: result_files[0] for test in result.suite.all_tests}
+    suites = _read_suites(result_files)
+    test_sources_by_id = {
+        id(test): result_file
+        for suite, result_file in zip(suites, result_files)
+        for test in suite.all_tests
+    }
+    root_names = list(dict.fromkeys(suite.name for suite in suites))
+    if len(root_names) == 1:
+        root = suites[0]
+        for suite in suites[1:]:
+            merge_suites(root, suite)
+    else:
+        root = TestSuite(name=" & ".join(root_names))
+        merge_suites(root, TestSuite(name=root.name, suites=suites))
+    logger.debug(f"Combined {len(result_files)} Robot Framework results.")
+    test_sources = {test.full_name: test_sources_by_id[id(test)] for test in root.all_tests}
+    return Result(source=result_files[0], suite=root), test_sources
+
+
+def is_json_result(result_file: Path) -> bool:
+    return Path(result_file).suffix.lower() == JSON_RESULT_SUFFIX
+
+
+def load_json_result(result_file: Path) -> dict:
+    """Loads the raw data of a JSON result, using ``orjson`` if it is installed."""
+    with Path(result_file).open("rb") as json_file:
+        data = json_file.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_robot_result(result_file: Path) -> Result:
+    """Reads a Robot Framework result from an output XML or JSON file."""
+    if not is_json_result(result_file):
+        return ExecutionResult(str(result_file))
+    data = load_json_result(result_file)
+    result = Result(
+        source=result_file,
+        suite=TestSuite.from_dict(data),
+        rpa=data.get("rpa") or False,
+        generator=data.get("generator", "unknown"),
+    )
+    result.handle_suite_teardown_failures()
+    return result
+
+
+def _read_suites(result_files: list[Path]) -> list[TestSuite]:
+    """Reads the root suites of the result files.
+
+    Only large output XML files are parsed in worker processes, because their suites
+    have to be copied back to this process as dictionaries.
+    """
+    large_xml_files = [
+        str(result_file)
+        for result_file in result_files
+        if not is_json_result(result_file)
+        and Path(result_file).stat().st_size >= PARALLEL_PARSE_MIN_SIZE
+    ]
+    parsed_suites = {}
+    if len(large_xml_files) > 1:
+        max_workers = min(len(large_xml_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            suite_dicts = executor.map(_read_xml_suite_dict, large_xml_files)
+            parsed_suites = {
+                result_file: TestSuite.from_dict(suite_dict)
+                for result_file, suite_dict in zip(large_xml_files, suite_dicts)
+            }
+    return [
+        parsed_suites[str(result_file)]
+        if str(result_file) in parsed_suites
+        else read_robot_result(result_file).suite
+        for result_file in result_files
+    ]
+
+
+def _read_xml_suite_dict(result_file: str) -> dict:
+    return ExecutionResult(result_file).suite.to_dict()
+
+
+def visit_json_result_by_suite(result_file: Path, visitor: ResultVisitor) -> None:
+    """Visits a JSON result while building the result model one suite at a time.
+
+    The JSON file is decoded completely, but only the suite currently visited is built
+    as result model. Keywords of visited tests are released, statuses and messages are kept.
+    """
+    data = load_json_result(result_file)
+    suite_data = data.get("suite", data)
+    root_parts = _create_suite(suite_data)
+    result = Result(
+        source=result_file,
+        suite=root_parts[0],
+        rpa=data.get("rpa") or False,
+        generator=data.get("generator", "unknown"),
+    )
+    visitor.start_result(result)
+    _visit_suite(root_parts, visitor, [], result.generated_by_robot)
+    visitor.end_result(result)
+
+
+def _create_suite(suite_data: dict) -> tuple[TestSuite, list[dict], list[dict]]:
+    child_suites = suite_data.pop("suites", [])
+    tests = suite_data.pop("tests", [])
+    return TestSuite.from_dict(suite_data), child_suites, tests
+
+
+def _visit_suite(
+    suite_parts: tuple[TestSuite, list[dict], list[dict]],
+    visitor: ResultVisitor,
+    failed_teardowns: list[SuiteTeardownFailed],
+    generated_by_robot: bool,
+) -> None:
+    suite, child_suites, tests = suite_parts
+    teardown_failure = _get_teardown_failure(suite) if generated_by_robot else None
+    if teardown_failure is not None:
+        failed_teardowns = [teardown_failure, *failed_teardowns]
+    if visitor.start_suite(suite) is False:
+        return
+    if suite.has_setup:
+        suite.setup.visit(visitor)
+    child_suites.reverse()
+    while child_suites:
+        child_parts = _create_suite(child_suites.pop())
+        suite.suites.append(child_parts[0])
+        _visit_suite(child_parts, visitor, failed_teardowns, generated_by_robot)
+    for test_data in tests:
+        test = suite.tests.append(TestCase.from_dict(test_data))
+        for teardown_failed in failed_teardowns:
+            test.visit(teardown_failed)
+    tests.clear()
+    for test in suite.tests:
+        test.visit(visitor)
+    if suite.has_teardown:
+        suite.teardown.visit(visitor)
+    visitor.end_suite(suite)
+    for test in suite.tests:
+        test.body.clear()
+        test.setup = None
+        test.teardown = None
+
+
+def _get_teardown_failure(suite: TestSuite) -> Optional[SuiteTeardownFailed]:
+    if not suite.has_teardown:
+        return None
+    if suite.teardown.failed:
+        return SuiteTeardownFailed(suite.teardown.message)
+    if suite.teardown.skipped:
+        return SuiteTeardownFailed(suite.teardown.message, skipped=True)
+    return None
+
+
+def merge_suites(target: TestSuite, source: TestSuite) -> None:
+    """Adds the child suites and tests of ``source`` to ``target``, matching them by name."""
+    child_suites = {suite.name: suite for suite in target.suites}
+    for suite in list(source.suites):
+        existing_suite = child_suites.get(suite.name)
+        if existing_suite is None:
+            target.suites.append(suite)
+            child_suites[suite.name] = suite
+        else:
+            merge_suites(existing_suite, suite)
+    test_indices = {test.name: index for index, test in enumerate(target.tests)}
+    for test in list(source.tests):
+        index = test_indices.get(test.name)
+        if index is None:
+            target.tests.append(test)
+            test_indices[test.name] = len(target.tests) - 1
+        else:
+            target.tests[index] = test
+    if not target.has_setup and source.has_setup:
+        target.setup = source.setup
+    if not target.has_teardown and source.has_teardown:
+        target.teardown = source.teardown
+    _merge_times(target, source)
+
+
+def _merge_times(target: TestSuite, source: TestSuite) -> None:
+    start_times = [time for time in (target.start_time, source.start_time) if time]
+    end_times = [time for time in (target.end_time, source.end_time) if time]
+    target.start_time = min(start_times) if start_times else None
+    target.end_time = max(end_times) if end_times else None
+    target.elapsed_time = None
@@ -1,29 +1,57 @@
 import sys
 from pathlib import Path
-from typing import Optional
-
-from robot.api import ExecutionResult
+from typing import Optional, Union
 
 from .config import Configuration
 from .log import logger, setup_logger
 from .result_writer import ResultWriter
+from .robot_result_reader import (
+    get_robot_result_files,
+    is_json_result,
+    read_robot_results,
+    visit_json_result_by_suite,
+)
 
 
 def robot2testbench(
     json_input_report: str,
-    robot_result_xml: str,
+    robot_result_xml: Union[str, Path, list],
     json_output_result: Optional[str] = None,
     config: Optional[dict] = None,
 ):
     if not Path(json_input_report).exists():
         sys.exit("Could not find json directory or zip file at the given path.")
-    if not Path(robot_result_xml).exists():
-        sys.exit("Robot result xml does not exist at the given path.")
     configuration = Configuration.from_dict(config)
     setup_logger(configuration)
     logger.debug("Configuration loaded.")
-    result = ExecutionResult(robot_result_xml)
-    logger.debug("Robot framework result xml loaded.")
+    robot_results = (
+        [robot_result_xml] if isinstance(robot_result_xml, (str, Path)) else robot_result_xml
+    )
+    result_files = get_robot_result_files(robot_results)
+    if not result_files:
+        sys.exit("No Robot result found at the given paths.")
+    for result_file in result_files:
+        if not result_file.exists():
+            sys.exit(f"Robot result does not exist at the given path '{result_file}'.")
+    if configuration.stream_results:
+        if len(result_files) == 1 and is_json_result(result_files[0]):
+            result_writer = ResultWriter(
+                json_input_report,
+                json_output_result,
+                configuration,
+                str(result_files[0]),
+            )
+            visit_json_result_by_suite(result_files[0], result_writer)
+            return
+        logger.warning("Streaming is only supported for a single JSON result file.")
+    result, test_sources = read_robot_results(result_files)
+    logger.debug("Robot framework result loaded.")
     result.visit(
-        ResultWriter(json_input_report, json_output_result, configuration, robot_result_xml)
+        ResultWriter(
+            json_input_report,
+            json_output_result,
+            configuration,
+            str(result_files[0]),
+            test_sources=test_sources,
+        )
     )
@@ -0,0 +1,52 @@
+from pathlib import Path
+from typing import Optional
+
+from robot.result import Result
+
+from .config import Configuration
+from .json_suite_write import create_running_test_suite
+from .listener import TestBenchListener
+from .log import logger, setup_logger
+from .testbench2robotframework import create_test_suites_from_report
+from .testsuite_write import get_generation_directory
+
+
+def run_tests(
+    testbench_report: str,
+    config: dict,
+    json_result: Optional[str] = None,
+    fetch_results: bool = True,
+    **robot_options,
+) -> Optional[Result]:
+    """Runs the test suites of a TestBench report without writing test suite files.
+
+    The executable suites are built in memory from the test case sets of the report.
+    With ``fetch_results``, the results are written to the TestBench report during the
+    execution, so no output XML has to be read afterwards.
+
+    :param testbench_report: TestBench JSON report (directory or ZIP).
+    :param config: Configuration of TestBench2RobotFramework.
+    :param json_result: Directory or ZIP file the report with results is written to.
+        Without it the input report is updated.
+    :param fetch_results: Writes the results to the TestBench report.
+    :param robot_options: Options for the Robot Framework execution,
+        e.g. ``outputdir``, ``include`` or ``variable``.
+    :return: The Robot Framework result or None if the report contains no test suites.
+    """
+    configuration = Configuration.from_dict(config)
+    setup_logger(configuration)
+    logger.debug("Configuration loaded.")
+    test_suites = create_test_suites_from_report(Path(testbench_report), configuration)
+    if not test_suites:
+        logger.warning("There are no test suites in the exported TestBench Projekt.")
+        return None
+    generation_directory = get_generation_directory(configuration.output_directory)
+    suite = create_running_test_suite(test_suites, generation_directory.resolve())
+    logger.info(f"Running {suite.test_count} tests of {len(test_suites)} test suites.")
+    if fetch_results:
+        listeners = robot_options.get("listener", [])
+        robot_options["listener"] = [
+            *([listeners] if isinstance(listeners, str) else listeners),
+            TestBenchListener(str(testbench_report), json_result, configuration),
+        ]
+    return suite.run(**robot_options)
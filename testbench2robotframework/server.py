@@ -0,0 +1,224 @@
+import hmac
+import json
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+from .config import DEFAULT_SERVER_CACHE_SIZE, Configuration, get_tb2robot_file_configuration
+from .jobs import FETCH_JOB, GENERATE_JOB, init_worker, run_job
+from .log import logger, setup_logger
+
+REQUIRED_JOB_KEYS = {GENERATE_JOB: ("report",), FETCH_JOB: ("report", "results")}
+FORBIDDEN_JOB_OPTIONS = ("clean", "file-logging")
+LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "::1")
+WILDCARD_HOSTS = ("", "0.0.0.0", "::")
+JSON_CONTENT_TYPE = "application/json"
+
+
+def get_allowed_hosts(host: str) -> set[str]:
+    """Returns the host names requests to a server listening on ``host`` may be sent to.
+
+    Requests to other names, e.g. of a DNS rebinding page, are rejected.
+    """
+    if host in WILDCARD_HOSTS:
+        return {*LOOPBACK_HOSTS, socket.gethostname().lower(), socket.getfqdn().lower()}
+    if host in LOOPBACK_HOSTS:
+        return set(LOOPBACK_HOSTS)
+    return {host.lower()}
+
+
+@dataclass
+class ServerSettings:
+    """Settings of a job server.
+
+    :param workers: Number of worker processes. Defaults to the number of CPUs.
+    :param cache_size: Number of reports and configurations every worker keeps.
+    :param default_config: Configuration file of jobs without a ``config``.
+    :param token: Token requests must send as ``Authorization: Bearer <token>``.
+    :param output_root: Directory jobs may write to. Defaults to the working directory.
+    """
+
+    workers: Optional[int] = None
+    cache_size: int = DEFAULT_SERVER_CACHE_SIZE
+    default_config: Optional[str] = None
+    token: Optional[str] = None
+    output_root: Optional[Path] = None
+
+
+class JobServer(ThreadingHTTPServer):
+    """HTTP server passing generate and fetch jobs to a pool of worker processes.
+
+    Every worker keeps the modules, reports and configurations of its former jobs,
+    so later jobs neither start Python nor import and decode the same files again.
+    Requests must be addressed to the host the server listens on and, if a ``token``
+    is given, authorize with it. Jobs may only write inside ``output_root``, which
+    defaults to the working directory.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], settings: Optional[ServerSettings] = None):
+        super().__init__(address, JobRequestHandler)
+        settings = settings or ServerSettings()
+        self.allowed_hosts = get_allowed_hosts(address[0])
+        self.token = settings.token
+        self.output_root = Path(settings.output_root or Path.cwd()).resolve()
+        self.workers = settings.workers or os.cpu_count() or 1
+        self.cache_size = settings.cache_size
+        self.default_config = settings.default_config
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(self.cache_size,)
+        )
+        # Starts the workers before requests are handled in threads.
+        for _ in range(self.workers):
+            self.executor.submit(int)
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown()
+
+
+def get_job_error(job_type: str, job) -> Optional[tuple[HTTPStatus, dict]]:
+    """Returns the status and error of an invalid job or None for a valid job."""
+    if not isinstance(job, dict) or not isinstance(job.get("options", {}), dict):
+        return HTTPStatus.BAD_REQUEST, {"error": "Jobs must be JSON objects."}
+    missing_keys = [key for key in REQUIRED_JOB_KEYS[job_type] if key not in job]
+    if missing_keys:
+        return HTTPStatus.BAD_REQUEST, {"error": f"Missing job keys: {', '.join(missing_keys)}."}
+    forbidden_options = [key for key in FORBIDDEN_JOB_OPTIONS if key in job.get("options", {})]
+    if forbidden_options:
+        return HTTPStatus.FORBIDDEN, {"error": f"Jobs cannot set {', '.join(forbidden_options)}."}
+    return None
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    server: JobServer
+
+    def check_request(self) -> bool:
+        """Answers requests to a wrong host or without the token with an error."""
+        try:
+            host = urlsplit(f"//{self.headers.get('Host', '')}")
+            port = host.port
+        except ValueError:
+            host, port = None, None
+        if (
+            host is None
+            or (host.hostname or "").lower() not in self.server.allowed_hosts
+            or port not in (None, self.server.server_port)
+        ):
+            self.send_json(
+                HTTPStatus.FORBIDDEN, {"error": f"Invalid host '{self.headers.get('Host')}'."}
+            )
+            return False
+        if self.server.token and not hmac.compare_digest(
+            self.headers.get("Authorization", "").encode("utf-8"),
+            f"Bearer {self.server.token}".encode(),
+        ):
+            self.send_json(HTTPStatus.UNAUTHORIZED, {"error": "Invalid or missing token."})
+            return False
+        return True
+
+    def do_GET(self):
+        if not self.check_request():
+            return
+        if self.path.strip("/") != "status":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{self.path}'."})
+            return
+        self.send_json(
+            HTTPStatus.OK,
+            {"workers": self.server.workers, "cacheSize": self.server.cache_size},
+        )
+
+    def do_POST(self):
+        job_type = self.path.strip("/")
+        routes = {GENERATE_JOB: self.post_generate, FETCH_JOB: self.post_fetch}
+        handler = routes.get(job_type)
+        if handler is None:
+            self.send_json(
+                HTTPStatus.NOT_FOUND,
+                {"error": f"Unknown job '{job_type}'. Use /{GENERATE_JOB} or /{FETCH_JOB}."},
+            )
+            return
+        if self.check_request():
+            handler()
+
+    def post_generate(self) -> None:
+        self.handle_job(GENERATE_JOB)
+
+    def post_fetch(self) -> None:
+        self.handle_job(FETCH_JOB)
+
+    def handle_job(self, job_type: str) -> None:
+        job = self.read_job(job_type)
+        if job is None:
+            return
+        if self.server.default_config:
+            job.setdefault("config", self.server.default_config)
+        try:
+            result = self.server.executor.submit(
+                run_job, job_type, job, str(self.server.output_root)
+            ).result()
+        except PermissionError as error:
+            logger.error(f"{job_type} job rejected: {error}")
+            self.send_json(HTTPStatus.FORBIDDEN, {"error": str(error)})
+            return
+        except (Exception, SystemExit) as error:
+            logger.error(f"{job_type} job failed: {error}")
+            self.send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(error) or type(error).__name__}
+            )
+            return
+        logger.info(f"{job_type} job of '{job['report']}' finished in {result['duration']} s.")
+        self.send_json(HTTPStatus.OK, result)
+
+    def read_job(self, job_type: str) -> Optional[dict]:
+        """Returns the posted job or answers an invalid job with an error and returns None."""
+        content_type = self.headers.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type != JSON_CONTENT_TYPE:
+            self.send_json(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                {"error": f"Jobs must be posted as '{JSON_CONTENT_TYPE}'."},
+            )
+            return None
+        try:
+            job = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "{}")
+        except ValueError as error:
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {error}"})
+            return None
+        error = get_job_error(job_type, job)
+        if error is not None:
+            self.send_json(*error)
+            return None
+        return job
+
+    def send_json(self, status: HTTPStatus, data: dict) -> None:
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+def serve(host: str, port: int, settings: Optional[ServerSettings] = None) -> None:
+    """Serves generate and fetch jobs until the process is interrupted."""
+    settings = settings or ServerSettings()
+    setup_logger(Configuration.from_dict(get_tb2robot_file_configuration(settings.default_config)))
+    with JobServer((host, port), settings) as server:
+        logger.info(f"Serving generate and fetch jobs on http://{host}:{server.server_port}")
+        logger.info(f"Jobs write inside '{server.output_root}'.")
+        if not settings.token:
+            logger.warning("No token is set, so every local process can submit jobs.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Server stopped.")
@@ -0,0 +1,130 @@
+import heapq
+from dataclasses import replace
+from pathlib import Path, PurePath
+
+from robot.parsing.model.blocks import File
+
+from .config import Configuration, ShardFormat
+from .json_reader import TestCaseSet
+from .log import logger
+from .ordering import (
+    get_expected_durations,
+    get_ordering_file,
+    get_root_directory,
+    get_suite_long_name,
+    write_pabot_ordering,
+)
+from .testsuite_write import (
+    INIT_FILE_NAME,
+    clear_generation_directory,
+    get_generation_directory,
+    write_test_suites,
+)
+
+SHARD_DIRECTORY_PREFIX = "Shard_"
+
+
+def partition_by_duration(durations: dict[str, float], shards: int) -> list[list[str]]:
+    """Partitions UIDs into ``shards`` groups of similar total duration.
+
+    Uses the longest processing time heuristic: starting with the longest one, every UID
+    is added to the group with the smallest total duration. Groups list their longest
+    UIDs first.
+    """
+    groups: list[list[str]] = [[] for _ in range(shards)]
+    loads = [(0.0, index) for index in range(shards)]
+    for uid in sorted(durations, key=lambda uid: durations[uid], reverse=True):
+        load, index = heapq.heappop(loads)
+        groups[index].append(uid)
+        heapq.heappush(loads, (load + durations[uid], index))
+    return groups
+
+
+def get_shard_test_suites(test_suites: dict[str, File], uids: list[str]) -> dict[str, File]:
+    """Returns the test suites of ``uids`` and the ``__init__`` files of their directories."""
+    init_files = {
+        PurePath(test_suite.source).parent: uid
+        for uid, test_suite in test_suites.items()
+        if PurePath(test_suite.source).name == INIT_FILE_NAME
+    }
+    shard_test_suites = {uid: test_suites[uid] for uid in uids}
+    for uid in uids:
+        for directory in PurePath(test_suites[uid].source).parents:
+            if directory in init_files:
+                init_uid = init_files[directory]
+                shard_test_suites[init_uid] = test_suites[init_uid]
+    return shard_test_suites
+
+
+def get_shard_ordering_item(suite_names: list[str]) -> list[str]:
+    """Returns a pabot ordering group running the suites of a shard in one process."""
+    lines = [f"--suite {name}" for name in suite_names]
+    return ["{", *lines, "}"] if len(lines) > 1 else lines
+
+
+def get_shard_directory(generation_directory: Path, number: int) -> Path:
+    shard_name = f"{SHARD_DIRECTORY_PREFIX}{number}{generation_directory.suffix.lower()}"
+    return get_root_directory(generation_directory) / shard_name
+
+
+def write_sharded_test_suites(
+    test_suites: dict[str, File],
+    test_case_set_catalog: dict[str, TestCaseSet],
+    configuration: Configuration,
+) -> None:
+    """Distributes the test case sets to ``configuration.shards`` shards of similar duration.
+
+    Durations are the expected durations of :func:`get_expected_durations`.
+    With ``ShardFormat.DIRECTORIES``, every shard is written to an own ``Shard_<n>``
+    directory of the output directory. With ``ShardFormat.PABOT``, all test suites are
+    written to the output directory and a pabot ordering file with one group per shard
+    is written next to it.
+    """
+    generation_directory = get_generation_directory(configuration.output_directory)
+    durations = {
+        uid: sum(test_durations.values())
+        for uid, test_durations in get_expected_durations(
+            test_suites, test_case_set_catalog, configuration
+        ).items()
+    }
+    shards = [uids for uids in partition_by_duration(durations, configuration.shards) if uids]
+    if len(shards) < configuration.shards:
+        logger.warning(
+            f"There are only {len(shards)} test case sets for {configuration.shards} shards."
+        )
+    for number, uids in enumerate(shards, start=1):
+        logger.info(
+            f"Shard {number}: {len(uids)} test case sets with an expected duration of "
+            f"{sum(durations[uid] for uid in uids) / 1000:.1f} s."
+        )
+    if configuration.shard_format == ShardFormat.PABOT:
+        # The names are taken before writing, because writing changes the sources of the suites.
+        items = [
+            get_shard_ordering_item(
+                [get_suite_long_name(test_suites[uid].source, generation_directory) for uid in uids]
+            )
+            for uids in shards
+        ]
+        write_test_suites(test_suites, configuration)
+        write_pabot_ordering(items, get_ordering_file(generation_directory))
+        return
+    if configuration.clean:
+        clear_generation_directory(
+            get_root_directory(generation_directory), configuration.output_format
+        )
+    # Writing changes the sources of the test suites, but __init__ files are written to
+    # every shard containing their directory.
+    sources = {uid: test_suite.source for uid, test_suite in test_suites.items()}
+    shard_test_suites_list = [get_shard_test_suites(test_suites, uids) for uids in shards]
+    for number, shard_test_suites in enumerate(shard_test_suites_list, start=1):
+        for uid, test_suite in shard_test_suites.items():
+            test_suite.source = sources[uid]
+        write_test_suites(
+            shard_test_suites,
+            replace(
+                configuration,
+                clean=False,
+                output_directory=str(get_shard_directory(generation_directory, number)),
+            ),
+        )
+
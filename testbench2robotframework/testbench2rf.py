@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path, PurePath
 from uuid import uuid4
 
@@ -77,6 +78,7 @@ LINE_SEPARATOR = [EmptyLine.from_params()]
 UNKNOWN_IMPORT_TYPE = str(uuid4())
 LIBRARY_IMPORT_TYPE = str(uuid4())
 RESOURCE_IMPORT_TYPE = str(uuid4())
+KEYWORD_IMPORT_CACHE_SIZE = 4096
 
 
 @dataclass
@@ -90,6 +92,44 @@ class RFKeywordCallInformation:
     import_prefix: str | None = None
 
 
+@lru_cache(maxsize=KEYWORD_IMPORT_CACHE_SIZE)
+def get_keyword_import(
+    keyword_path: str,
+    library_regex: tuple[str, ...],
+    resource_regex: tuple[str, ...],
+    library_root: tuple[str, ...],
+) -> tuple[str, str]:
+    """Returns the import type and the library name or resource path of a keyword path.
+
+    Results are cached for all test cases and reports of a process that are generated
+    with the same import configuration, because most keywords are called many times.
+    """
+    for pattern in library_regex:
+        match = re.search(pattern, keyword_path)
+        if match:
+            return LIBRARY_IMPORT_TYPE, match.group("resourceName").strip()
+    for pattern in resource_regex:
+        if re.search(pattern, keyword_path):
+            return RESOURCE_IMPORT_TYPE, keyword_path
+    splitted_keyword_path = keyword_path.split(".")
+    minimum_length_subdivision_path_length = 2
+    if (
+        len(splitted_keyword_path) == minimum_length_subdivision_path_length
+        and splitted_keyword_path[0] in library_root
+    ):
+        return LIBRARY_IMPORT_TYPE, splitted_keyword_path[1]
+    return UNKNOWN_IMPORT_TYPE, keyword_path
+
+
+@lru_cache(maxsize=KEYWORD_IMPORT_CACHE_SIZE)
+def get_resource_name(resource_path: str, resource_regex: tuple[str, ...]) -> str | None:
+    for pattern in resource_regex:
+        resource_name_match = re.search(pattern, resource_path, flags=re.IGNORECASE)
+        if resource_name_match:
+            return resource_name_match.group("resourceName").strip()
+    return None
+
+
 class RfTestCase:
     def __init__(self, test_case_details: TestCaseDetails, config: Configuration) -> None:
         self.test_case_details: TestCaseDetails = test_case_details
@@ -97,8 +137,6 @@ class RfTestCase:
         self.rf_keyword_call_information: list[RFKeywordCallInformation] = []
         self.used_imports: dict[str, set[str]] = {}
         self.config = config
-        self.lib_pattern_list = [re.compile(pattern) for pattern in config.library_regex]
-        self.res_pattern_list = [re.compile(pattern) for pattern in config.resource_regex]
         for keyword in test_case_details.testSequence:
             self._get_keyword_call(keyword)
         self.rf_tags = self._get_tags(test_case_details)
@@ -194,22 +232,12 @@ class RfTestCase:
     def _get_keyword_import(
         self, test_step: TBKeywordCall, keyword_path: str
     ) -> tuple[str, str]:
-        for pattern in self.lib_pattern_list:
-            match = pattern.search(keyword_path)
-            if match:
-                return LIBRARY_IMPORT_TYPE, match.group("resourceName").strip()
-        for pattern in self.res_pattern_list:
-            match = pattern.search(keyword_path)
-            if match:
-                return RESOURCE_IMPORT_TYPE, keyword_path
-        splitted_keyword_path = keyword_path.split(".")
-        minimum_length_subdivision_path_length = 2
-        if (
-            len(splitted_keyword_path) == minimum_length_subdivision_path_length
-            and splitted_keyword_path[0] in self.config.library_root
-        ):
-            return LIBRARY_IMPORT_TYPE, splitted_keyword_path[1]
-        return UNKNOWN_IMPORT_TYPE, keyword_path
+        return get_keyword_import(
+            keyword_path,
+            tuple(self.config.library_regex),
+            tuple(self.config.resource_regex),
+            tuple(self.config.library_root),
+        )
 
     def _append_compound_ia(
         self,
@@ -460,17 +488,10 @@ class RfTestCase:
         return cbr_parameters
 
     def _get_keyword_import_prefix(self, keyword: RFKeywordCallInformation) -> str:
-        for resource_regex in self.config.resource_regex:
-            if not keyword.import_prefix:
-                continue
-            resource_name_match = re.search(
-                resource_regex, keyword.import_prefix, flags=re.IGNORECASE
-            )
-            if resource_name_match:
-                return (
-                    self.config.fully_qualified or False
-                ) * f"{resource_name_match.group('resourceName').strip()}."
-        return ""
+        if not keyword.import_prefix or not self.config.fully_qualified:
+            return ""
+        resource_name = get_resource_name(keyword.import_prefix, tuple(self.config.resource_regex))
+        return f"{resource_name}." if resource_name else ""
 
     def _get_keyword_indent(self, keyword: RFKeywordCallInformation) -> str:
         return (
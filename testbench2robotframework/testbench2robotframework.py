@@ -1,20 +1,48 @@
+from __future__ import annotations
+
 import sys
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .config import Configuration
-from .json_reader import TestBenchJsonReader
 from .log import logger, setup_logger
-from .testbench2rf import create_test_suites
-from .testsuite_write import write_test_suites
-from .utils import PathResolver, extract_to_working_directory, is_zip_file
+
+if TYPE_CHECKING:
+    from robot.parsing.model.blocks import File
+
+    from .json_reader import TestCaseSet
+    from .model import TestStructureTree
 
 
 def testbench2robotframework(testbench_report: str, config: dict):
     configuration = Configuration.from_dict(config)
     setup_logger(configuration)
     logger.debug("Configuration loaded.")
-    testbench_report = Path(testbench_report)
+    test_theme_tree, test_case_set_catalog = read_report_model(Path(testbench_report))
+    test_suites = create_test_suites_from_model(
+        test_theme_tree, test_case_set_catalog, configuration
+    )
+    if not test_suites:
+        logger.warning("There are no test suites in the exported TestBench Projekt.")
+        return
+    write_generated_test_suites(test_suites, test_case_set_catalog, configuration)
+
+
+def create_test_suites_from_report(
+    testbench_report: Path, configuration: Configuration
+) -> dict[str, File]:
+    test_theme_tree, test_case_set_catalog = read_report_model(testbench_report)
+    return create_test_suites_from_model(test_theme_tree, test_case_set_catalog, configuration)
+
+
+def read_report_model(
+    testbench_report: Path,
+) -> tuple[TestStructureTree, dict[str, TestCaseSet]]:
+    """Reads the test theme tree and the test case sets of a report directory or ZIP file."""
+    from .json_reader import TestBenchJsonReader
+    from .utils import extract_to_working_directory, is_zip_file
+
     temp_dir = None
     try:
         if is_zip_file(testbench_report):
@@ -29,19 +57,50 @@ def testbench2robotframework(testbench_report: str, config: dict):
                 f" is neither ZIP nor directory."
             )
         reader = TestBenchJsonReader(Path(working_dir))
-        path_resolver = PathResolver(
-            reader.test_theme_tree,
-            tuple(reader.get_test_case_set_catalog().keys()),
-            configuration.log_suite_numbering,
-        )
-        test_suites = create_test_suites(
-            reader.get_test_case_set_catalog(), path_resolver, configuration
-        )
-        if not test_suites:
-            logger.warning("There are no test suites in the exported TestBench Projekt.")
-            return
-        write_test_suites(test_suites, configuration)
-    except Exception as exception:
+        return reader.test_theme_tree, reader.get_test_case_set_catalog()
+    finally:
         if temp_dir is not None:
             temp_dir.cleanup()
-        raise exception
+
+
+def create_test_suites_from_model(
+    test_theme_tree: TestStructureTree,
+    test_case_set_catalog: dict[str, TestCaseSet],
+    configuration: Configuration,
+) -> dict[str, File]:
+    """Creates the test suites of the test case sets read by :func:`read_report_model`.
+
+    The test theme tree and the test case sets are not modified, so they can be reused
+    for several generations.
+    """
+    from .testbench2rf import create_test_suites
+    from .utils import PathResolver
+
+    path_resolver = PathResolver(
+        test_theme_tree, tuple(test_case_set_catalog), configuration.log_suite_numbering
+    )
+    return create_test_suites(test_case_set_catalog, path_resolver, configuration)
+
+
+def write_generated_test_suites(
+    test_suites: dict[str, File],
+    test_case_set_catalog: dict[str, TestCaseSet],
+    configuration: Configuration,
+) -> None:
+    """Writes the test suites to the output directory or to shards of similar duration,
+    optionally with a pabot ordering file.
+    """
+    # Imported here, so the package and the CLI can be imported without Robot Framework's parser.
+    if configuration.shards > 1:
+        from .shards import write_sharded_test_suites
+
+        write_sharded_test_suites(test_suites, test_case_set_catalog, configuration)
+        return
+    if configuration.pabot_ordering:
+        from .ordering import write_ordered_test_suites
+
+        write_ordered_test_suites(test_suites, test_case_set_catalog, configuration)
+        return
+    from .testsuite_write import write_test_suites
+
+    write_test_suites(test_suites, configuration)
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import os
 import re
 import shutil
@@ -6,21 +8,35 @@ from pathlib import Path
 
 from robot.parsing.model.blocks import File
 
-from .config import Configuration
+from .config import Configuration, OutputFormat
 from .log import logger
 from .utils import directory_to_zip
 
+INIT_FILE_NAME = "__init__"
+ROBOT_FILE_SUFFIX = ".robot"
+JSON_SUITE_SUFFIX = ".rbt"
+
 
 def write_test_suites(test_suites: dict[str, File], config: Configuration) -> None:
     generation_directory = get_generation_directory(config.output_directory)
     if config.clean:
-        clear_generation_directory(generation_directory)
-    if generation_directory.suffix.lower() != ".zip":
+        clear_generation_directory(generation_directory, config.output_format)
+    if config.output_format == OutputFormat.JSON:
+        from .json_suite_write import write_json_test_suite
+
+        write_json_test_suite(test_suites, generation_directory)
+    elif generation_directory.suffix.lower() != ".zip":
         write_test_suite_files(test_suites, generation_directory)
     else:
         with tempfile.TemporaryDirectory(dir=Path.cwd()) as temp_dir:
             write_test_suite_files(test_suites, Path(temp_dir))
             directory_to_zip(temp_dir, generation_directory.with_suffix(""))
+    if config.output_format == OutputFormat.JSON:
+        logger.info(
+            f"Successfully generated {len(test_suites)} Robot Framework Testsuite "
+            f"in the following file: {get_json_suite_file(generation_directory).resolve()!s}"
+        )
+        return
     logger.info(
         f"Successfully generated {len(test_suites)} Robot Framework Testsuite "
         f"in the following directory: {Path(generation_directory).resolve()!s}"
@@ -41,7 +57,12 @@ def get_generation_directory(generation_directory: str) -> Path:
     )
 
 
-def clear_generation_directory(generation_dir: Path) -> None:
+def clear_generation_directory(
+    generation_dir: Path, output_format: OutputFormat = OutputFormat.ROBOT
+) -> None:
+    if output_format == OutputFormat.JSON:
+        get_json_suite_file(generation_dir).unlink(missing_ok=True)
+        return
     if generation_dir.is_dir():
         shutil.rmtree(str(generation_dir))
         logger.debug("Generation directory has been cleared.")
@@ -54,3 +75,9 @@ def write_test_suite_files(test_suites: dict[str, File], generation_directory: P
         test_suite_file.source = Path(generation_directory / f"{test_suite_file.source}.robot")
         test_suite_file.save()
         logger.debug(f"File written to {os.path.relpath(test_suite_file.source)}")
+
+
+def get_json_suite_file(generation_directory: Path) -> Path:
+    if generation_directory.suffix.lower() == ".zip":
+        generation_directory = generation_directory.with_suffix("")
+    return Path(f"{generation_directory}{JSON_SUITE_SUFFIX}")
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Union
+
+MISSING_TIMESTAMP = "N/A"
+TIMESTAMP_CACHE_SIZE = 1024
+
+Timestamp = Union[datetime, str, None]
+
+
+def parse_robot_timestamp(timestamp: Union[datetime, str]) -> datetime:
+    """Returns the local time of a Robot Framework timestamp.
+
+    Timestamps are datetimes since Robot Framework 7 and strings like
+    ``20240101 10:00:00.000`` before. Strings are parsed by their fixed positions.
+    Like Robot Framework's own timestamps, the returned local time has no time zone.
+    """
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is not None:
+            return timestamp.astimezone().replace(tzinfo=None)
+        return timestamp
+    return datetime(
+        int(timestamp[0:4]),
+        int(timestamp[4:6]),
+        int(timestamp[6:8]),
+        int(timestamp[9:11]),
+        int(timestamp[12:14]),
+        int(timestamp[15:17]),
+        int(timestamp[18:24].ljust(6, "0")),
+        tzinfo=timezone.utc,
+    ).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_local_timestamp(timestamp: Timestamp) -> str:
+    """Formats a timestamp as ``2024-01-01 10:00:00.000``.
+
+    Results are cached, because the end time of a keyword is usually the start time
+    of the next one and is written to several comments.
+    """
+    if timestamp is None:
+        return MISSING_TIMESTAMP
+    return parse_robot_timestamp(timestamp).isoformat(" ", "milliseconds")
+
+
+@lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+def format_local_time(timestamp: Timestamp) -> str:
+    """Formats the time of a timestamp as ``10:00:00.000``."""
+    if timestamp is None:
+        return MISSING_TIMESTAMP
+    return parse_robot_timestamp(timestamp).time().isoformat("milliseconds")
+
+
+class UtcTimestampFormatter:
+    """Formats local Robot Framework timestamps as UTC timestamps for the TestBench server.
+
+    The offset of the local time zone is resolved once when the formatter is created,
+    so it is the same for all timestamps of a fetch.
+    """
+
+    def __init__(self, utc_offset: Optional[timedelta] = None):
+        self.utc_offset = (
+            datetime.now(timezone.utc).astimezone().utcoffset()
+            if utc_offset is None
+            else utc_offset
+        )
+        self.format = lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)(self._format)
+
+    def _format(self, timestamp: Union[datetime, str]) -> str:
+        """Formats a timestamp as ``2024-01-01T09:00:00.000Z``."""
+        utc_time = parse_robot_timestamp(timestamp) - self.utc_offset
+        return f"{utc_time.isoformat('T', 'milliseconds')}Z"
@@ -1,8 +1,9 @@
+import hashlib
 import re
 import shutil
 import sys
 from pathlib import Path, PurePath
-from typing import Optional
+from typing import BinaryIO, Optional
 from zipfile import ZipFile
 
 from testbench2robotframework.model import (
@@ -131,6 +132,13 @@ def get_directory(json_report_path: Optional[str]) -> str:
     sys.exit("Error opening " + json_report_path + ". File is not a ZIP file.")
 
 
+def check_report_path(json_report_path: str) -> None:
+    if not Path(json_report_path).exists():
+        sys.exit("Error opening " + json_report_path + ". Path does not exist.")
+    if not Path(json_report_path).is_dir() and not is_zip_file(Path(json_report_path)):
+        sys.exit("Error opening " + json_report_path + ". File is not a ZIP file.")
+
+
 def extract_to_working_directory(zip_file: Path, working_dir: Path) -> None:
     ext = zip_file.suffix
     if ext.lower() != ".zip":
@@ -163,6 +171,27 @@ def directory_to_zip(directory: Path, new_path: Optional[str] = None):
         shutil.make_archive(str(directory), "zip", str(directory))
 
 
+def copy_file(source: Path, target: Path) -> None:
+    """Copies ``source`` to a new ``target`` file, so files linked to a former target keep
+    their content.
+    """
+    if target.exists() or target.is_symlink():
+        target.unlink()
+    shutil.copy2(source, target)
+
+
+def get_file_hash(file: Path, chunk_size: int = 1024 * 1024) -> str:
+    with Path(file).open("rb") as binary_file:
+        return get_stream_hash(binary_file, chunk_size)
+
+
+def get_stream_hash(binary_file: BinaryIO, chunk_size: int = 1024 * 1024) -> str:
+    file_hash = hashlib.sha256()
+    while chunk := binary_file.read(chunk_size):
+        file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
 def get_list_item(lst, index, default: Optional[str]):
     try:
         return lst[index]
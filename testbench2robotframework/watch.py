@@ -0,0 +1,256 @@
+import io
+import sys
+import time
+from pathlib import Path, PurePath
+from typing import Optional
+
+from robot.parsing.model.blocks import File
+
+from .config import Configuration, OutputFormat
+from .json_reader import (
+    TEST_STRUCTURE_TREE_FILE,
+    TEST_STRUCTURE_TREE_TOV_FILE,
+    TestBenchJsonReader,
+    TestCaseSet,
+    read_json,
+)
+from .log import logger, setup_logger
+from .model import TestCaseDetails, TestCaseSetDetails, TestCaseSetNode, TestStructureTree
+from .model_utils import from_dict
+from .testbench2robotframework import create_test_suites_from_model
+from .testsuite_write import ROBOT_FILE_SUFFIX, get_generation_directory, write_test_suites
+
+DEFAULT_WATCH_INTERVAL = 1.0
+JSON_FILE_SUFFIX = ".json"
+TREE_FILES = {TEST_STRUCTURE_TREE_FILE, TEST_STRUCTURE_TREE_TOV_FILE}
+
+
+class ReportWatcher:
+    """Regenerates the test suites of a report directory after its JSON files changed.
+
+    The models of unchanged JSON files are kept, so only changed files are read again.
+    Changed test cases and test case sets regenerate their test suite only, a changed
+    test structure tree regenerates all test suites and ``__init__`` files.
+    Only test suite files whose path or content changed are written.
+    """
+
+    def __init__(self, testbench_report: Path, configuration: Configuration):
+        self.reader = TestBenchJsonReader(testbench_report)
+        self.configuration = configuration
+        self.generation_directory = get_generation_directory(configuration.output_directory)
+        self.snapshot: dict[str, tuple[int, int]] = {}
+        self.test_theme_tree: Optional[TestStructureTree] = None
+        self.test_case_sets: dict[str, TestCaseSetDetails] = {}
+        self.test_cases: dict[str, TestCaseDetails] = {}
+        self.suite_files: dict[str, tuple[PurePath, str]] = {}
+
+    @property
+    def writes_suite_files(self) -> bool:
+        return (
+            self.configuration.output_format == OutputFormat.ROBOT
+            and self.generation_directory.suffix.lower() != ".zip"
+        )
+
+    def get_snapshot(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for json_file in Path(self.reader.json_dir).glob(f"*{JSON_FILE_SUFFIX}"):
+            try:
+                stat = json_file.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[json_file.name] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def generate(self) -> None:
+        """Reads the whole report and writes all its test suites."""
+        self.snapshot = self.get_snapshot()
+        self.test_theme_tree = self.reader.test_theme_tree
+        test_case_set_catalog = self.reader.get_test_case_set_catalog()
+        self.test_case_sets = {
+            uid: test_case_set.details for uid, test_case_set in test_case_set_catalog.items()
+        }
+        self.test_cases = {
+            tc_uid: test_case
+            for test_case_set in test_case_set_catalog.values()
+            for tc_uid, test_case in test_case_set.test_cases.items()
+        }
+        test_suites = create_test_suites_from_model(
+            self.test_theme_tree, test_case_set_catalog, self.configuration
+        )
+        self.suite_files = {
+            uid: (PurePath(test_suite.source), render_test_suite(test_suite))
+            for uid, test_suite in test_suites.items()
+        }
+        write_test_suites(test_suites, self.configuration)
+
+    def update(self) -> Optional[int]:
+        """Regenerates the test suites affected by changed JSON files.
+
+        :return: The number of written test suite files or None if nothing changed.
+        """
+        snapshot = self.get_snapshot()
+        changed_files = {name for name, stat in snapshot.items() if self.snapshot.get(name) != stat}
+        removed_files = set(self.snapshot) - set(snapshot)
+        if not changed_files and not removed_files:
+            return None
+        change_time = max(
+            (snapshot[name][0] for name in changed_files), default=time.time_ns()
+        )
+        self.snapshot = snapshot
+        tree_changed = bool(TREE_FILES & (changed_files | removed_files))
+        affected_uids = self.read_changes(changed_files | removed_files, tree_changed)
+        if not tree_changed and not affected_uids:
+            return 0
+        if self.writes_suite_files:
+            written_files = self.write_changed_test_suites(
+                None if tree_changed else affected_uids
+            )
+        else:
+            test_suites = create_test_suites_from_model(
+                self.test_theme_tree, self.get_test_case_set_catalog(), self.configuration
+            )
+            write_test_suites(test_suites, self.configuration)
+            written_files = len(test_suites)
+        logger.info(
+            f"Wrote {written_files} test suite files "
+            f"{(time.time_ns() - change_time) / 1e9:.3f} s after the change of "
+            f"{len(changed_files) + len(removed_files)} JSON files."
+        )
+        return written_files
+
+    def read_changes(self, file_names: set[str], tree_changed: bool) -> set[str]:
+        """Reads changed JSON files again and returns the UIDs of affected test case sets."""
+        if tree_changed:
+            self.test_theme_tree = from_dict(
+                TestStructureTree, read_json(str(self.reader.get_structure_tree_path()))
+            )
+        test_case_set_uids = {
+            tc_summary.uniqueID: tcs_uid
+            for tcs_uid, test_case_set in self.test_case_sets.items()
+            for tc_summary in test_case_set.testCases
+        }
+        affected_uids = set()
+        for file_name in file_names - TREE_FILES:
+            uid = file_name[: -len(JSON_FILE_SUFFIX)]
+            if uid in self.test_case_sets:
+                self.read_test_case_set(uid)
+                affected_uids.add(uid)
+            elif uid in test_case_set_uids:
+                self.read_test_case(uid)
+                affected_uids.add(test_case_set_uids[uid])
+        if tree_changed:
+            for uid in self.get_tree_test_case_set_uids():
+                if uid not in self.test_case_sets:
+                    self.read_test_case_set(uid)
+        return affected_uids
+
+    def read_test_case_set(self, uid: str) -> None:
+        test_case_set = self.reader.read_test_case_set(uid)
+        if test_case_set is None:
+            self.test_case_sets.pop(uid, None)
+            return
+        self.test_case_sets[uid] = test_case_set
+        for tc_summary in test_case_set.testCases:
+            if tc_summary.uniqueID not in self.test_cases:
+                self.read_test_case(tc_summary.uniqueID)
+
+    def read_test_case(self, uid: str) -> None:
+        test_case = self.reader.read_test_case(uid)
+        if test_case is None:
+            self.test_cases.pop(uid, None)
+        else:
+            self.test_cases[uid] = test_case
+
+    def get_tree_test_case_set_uids(self) -> list[str]:
+        nodes = [self.test_theme_tree.root, *self.test_theme_tree.nodes]
+        return [node.base.uniqueID for node in nodes if isinstance(node, TestCaseSetNode)]
+
+    def get_test_case_set_catalog(self, uids: Optional[set[str]] = None) -> dict[str, TestCaseSet]:
+        return {
+            uid: TestCaseSet(
+                self.test_case_sets[uid],
+                {
+                    tc_summary.uniqueID: self.test_cases[tc_summary.uniqueID]
+                    for tc_summary in self.test_case_sets[uid].testCases
+                    if tc_summary.uniqueID in self.test_cases
+                },
+            )
+            for uid in self.get_tree_test_case_set_uids()
+            if uid in self.test_case_sets and (uids is None or uid in uids)
+        }
+
+    def write_changed_test_suites(self, affected_uids: Optional[set[str]]) -> int:
+        """Regenerates test suites, writes the changed ones and removes those that no longer exist.
+
+        :param affected_uids: UIDs of the test case sets to regenerate, None for all test suites.
+        """
+        test_case_set_catalog = self.get_test_case_set_catalog(affected_uids)
+        test_suites = create_test_suites_from_model(
+            self.test_theme_tree, test_case_set_catalog, self.configuration
+        )
+        if affected_uids is not None:
+            test_suites = {uid: test_suites[uid] for uid in test_case_set_catalog}
+        written_files = 0
+        for uid, test_suite in test_suites.items():
+            suite_file = (PurePath(test_suite.source), render_test_suite(test_suite))
+            previous_suite_file = self.suite_files.get(uid)
+            if suite_file == previous_suite_file:
+                continue
+            if previous_suite_file and previous_suite_file[0] != suite_file[0]:
+                self.remove_test_suite_file(previous_suite_file[0])
+            suite_path = self.get_suite_path(suite_file[0])
+            suite_path.parent.mkdir(parents=True, exist_ok=True)
+            suite_path.write_text(suite_file[1], encoding="utf-8")
+            logger.debug(f"File written to {suite_path}")
+            self.suite_files[uid] = suite_file
+            written_files += 1
+        regenerated_uids = set(self.suite_files) if affected_uids is None else affected_uids
+        for uid in regenerated_uids - set(test_suites):
+            if uid in self.suite_files:
+                self.remove_test_suite_file(self.suite_files.pop(uid)[0])
+        return written_files
+
+    def get_suite_path(self, source: PurePath) -> Path:
+        return self.generation_directory / f"{source}{ROBOT_FILE_SUFFIX}"
+
+    def remove_test_suite_file(self, source: PurePath) -> None:
+        suite_path = self.get_suite_path(source)
+        suite_path.unlink(missing_ok=True)
+        logger.debug(f"File removed: {suite_path}")
+        directory = suite_path.parent
+        while (
+            directory not in (self.generation_directory, directory.parent)
+            and directory.is_dir()
+            and not any(directory.iterdir())
+        ):
+            directory.rmdir()
+            directory = directory.parent
+
+
+def render_test_suite(test_suite: File) -> str:
+    output = io.StringIO()
+    test_suite.save(output)
+    return output.getvalue()
+
+
+def watch_report(
+    testbench_report: Path, config: dict, interval: float = DEFAULT_WATCH_INTERVAL
+) -> None:
+    """Generates the test suites of a report directory and regenerates them after changes
+    until the process is interrupted. Changes are detected by polling every ``interval`` seconds.
+    """
+    configuration = Configuration.from_dict(config)
+    setup_logger(configuration)
+    if not Path(testbench_report).is_dir():
+        sys.exit(f"Watching requires a TestBench report directory: '{testbench_report}'.")
+    if configuration.shards > 1:
+        logger.warning("Watching writes all test suites to the output directory without shards.")
+    watcher = ReportWatcher(Path(testbench_report).resolve(), configuration)
+    watcher.generate()
+    logger.info(f"Watching '{testbench_report}' for changes. Press Ctrl+C to stop.")
+    try:
+        while True:
+            time.sleep(interval)
+            watcher.update()
+    except KeyboardInterrupt:
+        logger.info("Stopped watching.")
@@ -0,0 +1,192 @@
+import json
+from pathlib import Path
+
+import pytest
+
+
+class ReportBuilder:
+    """Writes the JSON files of minimal TestBench reports for the tests."""
+
+    @staticmethod
+    def create_node(
+        element_type: str, key: str, numbering: str, parent_key: str, name: str
+    ) -> dict:
+        node = {
+            "elementType": element_type,
+            "base": {
+                "key": key,
+                "numbering": numbering,
+                "path": "",
+                "parentKey": parent_key,
+                "name": name,
+                "uniqueID": name,
+                "matchesFilter": True,
+            },
+        }
+        if element_type != "TestCaseSetNode":
+            node["filters"] = []
+        if element_type != "RootNode":
+            node["exec"] = {
+                "status": "Planned",
+                "execStatus": "NotBlocked",
+                "verdict": "Undefined",
+                "key": key,
+            }
+        return node
+
+    @staticmethod
+    def create_test_case_set(uid: str, key: str) -> dict:
+        return {
+            "key": key,
+            "numbering": "1",
+            "path": "",
+            "uniqueID": uid,
+            "name": uid,
+            "spec": {
+                "key": key,
+                "description": "",
+                "reviewComment": "",
+                "status": "Released",
+                "priority": "High",
+                "preConditions": [],
+                "postConditions": [],
+                "udfs": [],
+                "tags": [],
+                "references": [],
+                "requirements": [],
+            },
+            "testCases": [
+                {
+                    "uniqueID": f"{uid}-TC",
+                    "index": 1,
+                    "spec": {"key": key, "comments": "", "requirements": []},
+                }
+            ],
+            "testSequence": [],
+            "parameters": [],
+            "keywords": [],
+            "exec": {"key": key, "comments": "", "udfs": [], "tags": []},
+        }
+
+    @staticmethod
+    def create_test_case(uid: str, message: str) -> dict:
+        return {
+            "uniqueID": uid,
+            "spec": {"key": uid, "comments": "", "udfs": [], "tags": [], "requirements": []},
+            "testSequence": [
+                {
+                    "sequenceID": "1",
+                    "numbering": "1",
+                    "parentID": None,
+                    "spec": {
+                        "key": "1",
+                        "name": "Log",
+                        "sequencePhase": "TestStep",
+                        "callType": "Flow",
+                        "comments": "",
+                        "callParameters": [
+                            {
+                                "definitionType": "AtomicInstance",
+                                "key": "1",
+                                "name": "message",
+                                "evaluationType": "CallByValue",
+                                "value": message,
+                            }
+                        ],
+                        "keywordType": "Atomic",
+                        "keywordKey": "log",
+                    },
+                }
+            ],
+            "parameters": [],
+            "keywords": [
+                {
+                    "key": "log",
+                    "name": "Log",
+                    "uniqueID": "KW-log",
+                    "status": "Released",
+                    "defaultCallType": "Flow",
+                    "description": "",
+                    "path": "RF.BuiltIn",
+                    "parameters": [],
+                    "preConditions": [],
+                    "postConditions": [],
+                    "references": [],
+                }
+            ],
+        }
+
+    @staticmethod
+    def write_json(path: Path, data) -> None:
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    @classmethod
+    def write_test_case(cls, report: Path, uid: str, message: str) -> None:
+        cls.write_json(report / f"{uid}.json", cls.create_test_case(uid, message))
+
+    @classmethod
+    def write_test_case_set(cls, report: Path, uid: str, key: str, message: str) -> None:
+        cls.write_json(report / f"{uid}.json", cls.create_test_case_set(uid, key))
+        cls.write_test_case(report, f"{uid}-TC", message)
+
+    @classmethod
+    def write_tree(cls, report: Path, second_set_name: str) -> None:
+        cls.write_json(
+            report / "cycle_structure.json",
+            {
+                "root": cls.create_node("RootNode", "0", "", "", "Root"),
+                "nodes": [
+                    cls.create_node("TestThemeNode", "1", "1", "0", "Theme"),
+                    cls.create_node("TestCaseSetNode", "2", "1.1", "1", "Set A"),
+                    cls.create_node("TestCaseSetNode", "3", "1.2", "1", second_set_name),
+                ],
+            },
+        )
+
+    @classmethod
+    def write_report(cls, report, durations: dict[str, int]) -> None:
+        nodes = [cls.create_node("TestThemeNode", "1", "1", "0", "Theme")]
+        for index, (uid, duration) in enumerate(durations.items(), start=1):
+            key = str(index + 1)
+            nodes.append(cls.create_node("TestCaseSetNode", key, f"1.{index}", "1", uid))
+            cls.write_json(report / f"{uid}.json", cls.create_test_case_set(uid, key))
+            test_case = cls.create_test_case(f"{uid}-TC", "message")
+            test_case["exec"] = {
+                "key": key,
+                "status": "Planned",
+                "execStatus": "NotBlocked",
+                "verdict": "Undefined",
+                "plannedDuration": duration,
+                "actualDuration": 0,
+                "currentUser": {"key": "1", "name": "tester"},
+                "comments": "",
+                "defects": [],
+                "udfs": [],
+                "tags": [],
+                "references": [],
+            }
+            cls.write_json(report / f"{uid}-TC.json", test_case)
+        cls.write_json(
+            report / "cycle_structure.json",
+            {"root": cls.create_node("RootNode", "0", "", "", "Root"), "nodes": nodes},
+        )
+
+    @classmethod
+    def add_keyword_executions(cls, report, uid: str) -> None:
+        test_case_file = report / f"{uid}-TC.json"
+        test_case = json.loads(test_case_file.read_text())
+        for step in test_case["testSequence"]:
+            step["exec"] = {
+                "verdict": "Undefined",
+                "duration": 0,
+                "currentUser": {"key": "1", "name": "tester"},
+                "comments": "",
+                "references": [],
+                "defects": [],
+            }
+        cls.write_json(test_case_file, test_case)
+
+
+@pytest.fixture
+def report_builder() -> type[ReportBuilder]:
+    return ReportBuilder
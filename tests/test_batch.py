@@ -0,0 +1,35 @@
+import json
+
+from testbench2robotframework.batch import format_summary, read_manifest, run_batch
+from testbench2robotframework.testbench2rf import get_keyword_import
+
+
+def test_batch_reports_failed_jobs_without_stopping(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_tree(report, "Set B")
+    for uid, key in (("Set A", "2"), ("Set B", "3")):
+        report_builder.write_test_case_set(report, uid, key, "message")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps(
+            {
+                "jobs": [
+                    {"report": "report", "output": "first"},
+                    {"report": "missing", "output": "missing"},
+                    {"report": "report", "output": "second"},
+                ]
+            }
+        )
+    )
+    get_keyword_import.cache_clear()
+    results = run_batch(read_manifest(manifest), workers=1)
+    assert [result.failed for result in results] == [False, True, False]
+    assert "does not exist" in results[1].error
+    assert [result.report_cached for result in results] == [False, False, True]
+    assert get_keyword_import.cache_info().hits > 0
+    for output in ("first", "second"):
+        assert (tmp_path / output / "1__Theme" / "2__Set_B.robot").is_file()
+    summary = format_summary(results, 1.0)
+    assert "3 jobs, 2 passed, 1 failed" in summary
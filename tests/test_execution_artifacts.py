@@ -0,0 +1,121 @@
+import threading
+
+from testbench2robotframework import execution_artifacts
+from testbench2robotframework.config import AttachmentConflictBehaviour, ReferenceBehaviour
+from testbench2robotframework.execution_artifacts import ExecutionArtifactStorage
+from testbench2robotframework.model import ReferenceAssignment, ReferenceKind
+from testbench2robotframework.report_output import ExistingAttachments
+
+
+def create_storage(
+    tmp_path, conflict_behaviour=AttachmentConflictBehaviour.RENAME_NEW, existing_attachments=None
+):
+    return ExecutionArtifactStorage(
+        ReferenceBehaviour.ATTACHMENT,
+        conflict_behaviour,
+        [],
+        str(tmp_path / "output.xml"),
+        str(tmp_path / "result" / "attachments"),
+        existing_attachments=existing_attachments,
+    )
+
+
+def test_attachments_with_identical_content_are_stored_once(tmp_path):
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    (tmp_path / "first" / "screenshot.png").write_bytes(b"png")
+    (tmp_path / "second" / "copy.png").write_bytes(b"png")
+    storage = create_storage(tmp_path)
+    first_key = storage.add_artifact("first/screenshot.png")
+    second_key = storage.add_artifact("second/copy.png")
+    storage.wait_for_attachments()
+    assert first_key == second_key
+    assert len(storage.tb_references) == 1
+    assert [path.name for path in (tmp_path / "result" / "attachments").iterdir()] == [
+        "screenshot.png"
+    ]
+
+
+def test_attachments_of_the_report_with_identical_content_are_reused(tmp_path):
+    (tmp_path / "report" / "attachments").mkdir(parents=True)
+    (tmp_path / "report" / "attachments" / "screenshot.png").write_bytes(b"png")
+    (tmp_path / "report" / "attachments" / "other.png").write_bytes(b"gif")
+    (tmp_path / "new").mkdir()
+    (tmp_path / "new" / "screenshot.png").write_bytes(b"png")
+    (tmp_path / "new" / "other.png").write_bytes(b"jpg")
+    storage = create_storage(
+        tmp_path, existing_attachments=ExistingAttachments(tmp_path / "report")
+    )
+    storage.add_artifact("new/screenshot.png")
+    storage.add_artifact("new/other.png")
+    storage.wait_for_attachments()
+    assert [ref.value for ref in storage.tb_references] == ["screenshot.png", "other_1.png"]
+    assert [path.name for path in (tmp_path / "result" / "attachments").iterdir()] == [
+        "other_1.png"
+    ]
+
+
+def test_references_are_stored_once_their_attachment_is_copied(tmp_path, monkeypatch):
+    copy_allowed = threading.Event()
+    copy_file = execution_artifacts.copy_file
+
+    def wait_and_copy(source, target):
+        copy_allowed.wait()
+        copy_file(source, target)
+
+    monkeypatch.setattr(execution_artifacts, "copy_file", wait_and_copy)
+    (tmp_path / "log.txt").write_text("log")
+    storage = create_storage(tmp_path)
+    storage.add_artifact("log.txt")
+    assert not storage.store_references(storage.tb_references, wait=False)
+    copy_allowed.set()
+    assert storage.store_references(storage.tb_references, wait=True)
+    assert (tmp_path / "result" / "attachments" / "log.txt").read_text() == "log"
+    storage.wait_for_attachments()
+
+
+def test_attachments_with_same_name_and_different_content_are_renamed(tmp_path):
+    (tmp_path / "first").mkdir()
+    (tmp_path / "second").mkdir()
+    (tmp_path / "first" / "log.txt").write_text("first")
+    (tmp_path / "second" / "log.txt").write_text("second")
+    storage = create_storage(tmp_path)
+    first_key = storage.add_artifact("first/log.txt")
+    second_key = storage.add_artifact("second/log.txt")
+    storage.wait_for_attachments()
+    assert first_key != second_key
+    assert [ref.value for ref in storage.tb_references] == ["log.txt", "log_1.txt"]
+    assert (tmp_path / "result" / "attachments" / "log_1.txt").read_text() == "second"
+
+
+def test_reference_keys_are_assigned_in_order_of_adding(tmp_path):
+    (tmp_path / "attachments").mkdir()
+    for index in range(20):
+        (tmp_path / "attachments" / f"file_{index}.txt").write_text(str(index))
+    storage = create_storage(tmp_path)
+    keys = [storage.add_artifact(f"attachments/file_{index}.txt") for index in range(20)]
+    storage.wait_for_attachments()
+    assert keys == [str(-4 - index) for index in range(20)]
+    for index in range(20):
+        assert (tmp_path / "result" / "attachments" / f"file_{index}.txt").read_text() == str(index)
+
+
+def test_existing_references_are_reused_and_new_keys_continue_below_minimum(tmp_path):
+    (tmp_path / "log.html").write_text("log")
+    (tmp_path / "new.html").write_text("new")
+    references = [
+        ReferenceAssignment("-12", str(tmp_path / "log.html"), ReferenceKind.Reference),
+        ReferenceAssignment("5", str(tmp_path / "log.html"), ReferenceKind.Attachment),
+    ]
+    storage = ExecutionArtifactStorage(
+        ReferenceBehaviour.REFERENCE,
+        AttachmentConflictBehaviour.USE_EXISTING,
+        references,
+        str(tmp_path / "output.xml"),
+        str(tmp_path / "attachments"),
+    )
+    assert storage.add_artifact(str(tmp_path / "log.html")) == "-12"
+    new_key = storage.add_artifact(str(tmp_path / "new.html"))
+    assert new_key == "-13"
+    assert storage.add_artifact(str(tmp_path / "new.html")) == new_key
+    assert storage.add_artifact("another") is None
@@ -0,0 +1,76 @@
+from testbench2robotframework.fetch_journal import FetchJournal, get_journal_inputs
+from testbench2robotframework.model import (
+    ActivityStatus,
+    ExecStatus,
+    ExecutionResultForImport,
+    ReferenceAssignment,
+    ReferenceKind,
+    TestCaseExecutionForImport,
+    TestCaseSetExecutionForImport,
+    VerdictStatus,
+)
+
+
+def create_protocol_test_case(uid: str) -> TestCaseExecutionForImport:
+    return TestCaseExecutionForImport(
+        uid,
+        "42",
+        ExecutionResultForImport(
+            ActivityStatus.Performed, ExecStatus.NotBlocked, VerdictStatus.Pass, "2024-01-01Z"
+        ),
+        1000,
+    )
+
+
+def test_journal_is_resumed_for_same_inputs(tmp_path):
+    report = tmp_path / "report.zip"
+    report.write_text("report")
+    output_xml = tmp_path / "output.xml"
+    output_xml.write_text("<robot/>")
+    inputs = get_journal_inputs(report, [output_xml])
+    journal_file = tmp_path / "journal.jsonl"
+    journal = FetchJournal(journal_file, inputs)
+    journal.open(resume=False)
+    reference = ReferenceAssignment("-4", "log.txt", ReferenceKind.Attachment)
+    journal.add_test("TC-1", create_protocol_test_case("TC-1"), [reference])
+    journal.add_test_case_set(
+        "TCS-1", TestCaseSetExecutionForImport("7", "8", 1000, [create_protocol_test_case("TC-1")])
+    )
+    journal.add_test("TC-2", create_protocol_test_case("TC-2"), [])
+    journal.close()
+    with journal_file.open("a", encoding="utf-8") as torn_journal:
+        torn_journal.write('{"test": "TC-3", "prot')
+
+    resumed_journal = FetchJournal(journal_file, inputs)
+    resumed_journal.open(resume=True)
+    resumed_journal.close()
+    assert list(resumed_journal.tests) == ["TC-1", "TC-2"]
+    assert resumed_journal.tests["TC-1"] == create_protocol_test_case("TC-1")
+    assert resumed_journal.references == [reference]
+    assert resumed_journal.test_case_sets["TCS-1"].testCases[0].uniqueID == "TC-1"
+
+    output_xml.write_text("<robot></robot>")
+    changed_journal = FetchJournal(journal_file, get_journal_inputs(report, [output_xml]))
+    changed_journal.open(resume=True)
+    changed_journal.close()
+    assert not changed_journal.tests
+    assert len(journal_file.read_text().splitlines()) == 1
+
+
+def test_torn_record_is_cut_off_before_resumed_records(tmp_path):
+    inputs = {"report": ["report", 1, 1], "results": []}
+    journal_file = tmp_path / "journal.jsonl"
+    journal = FetchJournal(journal_file, inputs)
+    journal.open(resume=False)
+    journal.add_test("TC-1", create_protocol_test_case("TC-1"), [])
+    journal.close()
+    with journal_file.open("a", encoding="utf-8") as torn_journal:
+        torn_journal.write('{"test": "TC-2", "prot')
+    for uid in ("TC-2", "TC-3"):
+        resumed_journal = FetchJournal(journal_file, inputs)
+        resumed_journal.open(resume=True)
+        resumed_journal.add_test(uid, create_protocol_test_case(uid), [])
+        resumed_journal.close()
+    recovered_journal = FetchJournal(journal_file, inputs)
+    assert recovered_journal.load()
+    assert list(recovered_journal.tests) == ["TC-1", "TC-2", "TC-3"]
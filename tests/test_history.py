@@ -0,0 +1,63 @@
+import io
+import json
+
+from robot import run
+
+from testbench2robotframework.history import (
+    ExecutionHistory,
+    get_keyword_history,
+    get_test_history,
+)
+from testbench2robotframework.robotframework2testbench import robot2testbench
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework as generate_test_suites,
+)
+
+
+def test_history_replaces_rows_of_refetched_run(tmp_path):
+    database = tmp_path / "history.db"
+    inputs = {"report": ["report", 1, 1], "results": [["output.xml", 1, 1]]}
+    history = ExecutionHistory(database)
+    run_id = history.start_run(inputs)
+    history.add_test("TC", "TCS", "Pass", 100, None, [("RF.BuiltIn.Log", "1", "Pass", 10)])
+    history.close()
+    history = ExecutionHistory(database)
+    assert history.start_run(inputs) == run_id
+    history.add_test("TC", "TCS", "Fail", 200, None, [("RF.BuiltIn.Log", "1", "Fail", 20)])
+    assert history.start_run({**inputs, "results": [["output.xml", 2, 2]]}) != run_id
+    history.add_test("TC", "TCS", "Pass", 300, None, [])
+    history.close()
+    assert [(row["verdict"], row["duration"]) for row in get_test_history(database, "TC")] == [
+        ("Pass", 300),
+        ("Fail", 200),
+    ]
+
+
+def test_fetch_adds_test_and_keyword_results_to_history(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 1000, "B": 2000})
+    for uid in ("A", "B"):
+        report_builder.add_keyword_executions(report, uid)
+    generate_test_suites(str(report), {"output-directory": "Generated"})
+    run(
+        "Generated",
+        outputdir=str(tmp_path),
+        log=None,
+        report=None,
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+    database = tmp_path / "history.db"
+    robot2testbench(
+        str(report),
+        str(tmp_path / "output.xml"),
+        str(tmp_path / "result"),
+        {"history-database": str(database)},
+    )
+    test_history = get_test_history(database, "A-TC")
+    assert len(test_history) == 1
+    assert test_history[0]["verdict"] == "Pass"
+    keyword_history = get_keyword_history(database, "RF.BuiltIn.Log")
+    assert [(row["count"], row["failures"]) for row in keyword_history] == [(2, 0)]
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+
+def get_imported_modules(code: str) -> set[str]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+def test_cli_is_imported_without_robot_framework():
+    modules = get_imported_modules("import testbench2robotframework.cli")
+    assert "click" in modules
+    assert not {module for module in modules if module.split(".")[0] == "robot"}
+    assert "testbench2robotframework.model" not in modules
+
+
+def test_commands_import_only_their_modules():
+    generation_modules = get_imported_modules(
+        "from testbench2robotframework.testbench2robotframework import "
+        "create_test_suites_from_report; import testbench2robotframework.testsuite_write"
+    )
+    assert "testbench2robotframework.result_writer" not in generation_modules
+    assert "testbench2robotframework.robot_result_reader" not in generation_modules
+    assert "testbench2robotframework.json_suite_write" not in generation_modules
+    result_modules = get_imported_modules("import testbench2robotframework.robotframework2testbench")
+    assert "testbench2robotframework.testbench2rf" not in result_modules
+    assert "testbench2robotframework.testsuite_write" not in result_modules
@@ -0,0 +1,84 @@
+from robot.api import get_init_model, get_model
+from robot.running import TestSuite as RunningTestSuite
+
+from testbench2robotframework.json_suite_write import create_running_test_suite
+from testbench2robotframework.config import OutputFormat
+from testbench2robotframework.testsuite_write import (
+    clear_generation_directory,
+    write_test_suite_files,
+)
+
+INIT_FILE = """*** Settings ***
+Documentation    Theme
+Metadata    UniqueID    TT-1
+Suite Setup    Log    theme
+Test Tags    theme
+Test Teardown    Log    theme teardown
+Test Timeout    1 minute
+"""
+SUITE_FILE = """*** Settings ***
+Library    Collections
+Metadata    UniqueID    TCS-1
+
+*** Test Cases ***
+TC-1 : Phase 1/2
+    [Tags]    first
+    [Setup]    Setup-TC-1
+    Log    hello
+    GROUP    Compound
+        ${value}    Set Variable    1
+    END
+
+TC-1 : Phase 2/2
+    Should Be Equal    1    1
+    [Teardown]    Log    done
+
+*** Keywords ***
+Setup-TC-1
+    Log    setup
+"""
+
+
+def create_test_suites():
+    init_file = get_init_model(INIT_FILE)
+    init_file.source = "1__Theme/__init__"
+    suite_file = get_model(SUITE_FILE)
+    suite_file.source = "1__Theme/1.1__Set"
+    return {"TT-1": init_file, "TCS-1": suite_file}
+
+
+def without_line_numbers(data):
+    if isinstance(data, dict):
+        return {key: without_line_numbers(value) for key, value in data.items() if key != "lineno"}
+    if isinstance(data, list):
+        return [without_line_numbers(item) for item in data]
+    return data
+
+
+def test_json_suite_matches_suite_parsed_from_robot_files(tmp_path):
+    write_test_suite_files(create_test_suites(), tmp_path / "Generated")
+    parsed_suite = RunningTestSuite.from_file_system(tmp_path / "Generated")
+    created_suite = create_running_test_suite(create_test_suites(), tmp_path / "Generated")
+    created_suite.to_json(tmp_path / "Generated.rbt")
+    loaded_suite = RunningTestSuite.from_json(tmp_path / "Generated.rbt")
+    assert without_line_numbers(loaded_suite.to_dict()) == without_line_numbers(
+        parsed_suite.to_dict()
+    )
+    first_test = loaded_suite.suites[0].suites[0].tests[0]
+    assert first_test.tags == ["first", "theme"]
+    assert (first_test.teardown.name, first_test.timeout) == ("Log", "1 minute")
+    assert loaded_suite.suites[0].setup.args == ("theme",)
+
+
+def test_clean_removes_only_the_suites_of_the_output_format(tmp_path):
+    generation_directory = tmp_path / "Generated"
+    write_test_suite_files(create_test_suites(), generation_directory)
+    json_suite_file = tmp_path / "Generated.rbt"
+    json_suite_file.write_text("{}")
+    clear_generation_directory(generation_directory, OutputFormat.ROBOT)
+    assert json_suite_file.exists()
+    assert not generation_directory.exists()
+    write_test_suite_files(create_test_suites(), generation_directory)
+    clear_generation_directory(generation_directory, OutputFormat.JSON)
+    assert not json_suite_file.exists()
+    assert generation_directory.is_dir()
@@ -0,0 +1,63 @@
+import io
+import json
+from dataclasses import asdict
+from enum import Enum
+
+from testbench2robotframework.model import (
+    ExecutionResultForImport,
+    ReferenceAssignment,
+    ReferenceKind,
+    RichTextForImport,
+    TestCaseExecutionForImport,
+    TestCaseSetExecutionForImport,
+)
+from testbench2robotframework.model_utils import to_json
+
+
+def create_protocol():
+    test_case = TestCaseExecutionForImport(
+        uniqueID="iTB-TC-1",
+        testCaseExecutionKey="12",
+        result=ExecutionResultForImport("Performed", "NotBlocked", "Pass", "2024-01-01T00:00Z"),
+        durationMillis=1500,
+        comments=RichTextForImport(html="<b>PASS</b> äöü \"quoted\"\n"),
+        defects=[],
+    )
+    return [
+        TestCaseSetExecutionForImport(
+            testCaseSetKey="7",
+            executionKey="8",
+            durationMillis=1500,
+            testCases=[test_case, test_case],
+        )
+    ]
+
+
+def expected_json(obj, indent):
+    return json.dumps(
+        [asdict(item) for item in obj] if isinstance(obj, list) else asdict(obj),
+        indent=indent,
+        default=lambda o: o.value if isinstance(o, Enum) else str(o),
+    )
+
+
+def test_indented_output_equals_json_dump_of_asdict():
+    protocol = create_protocol()
+    output = io.StringIO()
+    to_json(protocol, output, 2)
+    assert output.getvalue() == expected_json(protocol, 2)
+
+
+def test_enum_values_are_written():
+    reference = ReferenceAssignment("-4", "log.html", ReferenceKind.Attachment)
+    output = io.StringIO()
+    to_json(reference, output, 2)
+    assert output.getvalue() == expected_json(reference, 2)
+
+
+def test_compact_output_is_valid_json_without_whitespace():
+    protocol = create_protocol()
+    output = io.StringIO()
+    to_json(protocol, output)
+    assert "\n  " not in output.getvalue()
+    assert json.loads(output.getvalue()) == json.loads(expected_json(protocol, None))
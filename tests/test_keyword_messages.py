@@ -0,0 +1,55 @@
+from robot.result import Keyword
+
+from testbench2robotframework.config import Configuration
+from testbench2robotframework.result_writer import ResultWriter
+
+
+def create_result_writer(tmp_path, monkeypatch, keyword_messages: dict) -> ResultWriter:
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    return ResultWriter(
+        str(report),
+        str(tmp_path / "result"),
+        Configuration.from_dict({"keyword-messages": keyword_messages}),
+        "output.xml",
+    )
+
+
+def create_logging_keyword(messages: list[tuple[str, str]]) -> Keyword:
+    keyword = Keyword(name="Loop", status="PASS", start_time="2024-01-01 10:00:00")
+    for index, (message, level) in enumerate(messages):
+        child = keyword.body.create_keyword(name="Log", status="PASS")
+        child.body.create_message(message, level=level, timestamp="2024-01-01 10:00:00")
+        if index % 2:
+            child.body.create_message(message, level=level, timestamp="2024-01-01 10:00:00")
+    return keyword
+
+
+def test_keyword_messages_are_deduplicated_filtered_and_truncated(tmp_path, monkeypatch):
+    result_writer = create_result_writer(
+        tmp_path, monkeypatch, {"max-messages": 3, "min-level": "INFO"}
+    )
+    keyword = create_logging_keyword(
+        [("first", "INFO"), ("first", "INFO"), ("debug", "DEBUG"), ("second", "WARN")]
+    )
+    messages = result_writer._get_unique_keyword_messages(keyword)
+    assert len(messages) == 2
+    assert "first" in messages[0]
+    assert "second" in messages[1]
+
+    keyword = create_logging_keyword([(f"message {index}", "INFO") for index in range(10)])
+    messages = result_writer._get_unique_keyword_messages(keyword)
+    assert len(messages) == 4
+    assert "message 2" in messages[2]
+    assert "omitted after 3 messages" in messages[3]
+
+
+def test_keyword_messages_are_limited_by_size(tmp_path, monkeypatch):
+    result_writer = create_result_writer(
+        tmp_path, monkeypatch, {"max-messages": 0, "max-bytes": 1000}
+    )
+    keyword = create_logging_keyword([(character * 300, "INFO") for character in "xyz"])
+    messages = result_writer._get_unique_keyword_messages(keyword)
+    assert len(messages) == 3
+    assert "omitted after 2 messages" in messages[2]
@@ -0,0 +1,54 @@
+import csv
+import io
+
+from robot import run
+
+from testbench2robotframework.keyword_statistics import KeywordAnalytics
+from testbench2robotframework.robotframework2testbench import robot2testbench
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework as generate_test_suites,
+)
+
+
+def test_keyword_analytics_keeps_bounded_sample():
+    analytics = KeywordAnalytics(sample_size=10)
+    for duration in range(1, 101):
+        analytics.add("RF.BuiltIn.Sleep", duration, failed=duration > 90)
+    analytics.add("RF.BuiltIn.Log", 1, failed=False)
+    sleep, log = analytics.get_rows()
+    assert len(analytics.keywords["RF.BuiltIn.Sleep"].samples) == 10
+    assert sleep["keywordPath"] == "RF.BuiltIn.Sleep"
+    assert (sleep["count"], sleep["totalDuration"], sleep["maxDuration"]) == (100, 5050, 100)
+    assert sleep["failureRate"] == 0.1
+    assert 1 <= sleep["p50Duration"] <= sleep["p95Duration"] <= 100
+    assert (log["p50Duration"], log["p95Duration"]) == (1, 1)
+
+
+def test_fetch_writes_keyword_statistics(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 1000, "B": 2000})
+    for uid in ("A", "B"):
+        report_builder.add_keyword_executions(report, uid)
+    generate_test_suites(str(report), {"output-directory": "Generated"})
+    run(
+        "Generated",
+        outputdir=str(tmp_path),
+        log=None,
+        report=None,
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+    statistics_file = tmp_path / "keywords.csv"
+    robot2testbench(
+        str(report),
+        str(tmp_path / "output.xml"),
+        str(tmp_path / "result"),
+        {"keyword-statistics": str(statistics_file)},
+    )
+    with statistics_file.open(encoding="utf-8", newline="") as csv_file:
+        rows = list(csv.DictReader(csv_file))
+    assert [(row["keywordPath"], row["count"], row["failureRate"]) for row in rows] == [
+        ("RF.BuiltIn.Log", "2", "0.0")
+    ]
@@ -0,0 +1,64 @@
+import io
+import json
+
+from robot import run
+
+from testbench2robotframework import listener as testbench_listener
+from testbench2robotframework import result_writer
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework as generate_test_suites,
+)
+
+
+def run_with_listener(tmp_path, report) -> None:
+    run(
+        "Generated",
+        outputdir=str(tmp_path),
+        log=None,
+        report=None,
+        listener=testbench_listener.TestBenchListener(str(report), str(tmp_path / "result")),
+        stdout=io.StringIO(),
+        stderr=io.StringIO(),
+    )
+
+
+def create_report(tmp_path, report_builder):
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 1000, "B": 2000})
+    for uid in ("A", "B"):
+        report_builder.add_keyword_executions(report, uid)
+    generate_test_suites(str(report), {"output-directory": "Generated"})
+    return report
+
+
+def test_listener_writes_results_during_execution(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = create_report(tmp_path, report_builder)
+    protocol_writes = []
+    write_main_protocol = result_writer.write_main_protocol
+    monkeypatch.setattr(
+        result_writer,
+        "write_main_protocol",
+        lambda *args: protocol_writes.append(args) or write_main_protocol(*args),
+    )
+    run_with_listener(tmp_path, report)
+    assert len(protocol_writes) == 1
+    protocol = json.loads((tmp_path / "result" / "protocol.json").read_text())
+    assert len(protocol) == 2
+    assert json.loads((tmp_path / "result" / "A-TC.json").read_text())["exec"]["verdict"] == "Pass"
+    assert not (tmp_path / "result.checkpoint").exists()
+
+
+def test_killed_execution_leaves_finished_results(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = create_report(tmp_path, report_builder)
+    # Robot Framework does not close the listeners of a killed execution.
+    monkeypatch.setattr(testbench_listener.TestBenchListener, "close", lambda self: None)
+    run_with_listener(tmp_path, report)
+    checkpoint = tmp_path / "result.checkpoint"
+    assert not (checkpoint / "result" / "protocol.json").exists()
+    assert (checkpoint / "result" / "B-TC.json").is_file()
+    records = [json.loads(line) for line in (checkpoint / "journal.jsonl").read_text().splitlines()]
+    assert [record["testCaseSet"] for record in records if "testCaseSet" in record] == ["A", "B"]
+    assert not (tmp_path / "result").exists()
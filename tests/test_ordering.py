@@ -0,0 +1,68 @@
+import json
+from datetime import timedelta
+
+from robot import result
+
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework as generate_test_suites,
+)
+
+
+def add_restart_step(report, uid: str) -> None:
+    test_case_file = report / f"{uid}-TC.json"
+    test_case = json.loads(test_case_file.read_text())
+    step = test_case["testSequence"][0]
+    restart = {**step, "sequenceID": "2", "numbering": "2", "spec": {**step["spec"], "key": "2"}}
+    restart["spec"]["name"] = "StopWithRestart"
+    restart["spec"]["callParameters"] = []
+    test_case["testSequence"].extend(
+        [restart, {**step, "sequenceID": "3", "numbering": "3"}]
+    )
+    test_case_file.write_text(json.dumps(test_case), encoding="utf-8")
+
+
+def test_pabot_ordering_starts_with_longest_suites(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 1000, "B": 3000, "C": 2000})
+    generate_test_suites(str(report), {"output-directory": "Generated", "pabot-ordering": "suite"})
+    assert (tmp_path / "Generated_ordering.txt").read_text().splitlines() == [
+        "--suite Generated.Theme.B",
+        "--suite Generated.Theme.C",
+        "--suite Generated.Theme.A",
+    ]
+
+
+def test_pabot_ordering_groups_phases_and_uses_previous_results(
+    tmp_path, monkeypatch, report_builder
+):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 1000, "B": 3000})
+    add_restart_step(report, "A")
+    previous_result = result.TestSuite(name="Generated")
+    for uid, milliseconds in (("A", 9000), ("B", 500)):
+        suite = previous_result.suites.create(name=uid, metadata={"UniqueID": uid})
+        suite.tests.create(
+            name=f"{uid}-TC" if uid == "B" else "A-TC : Phase 1/2",
+            status="PASS",
+            elapsed_time=timedelta(milliseconds=milliseconds),
+        )
+    result.Result(suite=previous_result).save(str(tmp_path / "output.xml"))
+    generate_test_suites(
+        str(report),
+        {
+            "output-directory": "Generated",
+            "pabot-ordering": "TEST",
+            "durations-from": [str(tmp_path / "output.xml")],
+        },
+    )
+    assert (tmp_path / "Generated_ordering.txt").read_text().splitlines() == [
+        "{",
+        "--test Generated.Theme.A.A-TC : Phase 1/2",
+        "--test Generated.Theme.A.A-TC : Phase 2/2",
+        "}",
+        "--test Generated.Theme.B.B-TC",
+    ]
@@ -0,0 +1,81 @@
+import io
+import zipfile
+from pathlib import Path
+
+from testbench2robotframework import report_output as report_output_module
+from testbench2robotframework.report_output import ReportOutput, copy_zip_entry
+from testbench2robotframework.utils import get_stream_hash
+
+
+def create_report_zip(zip_path: Path):
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as report_zip:
+        report_zip.writestr("project.json", "{}")
+        report_zip.writestr("TC-1.json", '{"uniqueID": "TC-1"}')
+        report_zip.writestr("attachments/log.txt", "log " * 1000)
+
+
+def test_zip_entries_are_copied_without_recompression(tmp_path):
+    source_path = tmp_path / "source.zip"
+    create_report_zip(source_path)
+    target_path = tmp_path / "target.zip"
+    with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(target_path, "w") as target:
+        for info in source.infolist():
+            copy_zip_entry(source, target, info)
+    with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(target_path) as target:
+        assert target.testzip() is None
+        for info in source.infolist():
+            assert target.getinfo(info.filename).compress_size == info.compress_size
+            assert target.read(info.filename) == source.read(info.filename)
+
+
+def test_zip_entries_are_recompressed_without_raw_copy_support(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        report_output_module, "RAW_COPY_ARCHIVE_ATTRIBUTES", ("attribute_of_other_versions",)
+    )
+    source_path = tmp_path / "source.zip"
+    create_report_zip(source_path)
+    target_path = tmp_path / "target.zip"
+    with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(target_path, "w") as target:
+        for info in source.infolist():
+            copy_zip_entry(source, target, info)
+    with zipfile.ZipFile(source_path) as source, zipfile.ZipFile(target_path) as target:
+        assert target.testzip() is None
+        for info in source.infolist():
+            assert target.getinfo(info.filename).compress_type == info.compress_type
+            assert target.read(info.filename) == source.read(info.filename)
+
+
+def test_only_changed_files_are_replaced_in_zip_output(tmp_path):
+    source_path = tmp_path / "source.zip"
+    create_report_zip(source_path)
+    report_output = ReportOutput(source_path, tmp_path / "result", True, tmp_path / "work")
+    assert (report_output.json_dir / "TC-1.json").exists()
+    assert not (report_output.json_dir / "attachments").exists()
+    existing_attachments = report_output.existing_attachments
+    assert existing_attachments.sizes == {"log.txt": 4000}
+    assert existing_attachments.find(4000, get_stream_hash(io.BytesIO(b"log " * 1000))) == (
+        "log.txt"
+    )
+    assert existing_attachments.find(4000, "other content") is None
+    (report_output.staging_dir / "TC-1.json").write_text('{"uniqueID": "changed"}')
+    report_output.finalize()
+    with zipfile.ZipFile(tmp_path / "result.zip") as result:
+        assert sorted(result.namelist()) == ["TC-1.json", "attachments/log.txt", "project.json"]
+        assert result.read("TC-1.json") == b'{"uniqueID": "changed"}'
+
+
+def test_unchanged_files_are_copied_into_output_directory(tmp_path):
+    source_dir = tmp_path / "source"
+    (source_dir / "attachments").mkdir(parents=True)
+    (source_dir / "project.json").write_text("{}")
+    (source_dir / "TC-1.json").write_text("{}")
+    (source_dir / "attachments" / "log.txt").write_text("log")
+    report_output = ReportOutput(source_dir, tmp_path / "result", False, tmp_path / "work")
+    (report_output.staging_dir / "TC-1.json").write_text('{"uniqueID": "changed"}')
+    report_output.finalize()
+    result_dir = tmp_path / "result"
+    assert (result_dir / "attachments" / "log.txt").read_text() == "log"
+    assert (result_dir / "TC-1.json").read_text() == '{"uniqueID": "changed"}'
+    assert (source_dir / "TC-1.json").read_text() == "{}"
+    (result_dir / "attachments" / "log.txt").write_text("edited")
+    assert (source_dir / "attachments" / "log.txt").read_text() == "log"
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+from robot.result import Result, ResultVisitor
+from robot.result import TestSuite as ResultSuite
+
+from testbench2robotframework import robot_result_reader
+from testbench2robotframework.robot_result_reader import (
+    get_robot_result_files,
+    read_robot_result,
+    read_robot_results,
+    visit_json_result_by_suite,
+)
+
+
+def write_shard(output_xml: Path, tests: list[tuple[str, str]]):
+    root = ResultSuite(name="Generated")
+    tcs = root.suites.create(name="Set 1", metadata={"uniqueID": "TCS-1"})
+    for name, status in tests:
+        tcs.tests.create(
+            name=name,
+            status=status,
+            start_time="2024-01-01 10:00:00.000",
+            elapsed_time=1,
+        )
+    output_xml.parent.mkdir(parents=True, exist_ok=True)
+    Result(suite=root).save(output_xml)
+
+
+def test_sharded_results_are_combined_into_one_suite(tmp_path):
+    write_shard(
+        tmp_path / "shard1" / "output.xml",
+        [("TC-1 : Phase 2/2", "PASS"), ("TC-2", "FAIL")],
+    )
+    write_shard(
+        tmp_path / "shard2" / "output.xml",
+        [("TC-1 : Phase 1/2", "PASS"), ("TC-2", "PASS")],
+    )
+    result_files = get_robot_result_files([tmp_path / "shard*" / "output.xml"])
+    assert result_files == [tmp_path / "shard1" / "output.xml", tmp_path / "shard2" / "output.xml"]
+    result, test_sources = read_robot_results(result_files)
+    assert [suite.name for suite in result.suite.suites] == ["Set 1"]
+    tcs = result.suite.suites[0]
+    assert [(test.name, test.status) for test in tcs.tests] == [
+        ("TC-1 : Phase 2/2", "PASS"),
+        ("TC-2", "PASS"),
+        ("TC-1 : Phase 1/2", "PASS"),
+    ]
+    assert test_sources["Generated.Set 1.TC-2"] == result_files[1]
+    assert test_sources["Generated.Set 1.TC-1 : Phase 2/2"] == result_files[0]
+
+
+def test_large_sharded_results_are_parsed_in_parallel(tmp_path, monkeypatch):
+    monkeypatch.setattr(robot_result_reader, "PARALLEL_PARSE_MIN_SIZE", 0)
+    write_shard(tmp_path / "shard1" / "output.xml", [("TC-1", "FAIL")])
+    write_shard(tmp_path / "shard2" / "output.xml", [("TC-1", "PASS"), ("TC-2", "PASS")])
+    result_files = get_robot_result_files([tmp_path / "shard*" / "output.xml"])
+    result, test_sources = read_robot_results(result_files)
+    tcs = result.suite.suites[0]
+    assert [(test.name, test.status) for test in tcs.tests] == [("TC-1", "PASS"), ("TC-2", "PASS")]
+    assert test_sources["Generated.Set 1.TC-1"] == result_files[1]
+
+
+def test_streamed_json_result_matches_complete_result(tmp_path):
+    root = ResultSuite(name="Generated")
+    root.teardown.config(name="Cleanup", status="FAIL", message="Cleanup failed")
+    tcs = root.suites.create(name="Set 1", metadata={"uniqueID": "TCS-1"})
+    test = tcs.tests.create(name="TC-1", status="PASS")
+    test.body.create_keyword(name="Log", status="PASS")
+    output_json = tmp_path / "output.json"
+    Result(suite=root).save(output_json)
+    output_json.write_text(output_json.read_text().replace('"Rebot ', '"Robot '))
+
+    class TestCollector(ResultVisitor):
+        def __init__(self):
+            self.tests = []
+
+        def end_test(self, test):
+            self.tests.append((test.name, test.status, test.message, len(test.body)))
+
+    complete_result = TestCollector()
+    read_robot_result(output_json).visit(complete_result)
+    streamed_result = TestCollector()
+    visit_json_result_by_suite(output_json, streamed_result)
+    assert streamed_result.tests == complete_result.tests
+    assert streamed_result.tests[0][:2] == ("TC-1", "FAIL")
@@ -0,0 +1,91 @@
+import json
+import threading
+from urllib.error import HTTPError
+from typing import Optional
+from urllib.request import Request, urlopen
+
+from testbench2robotframework.jobs import LruCache, get_report_hash
+from testbench2robotframework.server import JobServer, ServerSettings
+
+
+def test_lru_cache_evicts_least_recently_used_value():
+    cache = LruCache(2)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("b", lambda: 2) == 2
+    assert cache.get("a", lambda: 3) == 1
+    assert cache.get("c", lambda: 4) == 4
+    assert cache.get("b", lambda: 5) == 5
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_report_hash_changes_with_content(tmp_path):
+    (tmp_path / "cycle_structure.json").write_text("{}")
+    report_hash = get_report_hash(tmp_path)
+    (tmp_path / "notes.txt").write_text("not part of the report")
+    assert get_report_hash(tmp_path) == report_hash
+    (tmp_path / "cycle_structure.json").write_text('{"nodes": []}')
+    assert get_report_hash(tmp_path) != report_hash
+
+
+def post(url: str, job: dict, headers: Optional[dict] = None) -> tuple[int, dict]:
+    request = Request(
+        url,
+        json.dumps(job).encode("utf-8"),
+        {"Content-Type": "application/json", **(headers or {})},
+    )
+    try:
+        with urlopen(request) as response:
+            return response.status, json.load(response)
+    except HTTPError as error:
+        return error.code, json.load(error)
+
+
+def test_server_answers_jobs_with_json(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with JobServer(("127.0.0.1", 0), ServerSettings(workers=1)) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}"
+            with urlopen(f"{url}/status") as response:
+                assert json.load(response) == {"workers": 1, "cacheSize": 8}
+            assert post(f"{url}/fetch", {"report": "report"}) == (
+                400,
+                {"error": "Missing job keys: results."},
+            )
+            status, result = post(f"{url}/generate", {"report": str(tmp_path / "missing")})
+            assert status == 500
+            assert "does not exist" in result["error"]
+        finally:
+            server.shutdown()
+            thread.join()
+
+
+def test_server_rejects_unsafe_requests(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output_root = tmp_path / "output"
+    with JobServer(
+        ("127.0.0.1", 0), ServerSettings(workers=1, token="secret", output_root=output_root)
+    ) as server:
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            url = f"http://127.0.0.1:{server.server_port}/generate"
+            token = {"Authorization": "Bearer secret"}
+            job = {"report": "report", "options": {"output-directory": str(output_root / "G")}}
+            assert post(url, job)[0] == 401
+            assert post(url, job, {**token, "Host": "attacker.example"})[0] == 403
+            assert post(url, job, {**token, "Content-Type": "text/plain"})[0] == 415
+            clean_job = {"report": "report", "options": {"clean": True}}
+            assert post(url, clean_job, token) == (403, {"error": "Jobs cannot set clean."})
+            status, result = post(
+                url, {"report": "report", "options": {"output-directory": str(tmp_path)}}, token
+            )
+            assert status == 403
+            assert "outside of the output root" in result["error"]
+            status, result = post(url, job, token)
+            assert status == 500
+            assert "does not exist" in result["error"]
+        finally:
+            server.shutdown()
+            thread.join()
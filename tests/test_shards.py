@@ -0,0 +1,48 @@
+from testbench2robotframework.ordering import get_suite_long_name
+from testbench2robotframework.shards import partition_by_duration
+from testbench2robotframework.testbench2robotframework import (
+    testbench2robotframework as generate_test_suites,
+)
+
+
+def test_longest_processing_time_partition_balances_durations():
+    durations = {"a": 7, "b": 5, "c": 4, "d": 3, "e": 3, "f": 2}
+    groups = partition_by_duration(durations, 3)
+    assert groups == [["a", "f"], ["b", "e"], ["c", "d"]]
+    assert partition_by_duration({"a": 1}, 2) == [["a"], []]
+
+
+def test_suite_long_names_match_robot_framework(tmp_path):
+    source = "1__Theme/2__Set_1.2"
+    assert get_suite_long_name(source, tmp_path / "Generated") == "Generated.Theme.Set 1.2"
+    assert get_suite_long_name(source, tmp_path / "out.zip") == "Out.Theme.Set 1.2"
+
+
+def test_generate_writes_shards_of_similar_duration(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_report(report, {"A": 9000, "B": 5000, "C": 4000})
+    generate_test_suites(str(report), {"output-directory": "Generated", "shards": 2})
+    assert sorted(
+        path.relative_to(tmp_path / "Generated").as_posix()
+        for path in (tmp_path / "Generated").rglob("*.robot")
+    ) == [
+        "Shard_1/1__Theme/1__A.robot",
+        "Shard_1/1__Theme/__init__.robot",
+        "Shard_2/1__Theme/2__B.robot",
+        "Shard_2/1__Theme/3__C.robot",
+        "Shard_2/1__Theme/__init__.robot",
+    ]
+
+    generate_test_suites(
+        str(report), {"output-directory": "Generated", "shards": 2, "shard-format": "pabot"}
+    )
+    assert (tmp_path / "Generated" / "1__Theme" / "2__B.robot").is_file()
+    assert (tmp_path / "Generated_ordering.txt").read_text().splitlines() == [
+        "--suite Generated.Theme.A",
+        "{",
+        "--suite Generated.Theme.B",
+        "--suite Generated.Theme.C",
+        "}",
+    ]
@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta
+
+from testbench2robotframework.timestamps import (
+    UtcTimestampFormatter,
+    format_local_time,
+    format_local_timestamp,
+)
+
+
+def test_robot_timestamps_are_formatted_for_testbench():
+    timestamp = datetime(2024, 1, 1, 0, 30, 5, 123987)
+    assert format_local_timestamp(timestamp) == "2024-01-01 00:30:05.123"
+    assert format_local_timestamp("20240101 00:30:05.123") == "2024-01-01 00:30:05.123"
+    assert format_local_time(timestamp) == "00:30:05.123"
+    assert format_local_time(datetime(2024, 1, 1, 0, 30, 5)) == "00:30:05.000"
+    assert format_local_timestamp(None) == "N/A"
+    utc_formatter = UtcTimestampFormatter(timedelta(hours=2))
+    assert utc_formatter.format(timestamp) == "2023-12-31T22:30:05.123Z"
+    assert utc_formatter.format("20240101 00:30:05.123") == "2023-12-31T22:30:05.123Z"
@@ -0,0 +1,33 @@
+from testbench2robotframework.config import Configuration
+from testbench2robotframework.watch import ReportWatcher
+
+
+def test_watcher_rewrites_only_affected_test_suites(tmp_path, monkeypatch, report_builder):
+    monkeypatch.chdir(tmp_path)
+    report = tmp_path / "report"
+    report.mkdir()
+    report_builder.write_tree(report, "Set B")
+    for uid, key in (("Set A", "2"), ("Set B", "3")):
+        report_builder.write_test_case_set(report, uid, key, "first")
+    configuration = Configuration.from_dict(
+        {"output-directory": str(tmp_path / "Generated"), "clean": False}
+    )
+    watcher = ReportWatcher(report, configuration)
+    watcher.generate()
+    suite_a = tmp_path / "Generated" / "1__Theme" / "1__Set_A.robot"
+    suite_b = tmp_path / "Generated" / "1__Theme" / "2__Set_B.robot"
+    assert "first" in suite_b.read_text()
+    assert watcher.update() is None
+
+    report_builder.write_test_case(report, "Set B-TC", "second")
+    suite_a.write_text("not regenerated")
+    assert watcher.update() == 1
+    assert "second" in suite_b.read_text()
+    assert suite_a.read_text() == "not regenerated"
+
+    report_builder.write_tree(report, "Set C")
+    report_builder.write_test_case_set(report, "Set C", "3", "third")
+    assert watcher.update() == 1
+    assert not suite_b.exists()
+    assert "third" in (tmp_path / "Generated" / "1__Theme" / "2__Set_C.robot").read_text()
+    assert suite_a.read_text() == "not regenerated"